@@ -0,0 +1,73 @@
+"""
+Benchmark of JSON serialization of list responses with Flask's default provider and FastJSONProvider.
+
+Reservation-like DTOs with datetimes are generated in memory (no database) and serialized
+into a complete response body, the way list endpoints return the whole table.
+
+Run from lab_4:
+    python benchmarks/json_serialization.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from my_project.json_provider import FastJSONProvider, orjson  # noqa: E402
+
+
+def make_rows(count: int) -> list:
+    start = datetime(2024, 1, 1, 8, 0)
+    return [{
+        "id": number,
+        "user": {"id": number % 500, "name": f"name{number % 500}", "surname": "surname",
+                 "email": f"user{number % 500}@example.com", "user_type": {"id": 1, "type": "regular"}},
+        "car": {"id": number % 700, "car_brand": "brand", "car_model": "model", "car_number": f"AA{number:06d}"},
+        "parking_place_id": number % 5000,
+        "reservation_start": start + timedelta(minutes=number),
+        "reservation_stop": start + timedelta(minutes=number + 90),
+    } for number in range(count)]
+
+
+def measure(app: Flask, provider: DefaultJSONProvider, rows: list, repeat: int) -> tuple:
+    best, body = None, b""
+    with app.app_context():
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = provider.response(rows).get_data()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    rows = make_rows(args.rows)
+    providers = [("flask default", DefaultJSONProvider(app)), ("stdlib + iso", FastJSONProvider(app, fast=False))]
+    if orjson is not None:
+        providers.append(("orjson", FastJSONProvider(app, fast=True)))
+    else:
+        print("orjson is not installed, C-accelerated provider is skipped")
+
+    baseline = None
+    for name, provider in providers:
+        elapsed, body = measure(app, provider, rows, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:>14}: {elapsed:.3f} s, {args.rows / elapsed:,.0f} rows/s, "
+              f"{len(body) / 2 ** 20:.1f} MiB, speedup {baseline / elapsed:.1f}x")
+    print(f"sample datetime: {FastJSONProvider(app).dumps(rows[0]['reservation_start'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark of vectorized occupancy analytics against a per-row Python implementation.
+
+Random occupation intervals are generated in memory (no database), both implementations
+compute the same statistics and their results are compared.
+
+Run from lab_4:
+    python benchmarks/occupancy_sweep.py --intervals 10000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from my_project.occupancy import occupancy_stats  # noqa: E402
+
+DAY = 24 * 3600
+
+
+def naive_occupancy_stats(starts, stops, place_count, range_start, range_stop, bucket):
+    """
+    The same statistics as occupancy_stats computed with loops over rows.
+    """
+    bucket_count = -(-(range_stop - range_start) // bucket)
+    occupied = [0] * bucket_count
+    events = []
+    durations = []
+    arrivals = 0
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        if range_start <= start < range_stop:
+            arrivals += 1
+        clipped_start, clipped_stop = max(start, range_start), min(stop, range_stop)
+        if clipped_stop <= clipped_start:
+            continue
+        durations.append(stop - start)
+        events.append((clipped_start, 1))
+        events.append((clipped_stop, -1))
+        for index in range((clipped_start - range_start) // bucket, (clipped_stop - 1 - range_start) // bucket + 1):
+            bucket_start = range_start + index * bucket
+            bucket_stop = min(bucket_start + bucket, range_stop)
+            occupied[index] += min(clipped_stop, bucket_stop) - max(clipped_start, bucket_start)
+    events.sort()
+    level = peak = 0
+    peak_at = None
+    for time_, delta in events:
+        level += delta
+        if level > peak:
+            peak, peak_at = level, time_
+    averages = [seconds / (min(range_start + (index + 1) * bucket, range_stop) - (range_start + index * bucket))
+                for index, seconds in enumerate(occupied)]
+    return {
+        "average_occupancy": averages,
+        "peak_occupancy": peak,
+        "peak_at": peak_at,
+        "sessions": len(durations),
+        "arrivals": arrivals,
+        "mean_dwell_seconds": sum(durations) / len(durations) if durations else None,
+        "turnover": arrivals / place_count if place_count else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--intervals", type=int, default=10_000_000)
+    parser.add_argument("--places", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--bucket", type=int, default=3600)
+    parser.add_argument("--skip-naive", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    range_start = 1_700_000_000
+    range_stop = range_start + args.days * DAY
+    starts = rng.integers(range_start - DAY, range_stop, args.intervals, dtype=np.int64)
+    stops = starts + rng.integers(60, 8 * 3600, args.intervals, dtype=np.int64)
+    print(f"intervals: {args.intervals}, places: {args.places}, buckets: {-(-(range_stop - range_start) // args.bucket)}")
+
+    started = time.perf_counter()
+    fast = occupancy_stats(starts, stops, args.places, range_start, range_stop, args.bucket)
+    vectorized = time.perf_counter() - started
+    print(f"vectorized: {vectorized:.2f} s")
+    if args.skip_naive:
+        return
+
+    started = time.perf_counter()
+    slow = naive_occupancy_stats(starts, stops, args.places, range_start, range_stop, args.bucket)
+    naive = time.perf_counter() - started
+    print(f"naive: {naive:.2f} s, speedup: {naive / vectorized:.1f}x")
+
+    same = np.allclose(fast["average_occupancy"], slow["average_occupancy"]) and all(
+        fast[key] == slow[key] for key in ("peak_occupancy", "sessions", "arrivals", "turnover"))
+    same = same and np.isclose(fast["mean_dwell_seconds"], slow["mean_dwell_seconds"])
+    print(f"results match: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark of POST /reservations under concurrent contention for a single parking place.
+
+Every worker thread reserves consecutive one-hour slots of the same parking place;
+a share of requests deliberately repeats an already taken slot and must get 409.
+Reservations are made far in the future and removed at the end (unless --keep).
+
+Run from lab_4 against the configured database (MySQL shows the effect of row locks):
+    python benchmarks/reservation_contention.py --parking-place-id 1 --user-id 1 --car-id 1
+"""
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+from sqlalchemy import and_
+from sqlalchemy.orm import aliased
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from my_project import create_app, db  # noqa: E402
+from my_project.auth.domain.orders.reservations import Reservations  # noqa: E402
+
+BASE_TIME = datetime(2100, 1, 1)
+SLOT = timedelta(hours=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parking-place-id", type=int, required=True)
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--car-id", type=int, required=True)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--conflict-share", type=float, default=0.2,
+                        help="share of requests repeating a taken slot")
+    parser.add_argument("--keep", action="store_true", help="do not delete created reservations")
+    args = parser.parse_args()
+
+    app = create_app()
+    slots = itertools.count()
+    lock = threading.Lock()
+    latencies, statuses = [], {}
+    deadline = time.monotonic() + args.seconds
+
+    def worker() -> None:
+        client = app.test_client()
+        taken = []
+        while time.monotonic() < deadline:
+            if taken and random.random() < args.conflict_share:
+                slot = random.choice(taken)
+            else:
+                slot = next(slots)
+            start = BASE_TIME + slot * SLOT
+            started = time.perf_counter()
+            response = client.post("/reservations", json={
+                "user_id": args.user_id,
+                "car_id": args.car_id,
+                "parking_place_id": args.parking_place_id,
+                "reservation_start": start.isoformat(),
+                "reservation_stop": (start + SLOT).isoformat(),
+            })
+            elapsed = time.perf_counter() - started
+            if response.status_code == HTTPStatus.CREATED:
+                taken.append(slot)
+            with lock:
+                latencies.append(elapsed)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        other = aliased(Reservations)
+        overlapping = db.session.query(Reservations.id).join(other, and_(
+            other.parking_place_id == Reservations.parking_place_id,
+            other.id != Reservations.id,
+            other.reservation_start < Reservations.reservation_stop,
+            other.reservation_stop > Reservations.reservation_start,
+        )).filter(Reservations.parking_place_id == args.parking_place_id,
+                  Reservations.reservation_start >= BASE_TIME).count()
+        if not args.keep:
+            db.session.query(Reservations).filter(
+                Reservations.parking_place_id == args.parking_place_id,
+                Reservations.reservation_start >= BASE_TIME,
+            ).delete(synchronize_session=False)
+            db.session.commit()
+
+    created = statuses.get(HTTPStatus.CREATED, 0)
+    latencies.sort()
+    print(f"threads: {args.threads}, duration: {elapsed:.1f} s, requests: {len(latencies)}")
+    print(f"statuses: {dict(sorted(statuses.items()))}")
+    print(f"created reservations/s: {created / elapsed:.1f}, requests/s: {len(latencies) / elapsed:.1f}")
+    if latencies:
+        print(f"latency ms: median {1000 * statistics.median(latencies):.1f}, "
+              f"p99 {1000 * latencies[int(0.99 * (len(latencies) - 1))]:.1f}")
+    print(f"overlapping reservations: {overlapping}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,4 +11,30 @@ class Config:
     DB_HOST = db_host
     DB_PORT = 3306
     DB_NAME = "database-1"
-    SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
\ No newline at end of file
+    SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+    DB_POOL_SIZE = 10
+    DB_MAX_OVERFLOW = 20
+    DB_POOL_TIMEOUT = 10  # seconds to wait for free connection
+    DB_POOL_RECYCLE = 3600  # must be lower than MySQL wait_timeout
+    DB_POOL_PRE_PING = True
+    DB_CONNECT_TIMEOUT = 10
+    DB_READ_TIMEOUT = 30
+    DB_WRITE_TIMEOUT = 30
+
+    SQLALCHEMY_REPLICA_URIS = []  # read-only DAO calls are balanced over these databases
+    DB_REPLICA_EJECT_SECONDS = 30
+
+    DB_ENSURE_SCHEMA = False  # True adds missing columns and indexes at startup; otherwise run `flask ensure-schema`
+
+    JSON_FAST_ENCODER = True  # orjson when installed, otherwise stdlib json
+
+    BATCH_MAX_REQUESTS = 100  # sub-requests per POST /batch
+
+    AVAILABILITY_INDEX_ENABLED = True  # False answers availability with SQL query
+    AVAILABILITY_INDEX_TTL = 60
+
+    ENTITY_CACHE_BACKEND = None  # None (disabled), "memory" or "redis"
+    ENTITY_CACHE_TTL = 60
+    ENTITY_CACHE_SIZE = 10000
+    ENTITY_CACHE_REDIS_URL = "redis://localhost:6379/0"
@@ -5,24 +5,36 @@ apavelchak@gmail.com
 """
 
 
+import os
+from typing import Any, Dict, Mapping
+
 import pymysql
+import yaml
 
 from flasgger import Swagger
 from config import Config
 from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.engine import make_url
 from sqlalchemy_utils import database_exists, create_database
 
 from my_project.auth.route import register_routes
+from my_project.json_provider import FastJSONProvider
+from my_project.migrations import ensure_columns, ensure_indexes, register_commands
+from my_project.routing_session import RoutingSession, replica_router
 
 SECRET_KEY = "SECRET_KEY"
 SQLALCHEMY_DATABASE_URI = "SQLALCHEMY_DATABASE_URI"
 MYSQL_ROOT_USER = "MYSQL_ROOT_USER"
 MYSQL_ROOT_PASSWORD = "MYSQL_ROOT_PASSWORD"
+SQLALCHEMY_ENGINE_OPTIONS = "SQLALCHEMY_ENGINE_OPTIONS"
+SQLALCHEMY_BINDS = "SQLALCHEMY_BINDS"
+SQLALCHEMY_REPLICA_URIS = "SQLALCHEMY_REPLICA_URIS"
+APP_PROFILE = "APP_PROFILE"
 
 # Database
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 pymysql.install_as_MySQLdb()
 todos = {}
 
@@ -31,20 +43,81 @@ def create_app() -> Flask:
 
     app = Flask(__name__)
     app.config.from_object(Config)
+    _init_profile(app)
+    app.json = FastJSONProvider(app)
     jwt = JWTManager(app)
     swagger = Swagger(app)
     _init_db(app)
+    _init_cache(app)
     register_routes(app)
+    register_commands(app)
 
     return app
 
 
+def _init_profile(app: Flask) -> None:
+    profile = os.environ.get(APP_PROFILE)
+    if profile:
+        with open(os.path.join(os.path.dirname(app.root_path), "config", "app.yml"), encoding="utf-8") as file:
+            app.config.update(yaml.safe_load(file)[profile])
+
+
 def _init_db(app: Flask) -> None:
+    app.config.setdefault(SQLALCHEMY_ENGINE_OPTIONS, _engine_options(app.config, app.config[SQLALCHEMY_DATABASE_URI]))
+    replica_binds = {
+        f"replica_{number}": {"url": uri, **_engine_options(app.config, uri)}
+        for number, uri in enumerate(app.config.get(SQLALCHEMY_REPLICA_URIS, []))
+    }
+    app.config[SQLALCHEMY_BINDS] = {**app.config.get(SQLALCHEMY_BINDS, {}), **replica_binds}
     db.init_app(app)
 
     if not database_exists(app.config[SQLALCHEMY_DATABASE_URI]):
         create_database(app.config[SQLALCHEMY_DATABASE_URI])
 
     import my_project.auth.domain
+    from my_project.auth.dao.pool_metrics import pool_metrics
+    with app.app_context():
+        pool_metrics.install(db.engine, "primary")
+        replica_router.configure(list(replica_binds), app.config["DB_REPLICA_EJECT_SECONDS"])
+        for key in replica_binds:
+            pool_metrics.install(db.engines[key], key)
+            replica_router.watch(key, db.engines[key])
+        db.create_all(bind_key=None)
+        if app.config["DB_ENSURE_SCHEMA"]:
+            ensure_columns(db.engine, db.metadata)
+            ensure_indexes(db.engine, db.metadata)
+
+
+def _engine_options(config: Mapping[str, Any], uri: str) -> Dict[str, Any]:
+    from my_project.auth.dao.pool_metrics import MeteredQueuePool
+
+    if make_url(uri).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": MeteredQueuePool,
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+        "connect_args": {
+            "connect_timeout": config["DB_CONNECT_TIMEOUT"],
+            "read_timeout": config["DB_READ_TIMEOUT"],
+            "write_timeout": config["DB_WRITE_TIMEOUT"],
+        },
+    }
+
+
+def _init_cache(app: Flask) -> None:
+    from my_project.auth.dao import user_type_dao, status_type_dao, type_of_voucher_dao
+    from my_project.auth.dao.availability_index import availability_index
+    from my_project.auth.dao.entity_cache import create_entity_cache
+    from my_project.auth.dao.general_dao import GeneralDAO
+
+    GeneralDAO.set_entity_cache(create_entity_cache(app.config))
+    availability_index.enabled = app.config["AVAILABILITY_INDEX_ENABLED"]
+    availability_index.ttl = app.config["AVAILABILITY_INDEX_TTL"]
+    availability_index.invalidate()
     with app.app_context():
-        db.create_all()
+        for dao in (user_type_dao, status_type_dao, type_of_voucher_dao):
+            dao.preload()
@@ -5,10 +5,16 @@ apavelchak@gmail.com
 """
 
 from abc import ABC
-from typing import List, Dict
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple
 
 from http import HTTPStatus
-from flask import abort
+from flask import abort, has_request_context, request
+from sqlalchemy.exc import DBAPIError, IntegrityError, StatementError
+
+from my_project.auth.dao.general_dao import VersionConflict
+from my_project.etag import dto_etag
+from my_project.list_query import ListQuery
 
 
 class GeneralController(ABC):
@@ -25,6 +31,56 @@ class GeneralController(ABC):
         # return list(map(lambda x: x.put_into_dto(), self._service.find_all()))
         return [x.put_into_dto() for x in self._service.find_all()]
 
+    def find_list(self, fields: Optional[List[str]] = None,
+                  list_query: Optional[ListQuery] = None) -> List[Dict[str, object]]:
+        """
+        Gets objects matching list query using Service layer as DTOs restricted to requested fields.
+        :param fields: DTO fields or None for full DTOs
+        :param list_query: filters, sort order and includes or None
+        :return: list of DTOs
+        """
+        try:
+            return [self._service.to_dto(x, fields, list_query) for x in self._service.find_all(fields, list_query)]
+        except ValueError:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def stream_all(self, fields: Optional[List[str]] = None,
+                   list_query: Optional[ListQuery] = None) -> Iterator[Dict[str, object]]:
+        """
+        Iterates over all objects of table using Service layer as DTO objects.
+        :param fields: DTO fields or None for full DTOs
+        :param list_query: filters, sort order and includes or None
+        :return: iterator of DTOs
+        """
+        try:
+            objects = self._service.stream_all(fields, list_query)
+        except ValueError:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        return (self._service.to_dto(x, fields, list_query) for x in objects)
+
+    def list_etag(self) -> str:
+        """
+        Computes ETag of list of all objects using Service layer.
+        :return: ETag value (unquoted)
+        """
+        return self._service.list_etag()
+
+    def find_page(self, limit: Optional[int] = None, after: Optional[str] = None,
+                  fields: Optional[List[str]] = None, list_query: Optional[ListQuery] = None) -> Dict[str, object]:
+        """
+        Gets one page of objects using Service layer as DTO objects.
+        :param limit: maximum count of objects on the page
+        :param after: cursor of the previous page
+        :param fields: DTO fields or None for full DTOs
+        :param list_query: filters, sort order and includes or None
+        :return: dictionary with DTOs of the page and cursor of the next page
+        """
+        try:
+            objects, next_cursor = self._service.find_page(limit, after, fields, list_query)
+        except ValueError:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        return {"items": [self._service.to_dto(x, fields, list_query) for x in objects], "next": next_cursor}
+
     def find_by_id(self, key: int) -> object:
         """
         Gets object from database table by integer key using from Service layer.
@@ -36,6 +92,29 @@ class GeneralController(ABC):
             abort(HTTPStatus.NOT_FOUND)
         return obj.put_into_dto()
 
+    def find_by_ids(self, keys: List[object], fields: Optional[List[str]] = None,
+                    list_query: Optional[ListQuery] = None) -> Dict[str, object]:
+        """
+        Gets objects by list of keys using Service layer as DTO objects.
+        :param keys: values of primary key
+        :param fields: DTO fields or None for full DTOs
+        :param list_query: filters and includes or None
+        :return: dictionary with DTOs in order of keys and keys which were not found
+        """
+        try:
+            objects, missing = self._service.find_by_ids(keys, fields, list_query)
+        except ValueError:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        return {"items": [self._service.to_dto(x, fields, list_query) for x in objects], "missing": missing}
+
+    def find_dto_by_id(self, key: int) -> Optional[Dict[str, object]]:
+        """
+        Gets DTO of object by integer key using Service layer (cached when entity cache is configured).
+        :param key: integer key (surrogate primary key)
+        :return: DTO for search object or None
+        """
+        return self._service.find_dto_by_id(key)
+
     def create(self, obj: object) -> object:
         """
         Creates object in database table using Service layer.
@@ -50,43 +129,109 @@ class GeneralController(ABC):
         :param obj_list: object list to create in Database
         :return: list of created objects as DTOs
         """
-        return list(map(lambda x: x.put_into_dto(), self._service.create(obj_list)))
+        return list(map(lambda x: x.put_into_dto(), self._service.create_all(obj_list)))
+
+    def export(self, start: Optional[datetime] = None, stop: Optional[datetime] = None,
+               parking_id: Optional[int] = None) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """
+        Iterates over rows filtered by time range and parking using Service layer.
+        :param start: minimal value of time column
+        :param stop: upper bound (exclusive) of time column
+        :param parking_id: id of parking
+        :return: column names and iterator of dictionaries of column values
+        """
+        try:
+            return self._service.export(start, stop, parking_id)
+        except ValueError:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def create_bulk(self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                    return_ids: bool = False) -> Dict[str, object]:
+        """
+        Creates objects from DTO rows in chunks using Service layer.
+        :param rows: iterable of DTO dictionaries
+        :param chunk_size: count of rows per INSERT statement
+        :param return_ids: whether primary keys of created rows are needed
+        :return: dictionary with count of created rows (and their primary keys)
+        """
+        try:
+            count, ids = self._service.create_bulk(rows, chunk_size, return_ids)
+        except (ValueError, IntegrityError):
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        except StatementError as error:
+            if isinstance(error, DBAPIError):
+                raise
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        result = {"created": count}
+        if return_ids:
+            result["ids"] = ids
+        return result
 
     def update(self, key: int, new_obj: object) -> None:
         """
         Updates object in database table using Service layer.
+        Honors If-Match of the request (412 when the object was changed since client read it).
         :param key: integer key (surrogate primary key)
         :param new_obj: object to create in Database
         """
-        obj = self._service.find_by_id(key)
-        if obj is None:
+        version = self._matched_version(key)
+        try:
+            found = self._service.update(key, new_obj, version)
+        except ValueError:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        except VersionConflict:
+            abort(HTTPStatus.PRECONDITION_FAILED)
+        if not found:
             abort(HTTPStatus.NOT_FOUND)
-        self._service.update(key, new_obj)
 
     def patch(self, key: int, value_dict: Dict[str, object]) -> None:
         """
-        Modifies defined field of object in database table using Service layer.
+        Modifies defined fields of object in database table using Service layer.
+        Honors If-Match of the request (412 when the object was changed since client read it).
         :param key: integer key (surrogate primary key)
         :param value_dict: key-values
         """
-        obj = self._service.find_by_id(key)
-        if obj is None:
+        version = self._matched_version(key)
+        try:
+            found = self._service.patch(key, value_dict, version)
+        except ValueError:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        except VersionConflict:
+            abort(HTTPStatus.PRECONDITION_FAILED)
+        if not found:
             abort(HTTPStatus.NOT_FOUND)
-        for field_name, value in value_dict.items():
-            self._service.patch(key, field_name, value)
 
     def delete(self, key: int) -> None:
         """
         Deletes object from database table by integer key from Service layer.
+        Honors If-Match of the request (412 when the object was changed since client read it).
         :param key: integer key (surrogate primary key)
         """
-        obj = self._service.find_by_id(key)
-        if obj is None:
+        version = self._matched_version(key)
+        try:
+            found = self._service.delete(key, version)
+        except VersionConflict:
+            abort(HTTPStatus.PRECONDITION_FAILED)
+        if not found:
             abort(HTTPStatus.NOT_FOUND)
-        self._service.delete(key)
 
     def delete_all(self) -> None:
         """
         Deletes all objects from database table using Service layer.
         """
-        self._service.delete_all()
\ No newline at end of file
+        self._service.delete_all()
+
+    def _matched_version(self, key: object) -> Optional[int]:
+        """
+        Evaluates If-Match of the current request against ETag of the object.
+        The returned version is then required by the write (UPDATE/DELETE ... WHERE version = ?),
+        so a concurrent change between the check and the write is detected as well.
+        :param key: primary key value (tuple for composite key)
+        :return: version of the object or None when the request is not conditional
+        """
+        if not has_request_context() or not request.if_match:
+            return None
+        dto, version = self._service.find_dto_and_version(key)
+        if dto is None or not request.if_match.contains(dto_etag(dto)):
+            abort(HTTPStatus.PRECONDITION_FAILED)
+        return version
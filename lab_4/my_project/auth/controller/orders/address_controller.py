@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.address_service import AddressService
 from my_project.auth.domain.orders.address import Address
 
 
-class AddressController:
+class AddressController(GeneralController):
     def __init__(self):
         self._service = AddressService()
 
@@ -16,7 +17,7 @@ class AddressController:
         return self._service.find_by_id(address_id)
 
     def update_address(self, address_id: int, address: Address):
-        return self._service.update_address(address_id, address)
+        return self.update(address_id, address)
 
     def delete_address(self, address_id: int):
-        return self._service.delete_address(address_id)
+        return self.delete(address_id)
@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.cars_service import CarsService
 from my_project.auth.domain.orders.cars import Cars
 
 
-class CarController:
+class CarController(GeneralController):
     def __init__(self):
         self._service = CarsService()
 
@@ -16,7 +17,7 @@ class CarController:
         return self._service.find_by_id(car_id)
 
     def update_car(self, car_id: int, car: Cars):
-        return self._service.update_car(car_id, car)
+        return self.update(car_id, car)
 
     def delete_car(self, car_id: int):
-        return self._service.delete_car(car_id)
+        return self.delete(car_id)
@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.owner_service import OwnerService
 from my_project.auth.domain.orders.owner import Owner
 
 
-class OwnerController:
+class OwnerController(GeneralController):
     def __init__(self):
         self._service = OwnerService()
 
@@ -16,7 +17,7 @@ class OwnerController:
         return self._service.find_by_id(owner_id)
 
     def update_owner(self, owner_id: int, owner: Owner):
-        return self._service.update_owner(owner_id, owner)
+        return self.update(owner_id, owner)
 
     def delete_owner(self, owner_id: int):
-        return self._service.delete_owner(owner_id)
+        return self.delete(owner_id)
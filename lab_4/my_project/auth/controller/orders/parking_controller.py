@@ -1,8 +1,14 @@
+from datetime import datetime
+from http import HTTPStatus
+from typing import Optional, Tuple
+from flask import abort
+from my_project import occupancy
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.parking_service import ParkingService
 from my_project.auth.domain.orders.parking import Parking
 
 
-class ParkingController:
+class ParkingController(GeneralController):
     def __init__(self):
         self._service = ParkingService()
 
@@ -16,7 +22,93 @@ class ParkingController:
         return self._service.find_by_id(parking_id)
 
     def update_parking(self, parking_id: int, parking: Parking):
-        return self._service.update_parking(parking_id, parking)
+        return self.update(parking_id, parking)
 
     def delete_parking(self, parking_id: int):
-        return self._service.delete_parking(parking_id)
+        return self.delete(parking_id)
+
+    def find_availability(self, parking_id: int, start: Optional[str], stop: Optional[str]):
+        start, stop = self._parse_period(start, stop)
+        places = self._service.find_free_places(parking_id, start, stop)
+        if places is None:
+            abort(HTTPStatus.NOT_FOUND)
+        return {
+            "parking_id": parking_id,
+            "from": start.isoformat(),
+            "to": stop.isoformat(),
+            "free_places": [{"id": place_id, "row": row, "row_place": row_place}
+                            for place_id, row, row_place in places],
+        }
+
+    def find_occupancy(self, parking_id: int, start: Optional[str], stop: Optional[str], bucket: int):
+        start, stop = self._parse_period(start, stop)
+        try:
+            stats = self._service.get_occupancy(parking_id, start, stop, bucket)
+        except ValueError as error:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY, str(error))
+        if stats is None:
+            abort(HTTPStatus.NOT_FOUND)
+        peak_at = stats["peak_at"]
+        return {
+            "parking_id": parking_id,
+            "from": start.isoformat(),
+            "to": stop.isoformat(),
+            "bucket_seconds": bucket,
+            "sessions": stats["sessions"],
+            "arrivals": stats["arrivals"],
+            "peak_occupancy": stats["peak_occupancy"],
+            "peak_at": None if peak_at is None else occupancy.to_datetime(peak_at).isoformat(),
+            "mean_dwell_seconds": stats["mean_dwell_seconds"],
+            "turnover": stats["turnover"],
+            "occupancy": [{"start": occupancy.to_datetime(bucket_start).isoformat(), "average": float(average)}
+                          for bucket_start, average in zip(stats["bucket_starts"], stats["average_occupancy"])],
+        }
+
+    def find_hourly_occupancy(self, parking_id: int, start: Optional[str], stop: Optional[str]):
+        start, stop = self._parse_period(start, stop)
+        rollups = self._service.get_hourly_occupancy(parking_id, start, stop)
+        if rollups is None:
+            abort(HTTPStatus.NOT_FOUND)
+        return {
+            "parking_id": parking_id,
+            "from": start.isoformat(),
+            "to": stop.isoformat(),
+            "hours": [rollup.put_into_dto() for rollup in rollups],
+        }
+
+    def find_snapshot(self, parking_id: int, at: Optional[str]):
+        if at is None:
+            at = datetime.now()
+        else:
+            try:
+                at = datetime.fromisoformat(at)
+            except ValueError:
+                abort(HTTPStatus.UNPROCESSABLE_ENTITY, "'at' must be ISO datetime")
+        snapshot = self._service.get_snapshot(parking_id, at)
+        if snapshot is None:
+            return None
+        parking, places, reservations = snapshot
+        reservations_of_place = {}
+        for reservation in reservations:
+            reservations_of_place.setdefault(reservation.parking_place_id, []).append(reservation.put_into_dto())
+        return {
+            "at": at.isoformat(),
+            "parking": parking.put_into_dto(),
+            "address": parking.address.put_into_dto() if parking.address else None,
+            "parking_network": parking.parking_network.put_into_dto() if parking.parking_network else None,
+            "places": [{
+                **place.put_into_dto(),
+                "status": place.status.put_into_dto() if place.status else None,
+                "reservations": reservations_of_place.get(place.id, []),
+            } for place in places],
+        }
+
+    @staticmethod
+    def _parse_period(start: Optional[str], stop: Optional[str]) -> Tuple[datetime, datetime]:
+        try:
+            start, stop = datetime.fromisoformat(start), datetime.fromisoformat(stop)
+        except (TypeError, ValueError):
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY, "'from' and 'to' must be ISO datetimes")
+        if start >= stop:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY, "'from' must be before 'to'")
+        return start, stop
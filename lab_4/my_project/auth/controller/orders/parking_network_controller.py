@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.parking_network_service import ParkingNetworkService
 from my_project.auth.domain.orders.parking_network import ParkingNetwork
 
 
-class ParkingNetworkController:
+class ParkingNetworkController(GeneralController):
     def __init__(self):
         self._service = ParkingNetworkService()
 
@@ -16,7 +17,7 @@ class ParkingNetworkController:
         return self._service.find_by_id(parking_network_id)
 
     def update_parking_network(self, parking_network_id: int, parking_network: ParkingNetwork):
-        return self._service.update_parking_network(parking_network_id, parking_network)
+        return self.update(parking_network_id, parking_network)
 
     def delete_parking_network(self, parking_network_id: int):
-        return self._service.delete_parking_network(parking_network_id)
+        return self.delete(parking_network_id)
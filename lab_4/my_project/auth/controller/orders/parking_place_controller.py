@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.parking_place_service import ParkingPlaceService
 from my_project.auth.domain.orders.parking_place import ParkingPlace
 
 
-class ParkingPlaceController:
+class ParkingPlaceController(GeneralController):
     def __init__(self):
         self._service = ParkingPlaceService()
 
@@ -16,7 +17,7 @@ class ParkingPlaceController:
         return self._service.find_by_id(parking_place_id)
 
     def update_parking_place(self, parking_place_id: int, parking_place: ParkingPlace):
-        return self._service.update_parking_place(parking_place_id, parking_place)
+        return self.update(parking_place_id, parking_place)
 
     def delete_parking_place(self, parking_place_id: int):
-        return self._service.delete_parking_place(parking_place_id)
+        return self.delete(parking_place_id)
@@ -1,8 +1,12 @@
+from http import HTTPStatus
+from typing import Iterable, Optional, Tuple
+from flask import abort
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.parking_place_history_service import ParkingPlaceHistoryService
 from my_project.auth.domain.orders.parking_place_history import ParkingPlaceHistory
 
 
-class ParkingPlaceHistoryController:
+class ParkingPlaceHistoryController(GeneralController):
     def __init__(self):
         self._service = ParkingPlaceHistoryService()
 
@@ -10,13 +14,19 @@ class ParkingPlaceHistoryController:
         return self._service.get_all_parking_place_histories()
 
     def create_parking_place_history(self, history: ParkingPlaceHistory):
-        return self._service.create_parking_place_history(history)
+        try:
+            return self._service.create_parking_place_history(history)
+        except ValueError as error:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY, str(error))
 
     def find_by_id(self, history_id: int):
         return self._service.find_by_id(history_id)
 
     def update_parking_place_history(self, history_id: int, history: ParkingPlaceHistory):
-        return self._service.update_parking_place_history(history_id, history)
+        return self.update(history_id, history)
 
     def delete_parking_place_history(self, history_id: int):
-        return self._service.delete_parking_place_history(history_id)
+        return self.delete(history_id)
+
+    def import_rows(self, rows: Iterable[Tuple[int, object]], chunk_size: Optional[int] = None):
+        return self._service.import_rows(rows, chunk_size)
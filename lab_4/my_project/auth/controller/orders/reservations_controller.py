@@ -1,8 +1,13 @@
+from http import HTTPStatus
+from typing import Dict
+from flask import abort
+from my_project.auth.controller.general_controller import GeneralController
+from my_project.auth.dao.orders.reservations_dao import ReservationConflict
 from my_project.auth.service.orders.reservations_service import ReservationsService
 from my_project.auth.domain.orders.reservations import Reservations
 
 
-class ReservationsController:
+class ReservationsController(GeneralController):
     def __init__(self):
         self._service = ReservationsService()
 
@@ -10,13 +15,30 @@ class ReservationsController:
         return self._service.get_all_reservations()
 
     def create_reservation(self, reservation: Reservations):
-        return self._service.create_reservation(reservation)
+        try:
+            return self._service.create_reservation(reservation)
+        except ReservationConflict as error:
+            abort(HTTPStatus.CONFLICT, str(error))
+        except ValueError as error:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY, str(error))
 
     def find_by_id(self, reservation_id: int):
         return self._service.find_by_id(reservation_id)
 
     def update_reservation(self, reservation_id: int, reservation: Reservations):
-        return self._service.update_reservation(reservation_id, reservation)
+        return self.update(reservation_id, reservation)
+
+    def update(self, key: int, new_obj: Reservations) -> None:
+        try:
+            super().update(key, new_obj)
+        except ReservationConflict as error:
+            abort(HTTPStatus.CONFLICT, str(error))
+
+    def patch(self, key: int, value_dict: Dict[str, object]) -> None:
+        try:
+            super().patch(key, value_dict)
+        except ReservationConflict as error:
+            abort(HTTPStatus.CONFLICT, str(error))
 
     def delete_reservation(self, reservation_id: int):
-        return self._service.delete_reservation(reservation_id)
+        return self.delete(reservation_id)
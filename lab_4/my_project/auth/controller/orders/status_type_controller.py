@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.status_type_service import StatusTypeService
 from my_project.auth.domain.orders.status_type import StatusType
 
 
-class StatusTypeController:
+class StatusTypeController(GeneralController):
     def __init__(self):
         self._service = StatusTypeService()
 
@@ -16,7 +17,7 @@ class StatusTypeController:
         return self._service.find_by_id(status_type_id)
 
     def update_status_type(self, status_type_id: int, status_type: StatusType):
-        return self._service.update_status_type(status_type_id, status_type)
+        return self.update(status_type_id, status_type)
 
     def delete_status_type(self, status_type_id: int):
-        return self._service.delete_status_type(status_type_id)
+        return self.delete(status_type_id)
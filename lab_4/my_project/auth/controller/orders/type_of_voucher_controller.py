@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.type_of_voucher_service import TypeOfVoucherService
 from my_project.auth.domain.orders.type_of_voucher import TypeOfVoucher
 
 
-class TypeOfVoucherController:
+class TypeOfVoucherController(GeneralController):
     def __init__(self):
         self._service = TypeOfVoucherService()
 
@@ -16,7 +17,7 @@ class TypeOfVoucherController:
         return self._service.find_by_id(type_of_voucher_id)
 
     def update_type_of_voucher(self, type_of_voucher_id: int, type_of_voucher: TypeOfVoucher):
-        return self._service.update_type_of_voucher(type_of_voucher_id, type_of_voucher)
+        return self.update(type_of_voucher_id, type_of_voucher)
 
     def delete_type_of_voucher(self, type_of_voucher_id: int):
-        return self._service.delete_type_of_voucher(type_of_voucher_id)
+        return self.delete(type_of_voucher_id)
@@ -1,8 +1,12 @@
+from http import HTTPStatus
+from flask import abort
+from my_project.auth.controller.general_controller import GeneralController
+from my_project.auth.dao.general_dao import VersionConflict
 from my_project.auth.service.orders.user_car_id_service import UserCarIdService
 from my_project.auth.domain.orders.user_car_id import UserCarId
 
 
-class UserCarIdController:
+class UserCarIdController(GeneralController):
     def __init__(self):
         self._service = UserCarIdService()
 
@@ -16,7 +20,19 @@ class UserCarIdController:
         return self._service.find_by_user_and_car_id(user_id, car_id)
 
     def update_user_car_id(self, user_id: int, car_id: int, user_car_id: UserCarId):
-        return self._service.update_user_car_id(user_id, car_id, user_car_id)
+        version = self._matched_version((user_id, car_id))
+        try:
+            found = self._service.update_user_car_id(user_id, car_id, user_car_id, version)
+        except VersionConflict:
+            abort(HTTPStatus.PRECONDITION_FAILED)
+        if not found:
+            abort(HTTPStatus.NOT_FOUND)
 
     def delete_user_car_id(self, user_id: int, car_id: int):
-        return self._service.delete_user_car_id(user_id, car_id)
+        version = self._matched_version((user_id, car_id))
+        try:
+            found = self._service.delete_user_car_id(user_id, car_id, version)
+        except VersionConflict:
+            abort(HTTPStatus.PRECONDITION_FAILED)
+        if not found:
+            abort(HTTPStatus.NOT_FOUND)
@@ -1,6 +1,7 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.user_service import UserService
 
-class UserController:
+class UserController(GeneralController):
     def __init__(self):
         self._service = UserService()
 
@@ -14,10 +15,10 @@ class UserController:
         return self._service.find_by_id(user_id)
 
     def update_user(self, user_id, user):
-        return self._service.update_user(user_id, user)
+        return self.update(user_id, user)
 
     def delete_user(self, user_id):
-        return self._service.delete_user(user_id)
+        return self.delete(user_id)
 
     def find_by_surname(self, surname: str):
         return self._service.find_by_surname(surname)
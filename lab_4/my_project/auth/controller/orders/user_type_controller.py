@@ -1,7 +1,8 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.user_type_service import UserTypeService
 
 
-class UserTypeController:
+class UserTypeController(GeneralController):
     def __init__(self):
         self._service = UserTypeService()
 
@@ -15,10 +16,10 @@ class UserTypeController:
         return self._service.find_by_id(user_type_id)
 
     def update_user_type(self, user_type_id, user_type):
-        return self._service.update_user_type(user_type_id, user_type)
+        return self.update(user_type_id, user_type)
 
     def delete_user_type(self, user_type_id):
-        return self._service.delete_user_type(user_type_id)
+        return self.delete(user_type_id)
 
     def get_user_types_by_name(self, type_name):
         return self._service.find_by_type(type_name)
@@ -1,8 +1,9 @@
+from my_project.auth.controller.general_controller import GeneralController
 from my_project.auth.service.orders.voucher_service import VoucherService
 from my_project.auth.domain.orders.voucher import Voucher
 
 
-class VoucherController:
+class VoucherController(GeneralController):
     def __init__(self):
         self._service = VoucherService()
 
@@ -16,7 +17,7 @@ class VoucherController:
         return self._service.find_by_id(voucher_id)
 
     def update_voucher(self, voucher_id: int, voucher: Voucher):
-        return self._service.update_voucher(voucher_id, voucher)
+        return self.update(voucher_id, voucher)
 
     def delete_voucher(self, voucher_id: int):
-        return self._service.delete_voucher(voucher_id)
+        return self.delete(voucher_id)
@@ -0,0 +1,210 @@
+"""
+In-memory index of reservations used to find free parking places of a parking.
+"""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from my_project.routing_session import after_commit
+
+Place = Tuple[int, int, int]  # id, row, row_place
+Period = Tuple[datetime, datetime]  # start, stop
+
+
+class PlaceIntervals:
+    """
+    Reservation periods of one parking place sorted by start, with running maximum of stops.
+    """
+    __slots__ = ("periods", "starts", "max_stops")
+
+    def __init__(self, periods: List[Period]) -> None:
+        self.periods = periods
+        self.starts = [start for start, _ in periods]
+        self.max_stops = list(accumulate((stop for _, stop in periods), max))
+
+    def overlaps(self, start: datetime, stop: datetime) -> bool:
+        """
+        Checks whether any period overlaps [start, stop): periods starting before stop
+        overlap when the latest of their stops is after start.
+        """
+        count = bisect_left(self.starts, stop)
+        return count > 0 and self.max_stops[count - 1] > start
+
+
+class ParkingAvailability:
+    """
+    Places of one parking with reservation periods of every place.
+    Instances are not modified after creation, so readers need no lock.
+    """
+
+    def __init__(self, places: Iterable[Place], reservations: Iterable[Tuple[int, datetime, datetime]]) -> None:
+        """
+        :param places: places of parking
+        :param reservations: tuples of parking place id, reservation start and stop
+        """
+        self.places: List[Place] = sorted(places)
+        periods: Dict[int, List[Period]] = {}
+        for place_id, start, stop in reservations:
+            periods.setdefault(place_id, []).append((start, stop))
+        self._intervals: Dict[int, PlaceIntervals] = {
+            place_id: PlaceIntervals(sorted(place_periods)) for place_id, place_periods in periods.items()
+        }
+
+    def free_places(self, start: datetime, stop: datetime) -> List[Place]:
+        """
+        Gets places which have no reservation overlapping [start, stop).
+        :param start: start of period
+        :param stop: end of period
+        :return: free places ordered by id
+        """
+        intervals = self._intervals
+        return [place for place in self.places
+                if place[0] not in intervals or not intervals[place[0]].overlaps(start, stop)]
+
+    def with_reservation(self, place_id: int, start: datetime, stop: datetime) -> "ParkingAvailability":
+        """
+        Copies availability adding reservation of a place.
+        :param place_id: id of parking place
+        :param start: reservation start
+        :param stop: reservation stop
+        :return: new availability
+        """
+        copy = ParkingAvailability((), ())
+        copy.places = self.places
+        copy._intervals = dict(self._intervals)
+        periods = list(self._intervals[place_id].periods) if place_id in self._intervals else []
+        insort(periods, (start, stop))
+        copy._intervals[place_id] = PlaceIntervals(periods)
+        return copy
+
+
+class AvailabilityIndex:
+    """
+    Lazily built availability of parkings, kept for `ttl` seconds.
+    Reservation writes of this process add to the index or drop it; ttl bounds staleness
+    caused by other processes.
+    """
+
+    def __init__(self, ttl: float = 60.0, enabled: bool = True) -> None:
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: Dict[int, Tuple[float, ParkingAvailability]] = {}
+        self._parking_of_place: Dict[int, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter of invalidations; availability read before an invalidation is not stored.
+        """
+        return self._generation
+
+    def get(self, parking_id: int) -> Optional[ParkingAvailability]:
+        """
+        Gets availability of parking when it is indexed and not expired.
+        :param parking_id: id of parking
+        :return: availability or None
+        """
+        entry = self._entries.get(parking_id)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def put(self, parking_id: int, availability: ParkingAvailability, generation: int) -> None:
+        """
+        Stores availability of parking read from database.
+        :param parking_id: id of parking
+        :param availability: availability of parking
+        :param generation: value of `generation` taken before reading
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[parking_id] = (time.monotonic(), availability)
+            for place in availability.places:
+                self._parking_of_place[place[0]] = parking_id
+
+    def add_reservation(self, place_id: int, start: datetime, stop: datetime) -> None:
+        """
+        Adds created reservation to availability of its parking when the parking is indexed.
+        :param place_id: id of parking place
+        :param start: reservation start
+        :param stop: reservation stop
+        """
+        with self._lock:
+            self._generation += 1
+            parking_id = self._parking_of_place.get(place_id)
+            entry = self._entries.get(parking_id)
+            if entry is not None:
+                self._entries[parking_id] = (entry[0], entry[1].with_reservation(place_id, start, stop))
+
+    def invalidate(self) -> None:
+        """
+        Drops availability of all parkings.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries = {}
+            self._parking_of_place = {}
+
+
+availability_index = AvailabilityIndex()
+
+
+class AvailabilityWrites:
+    """
+    Mixin of DAO which table affects availability: every write drops the availability index.
+    """
+
+    def create(self, obj: object) -> object:
+        try:
+            return super().create(obj)
+        finally:
+            self._invalidate_availability()
+
+    def create_all(self, obj_list: List[object]) -> List[object]:
+        try:
+            return super().create_all(obj_list)
+        finally:
+            self._invalidate_availability()
+
+    def create_bulk(self, *args, **kwargs) -> Tuple[int, List[object]]:
+        try:
+            return super().create_bulk(*args, **kwargs)
+        finally:
+            self._invalidate_availability()
+
+    def update(self, key: int, in_obj: object, version: Optional[int] = None) -> bool:
+        try:
+            return super().update(key, in_obj, version)
+        finally:
+            self._invalidate_availability()
+
+    def patch(self, key: int, value_dict: Dict[str, object], version: Optional[int] = None) -> bool:
+        try:
+            return super().patch(key, value_dict, version)
+        finally:
+            self._invalidate_availability()
+
+    def delete(self, key: int, version: Optional[int] = None) -> bool:
+        try:
+            return super().delete(key, version)
+        finally:
+            self._invalidate_availability()
+
+    def delete_all(self) -> None:
+        try:
+            super().delete_all()
+        finally:
+            self._invalidate_availability()
+
+    def _invalidate_availability(self) -> None:
+        """
+        Drops the availability index once the write is committed (see after_commit).
+        """
+        after_commit(self._session, availability_index, availability_index.invalidate)
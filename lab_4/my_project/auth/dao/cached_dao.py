@@ -0,0 +1,192 @@
+"""
+Data Access class for small lookup tables kept in process memory.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Mapper, make_transient_to_detached
+
+from my_project.auth.dao.general_dao import GeneralDAO
+from my_project.list_query import ListQuery
+from my_project.routing_session import after_commit, has_uncommitted_writes
+
+
+class CachedDAO(GeneralDAO):
+    """
+    The realization of Data Access class for rarely written lookup tables.
+    Whole table is read once (at startup or on first access) and reads are served from memory.
+    Every write through DAO drops the cache; `_cache_ttl` bounds staleness caused by other processes.
+    Objects are returned merged into the session as persistent instances (without a query, see _attached),
+    so they can be passed to write paths, and while they are referenced (identity map holds weak references)
+    many-to-one relationships of other objects to them are resolved without lazy-loading from database.
+    """
+    _cache_ttl = 60.0
+    _rows: Optional[Dict[object, Dict[str, Any]]] = None
+    _loaded_at = 0.0
+    _generation = 0
+    _lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # guards cache state of the class; the table is read outside of it, so a slow read blocks nobody
+        cls._lock = threading.Lock()
+
+    def preload(self) -> None:
+        """
+        Reads whole table into the cache.
+        """
+        self._invalidate()
+        self._cached_rows()
+
+    def find_all(self, fields: Optional[List[str]] = None, list_query: Optional[ListQuery] = None) -> List[object]:
+        """
+        Gets all objects from the cache; requested fields are only checked, since whole rows are in memory.
+        Filtered or sorted lists are read from database.
+        :param fields: DTO fields (see to_dto) or None
+        :param list_query: filters, sort order and includes or None
+        :return: list of all objects
+        :raise ValueError: unknown field or invalid list query
+        """
+        if list_query:
+            return super().find_all(fields, list_query)
+        if fields is not None:
+            self._field_attributes(fields)
+        return [self._attached(row) for row in self._cached_rows().values()]
+
+    def find_by_id(self, key: int) -> object:
+        """
+        Gets object from the cache by integer key.
+        :param key: integer key (surrogate primary key)
+        :return: search object
+        """
+        row = self._cached_rows().get(key)
+        return None if row is None else self._attached(row)
+
+    def find_by_ids(self, keys: List[object], fields: Optional[List[str]] = None,
+                    list_query: Optional[ListQuery] = None) -> Tuple[List[object], List[object]]:
+        """
+        Gets objects from the cache by list of keys.
+        Filtered lists and lists with includes are read from database.
+        :param keys: values of primary key (strings are converted to its type)
+        :param fields: DTO fields (see to_dto) or None
+        :param list_query: filters and includes or None
+        :return: found objects in order of keys (duplicates once) and keys which were not found
+        :raise ValueError: too many keys, key of wrong type, unknown field or invalid list query
+        """
+        if list_query:
+            return super().find_by_ids(keys, fields, list_query)
+        if len(keys) > self._max_ids:
+            raise ValueError(f"More than {self._max_ids} ids requested")
+        if fields is not None:
+            self._field_attributes(fields)
+        python_type = self._python_type(inspect(self._domain_type).primary_key[0])
+        rows = self._cached_rows()
+        keys = list(dict.fromkeys(self._filter_value(python_type, key) if isinstance(key, str) else key
+                                  for key in keys))
+        return [self._attached(rows[key]) for key in keys if key in rows], [key for key in keys if key not in rows]
+
+    def list_etag(self) -> str:
+        """
+        Computes ETag of find_all result from the cache.
+        :return: ETag value (unquoted)
+        """
+        rows = self._cached_rows()
+        return hashlib.sha1(repr(sorted(rows.items(), key=lambda item: item[0])).encode()).hexdigest()
+
+    def create(self, obj: object) -> object:
+        try:
+            return super().create(obj)
+        finally:
+            self._invalidate()
+
+    def create_all(self, obj_list: List[object]) -> List[object]:
+        try:
+            return super().create_all(obj_list)
+        finally:
+            self._invalidate()
+
+    def create_bulk(self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                    return_ids: bool = False) -> Tuple[int, List[object]]:
+        try:
+            return super().create_bulk(rows, chunk_size, return_ids)
+        finally:
+            self._invalidate()
+
+    def update(self, key: int, in_obj: object, version: Optional[int] = None) -> bool:
+        try:
+            return super().update(key, in_obj, version)
+        finally:
+            self._invalidate()
+
+    def patch(self, key: int, value_dict: Dict[str, Any], version: Optional[int] = None) -> bool:
+        try:
+            return super().patch(key, value_dict, version)
+        finally:
+            self._invalidate()
+
+    def delete(self, key: int, version: Optional[int] = None) -> bool:
+        try:
+            return super().delete(key, version)
+        finally:
+            self._invalidate()
+
+    def delete_all(self) -> None:
+        try:
+            super().delete_all()
+        finally:
+            self._invalidate()
+
+    def _attached(self, row: Dict[str, Any]) -> object:
+        """
+        Builds persistent object of cached row in the session (the instance of the identity map when there is one).
+        :param row: column values of cached row
+        :return: object of domain type
+        """
+        obj = self._domain_type(**row)
+        make_transient_to_detached(obj)
+        return self._session.merge(obj, load=False)
+
+    def _cached_rows(self) -> Dict[object, Dict[str, Any]]:
+        """
+        Gets column values of all rows keyed by primary key, reading the table when cache is empty or expired.
+        Result of a read which raced with a write is not stored; neither is (nor the cache used for)
+        a read of a session with uncommitted writes.
+        :return: dictionary of rows
+        """
+        cls = type(self)
+        uncommitted = has_uncommitted_writes(self._session)
+        with cls._lock:
+            rows, loaded_at, generation = cls._rows, cls._loaded_at, cls._generation
+        if rows is not None and not uncommitted and time.monotonic() - loaded_at < self._cache_ttl:
+            return rows
+        mapper: Mapper = inspect(self._domain_type)
+        keys = [prop.key for prop in mapper.column_attrs]
+        rows = {}
+        for obj in self._session.query(self._domain_type).order_by(*mapper.primary_key).all():
+            rows[mapper.primary_key_from_instance(obj)[0]] = {key: getattr(obj, key) for key in keys}
+        if not uncommitted:
+            with cls._lock:
+                if generation == cls._generation:
+                    cls._rows, cls._loaded_at = rows, time.monotonic()
+        return rows
+
+    @classmethod
+    def _drop_cache(cls) -> None:
+        super()._drop_cache()
+        cls._drop_rows()
+
+    @classmethod
+    def _drop_rows(cls) -> None:
+        with cls._lock:
+            cls._generation += 1
+            cls._rows = None
+
+    def _invalidate(self) -> None:
+        """
+        Drops the cache of domain type once the write is committed (see after_commit).
+        """
+        after_commit(self._session, ("rows", type(self)), type(self)._drop_rows)
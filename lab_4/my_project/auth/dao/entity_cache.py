@@ -0,0 +1,221 @@
+"""
+Shared cache of entity DTOs used by GeneralDAO.find_dto_by_id.
+"""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional
+
+DATETIME_TAG = "$dt"
+
+
+def dumps_dto(dto: Dict[str, Any]) -> str:
+    """
+    Serializes DTO to JSON keeping datetime values restorable.
+    :param dto: DTO object as dictionary
+    :return: JSON string
+    """
+    return json.dumps(dto, default=_encode_value)
+
+
+def loads_dto(raw: str) -> Dict[str, Any]:
+    """
+    Restores DTO serialized by dumps_dto.
+    :param raw: JSON string
+    :return: DTO object as dictionary
+    """
+    return json.loads(raw, object_hook=_decode_value)
+
+
+def _encode_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return {DATETIME_TAG: value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_value(obj: Dict[str, Any]) -> object:
+    if len(obj) == 1 and DATETIME_TAG in obj:
+        return datetime.fromisoformat(obj[DATETIME_TAG])
+    return obj
+
+
+class EntityCache(ABC):
+    """
+    Interface of cache backend storing serialized DTOs by string key.
+    Keeps hit/miss counters and generation of evictions of the current process.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._generation_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets DTO from cache and counts hit or miss.
+        :param key: cache key
+        :return: DTO or None when it is not cached
+        """
+        raw = self._get(key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return loads_dto(raw)
+
+    def set(self, key: str, dto: Dict[str, Any], generation: Optional[int] = None) -> bool:
+        """
+        Puts DTO into cache, unless something was evicted since the DTO was read.
+        :param key: cache key
+        :param dto: DTO object as dictionary
+        :param generation: value of `generation` before the DTO was read or None to put unconditionally
+        :return: whether DTO was stored
+        """
+        raw = dumps_dto(dto)
+        with self._generation_lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._set(key, raw)
+        return True
+
+    def delete(self, key: str) -> None:
+        """
+        Removes DTO from cache; DTOs being read concurrently are not stored (see set).
+        :param key: cache key
+        """
+        with self._generation_lock:
+            self.generation += 1
+        self._delete(key)
+
+    def clear(self, prefix: str) -> None:
+        """
+        Removes all DTOs which keys start with prefix; DTOs being read concurrently are not stored (see set).
+        :param prefix: key prefix
+        """
+        with self._generation_lock:
+            self.generation += 1
+        self._clear(prefix)
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Gets counters of cache usage.
+        :return: dictionary with backend name, hits, misses and hit ratio
+        """
+        total = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else None,
+        }
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, raw: str) -> None:
+        pass
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def _clear(self, prefix: str) -> None:
+        pass
+
+
+class MemoryEntityCache(EntityCache):
+    """
+    In-process LRU cache with time to live of entries.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 60.0) -> None:
+        super().__init__()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _clear(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, raw = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return raw
+
+    def _set(self, key: str, raw: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, raw)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+class RedisEntityCache(EntityCache):
+    """
+    Cache shared by all worker processes, stored in Redis with time to live of entries.
+    Generation guards fills against evictions of the same process; an eviction by another process
+    racing with a fill can leave a stale DTO until its time to live ends.
+    """
+
+    def __init__(self, url: str, ttl: float = 60.0, namespace: str = "entity:") -> None:
+        super().__init__()
+        import redis
+
+        self._redis = redis.Redis.from_url(url)
+        self._ttl = max(1, int(ttl))
+        self._namespace = namespace
+
+    def _delete(self, key: str) -> None:
+        self._redis.delete(self._namespace + key)
+
+    def _clear(self, prefix: str) -> None:
+        keys = list(self._redis.scan_iter(match=self._namespace + prefix + "*", count=1000))
+        if keys:
+            self._redis.delete(*keys)
+
+    def _get(self, key: str) -> Optional[str]:
+        raw = self._redis.get(self._namespace + key)
+        return None if raw is None else raw.decode()
+
+    def _set(self, key: str, raw: str) -> None:
+        self._redis.set(self._namespace + key, raw, ex=self._ttl)
+
+
+def create_entity_cache(config: Mapping[str, Any]) -> Optional[EntityCache]:
+    """
+    Creates cache backend from application config.
+    ENTITY_CACHE_BACKEND is None (disabled), "memory" or "redis".
+    :param config: application config
+    :return: cache backend or None
+    """
+    backend = config.get("ENTITY_CACHE_BACKEND")
+    ttl = config.get("ENTITY_CACHE_TTL", 60.0)
+    if not backend:
+        return None
+    if backend == "memory":
+        return MemoryEntityCache(config.get("ENTITY_CACHE_SIZE", 10000), ttl)
+    if backend == "redis":
+        return RedisEntityCache(config["ENTITY_CACHE_REDIS_URL"], ttl)
+    raise ValueError(f"Unknown ENTITY_CACHE_BACKEND {backend!r}")
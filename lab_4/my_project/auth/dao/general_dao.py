@@ -4,13 +4,37 @@ apavelchak@gmail.com
 © Andrii Pavelchak
 """
 
+import base64
+import hashlib
+import json
 from abc import ABC
-from typing import List
+from datetime import date, datetime
+from functools import lru_cache, partial
+from itertools import islice
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from sqlalchemy import inspect
-from sqlalchemy.orm import Mapper
+from sqlalchemy import Table, func, insert, inspect, select, tuple_
+from sqlalchemy import orm
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Mapper, Query
 
 from my_project import db
+from my_project.auth.dao.entity_cache import EntityCache
+from my_project.auth.domain.orders.table_change import TableChange
+from my_project.list_query import MAX_IN_VALUES, ListQuery
+from my_project.routing_session import after_commit, has_uncommitted_writes, replica_read
+
+COMPARISONS = {"eq": eq, "ne": ne, "lt": lt, "lte": le, "gt": gt, "gte": ge}
+
+class VersionConflict(Exception):
+    """
+    Raised when the row was changed by another request after the version expected by the writer was read.
+    """
+
+    def __init__(self, key: object) -> None:
+        super().__init__(f"Row {key!r} was modified concurrently")
+        self.key = key
 
 
 class GeneralDAO(ABC):
@@ -19,21 +43,283 @@ class GeneralDAO(ABC):
     """
     _domain_type = None
     _session = db.session
+    # relationship path -> loader strategy ("joined" or "selectin") used by read queries,
+    # must cover every relationship touched by put_into_dto of the domain type
+    _load_profile: Dict[str, str] = {}
+    _entity_cache: Optional[EntityCache] = None
+    _dao_types: List[type] = []
+    _sort_columns: Tuple[str, ...] = ()
+    _default_page_size = 100
+    _max_page_size = 1000
+    _stream_batch_size = 1000
+    _bulk_chunk_size = 1000
+    # column filtered by time range of export and path to parking id ("parking_id" or "relationship.parking_id")
+    _export_time_column: Optional[str] = None
+    _export_parking_path: Optional[str] = None
+    _export_batch_size = 5000
+    _ids_chunk_size = 500  # keys per IN list of find_by_ids
+    _max_ids = 5000
+    # DTO field -> mapped attribute, for DTO fields not named after the attribute they are built from
+    _dto_attributes: Dict[str, str] = {}
+    # column incremented by every UPDATE and compared by conditional writes (optimistic concurrency)
+    _version_column = "version"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        GeneralDAO._dao_types.append(cls)
+
+    @staticmethod
+    def set_entity_cache(cache: Optional[EntityCache]) -> None:
+        """
+        Sets cache backend of find_dto_by_id shared by all DAOs.
+        :param cache: cache backend or None to disable caching
+        """
+        GeneralDAO._entity_cache = cache
+
+    @staticmethod
+    def get_entity_cache() -> Optional[EntityCache]:
+        """
+        Gets cache backend of find_dto_by_id.
+        :return: cache backend or None when caching is disabled
+        """
+        return GeneralDAO._entity_cache
+
+    @staticmethod
+    def drop_caches() -> None:
+        """
+        Drops cached data of all domain types, e.g. after a transaction which wrote through DAOs was rolled back.
+        """
+        for dao_type in GeneralDAO._dao_types:
+            if dao_type._domain_type is not None:
+                dao_type._drop_cache()
 
-    def find_all(self) -> List[object]:
+    @replica_read
+    def find_all(self, fields: Optional[List[str]] = None, list_query: Optional[ListQuery] = None) -> List[object]:
         """
         Gets all objects from table.
+        :param fields: DTO fields to load (see to_dto) or None for whole objects
+        :param list_query: filters, sort order and includes or None for all objects in primary key order
         :return: list of all objects
+        :raise ValueError: unknown field or invalid list query
+        """
+        return self._ordered_query(fields, list_query).all()
+
+    @replica_read
+    def stream_all(self, fields: Optional[List[str]] = None,
+                   list_query: Optional[ListQuery] = None) -> Iterator[object]:
+        """
+        Iterates over all objects of table using server-side cursor.
+        Rows are fetched in batches, so memory does not depend on table size.
+        With included relationships, objects are read page by page instead (see _stream_pages).
+        :param fields: DTO fields to load (see to_dto) or None for whole objects
+        :param list_query: filters, sort order and includes or None for all objects in primary key order
+        :return: iterator of objects
+        :raise ValueError: unknown field or invalid list query
+        """
+        if list_query is not None and list_query.include:
+            return self._stream_pages(fields, list_query)
+        return iter(self._ordered_query(fields, list_query).yield_per(self._stream_batch_size))
+
+    def _stream_pages(self, fields: Optional[List[str]], list_query: ListQuery) -> Iterator[object]:
+        """
+        Iterates over objects with buffered keyset-paginated queries of _stream_batch_size rows.
+        Selectin loads of includes must not run while a server-side cursor is open on the same connection:
+        PyMySQL would drain the unbuffered cursor and the stream would silently end after the first batch.
+        List query is validated before the first page is read.
+        :param fields: DTO fields to load or None for whole objects
+        :param list_query: filters, sort order and includes
+        :return: iterator of objects
+        :raise ValueError: unknown field, invalid list query or sort columns of mixed directions
+        """
+        self._keyset_columns(list_query)
+        self._keyset_descending(list_query)
+        self._query(fields, list_query)
+
+        def pages() -> Iterator[object]:
+            after = None
+            while True:
+                objects, after = self.find_page(self._stream_batch_size, after, fields, list_query)
+                yield from objects
+                if after is None:
+                    return
+        return pages()
+
+    def to_dto(self, obj: object, fields: Optional[List[str]] = None,
+               list_query: Optional[ListQuery] = None) -> Dict[str, Any]:
+        """
+        Builds DTO of object, restricted to requested fields of put_into_dto,
+        with DTOs of included relationships embedded under relationship names.
+        Object must be loaded with the same fields and list query, so nothing is lazy-loaded.
+        :param obj: object of domain type
+        :param fields: DTO fields or None for full DTO
+        :param list_query: list query with includes or None
+        :return: DTO object as dictionary
+        :raise ValueError: unknown field or relationship
+        """
+        if fields is None:
+            dto = obj.put_into_dto()
+        else:
+            relationships = inspect(self._domain_type).relationships
+            dto = {}
+            for field, attribute in self._field_attributes(fields).items():
+                value = getattr(obj, attribute)
+                if attribute in relationships and value is not None:
+                    value = [item.put_into_dto() for item in value] if isinstance(value, list) else value.put_into_dto()
+                dto[field] = value
+        if list_query is not None and list_query.include:
+            self._embed_includes(dto, obj, self._include_tree(self._domain_type, tuple(list_query.include)))
+        return dto
+
+    def export(self, start: Optional[datetime] = None, stop: Optional[datetime] = None,
+               parking_id: Optional[int] = None) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """
+        Iterates over column values of rows filtered by time range and parking, ordered by primary key.
+        Rows are read in keyset batches, each one from server-side cursor in its own short read transaction
+        (on replica when configured), so neither memory nor transaction length depends on table size.
+        :param start: minimal value of time column
+        :param stop: upper bound (exclusive) of time column
+        :param parking_id: id of parking
+        :return: column names and iterator of dictionaries of column values
+        :raise ValueError: filter is not supported by domain type
+        """
+        criteria = []
+        if start is not None or stop is not None:
+            if self._export_time_column is None:
+                raise ValueError(f"{self._domain_type.__name__} cannot be filtered by time")
+            column = getattr(self._domain_type, self._export_time_column)
+            if start is not None:
+                criteria.append(column >= start)
+            if stop is not None:
+                criteria.append(column < stop)
+        if parking_id is not None:
+            criteria.append(self._parking_criterion(parking_id))
+        return [column.key for column in self._export_columns()], self._export_batches(criteria)
+
+    @replica_read
+    def list_etag(self) -> str:
+        """
+        Computes ETag of find_all result without fetching objects: change counters (see _commit)
+        of domain table and of tables embedded into its DTO (by load profile), read with one primary key lookup.
+        Reads of one session stay on one replica (see RoutingSession), so the ETag and the list describe
+        the same state. Writes which bypass DAOs (e.g. manual SQL) do not change it.
+        :return: ETag value (unquoted)
+        """
+        names = [table.name for table in self._etag_tables()]
+        changes = dict(self._session.execute(
+            select(TableChange.table_name, TableChange.changes).where(TableChange.table_name.in_(names))).all())
+        return hashlib.sha1(repr([(name, changes.get(name, 0)) for name in names]).encode()).hexdigest()
+
+    @replica_read
+    def find_page(self, limit: Optional[int] = None, after: Optional[str] = None,
+                  fields: Optional[List[str]] = None,
+                  list_query: Optional[ListQuery] = None) -> Tuple[List[object], Optional[str]]:
         """
-        return self._session.query(self._domain_type).all()
+        Gets one page of objects ordered by requested (or declared) sort columns and primary key.
+        Next page starts from the keyset of the cursor (range scan instead of OFFSET),
+        so all requested sort columns must have the same direction.
+        :param limit: maximum count of objects on the page
+        :param after: opaque cursor of the previous page or None for the first page
+        :param fields: DTO fields to load (see to_dto) or None for whole objects
+        :param list_query: filters, sort order and includes or None
+        :return: objects of the page and cursor of the next page (None for the last page)
+        :raise ValueError: cursor is malformed, unknown field or invalid list query
+        """
+        columns = self._keyset_columns(list_query)
+        descending = self._keyset_descending(list_query)
+        limit = min(limit or self._default_page_size, self._max_page_size)
+        query = self._query(fields, list_query)
+        if after is not None:
+            values = self._decode_cursor(after, columns)
+            keyset, cursor = (columns[0], values[0]) if len(columns) == 1 else (tuple_(*columns), tuple_(*values))
+            query = query.filter(keyset < cursor if descending else keyset > cursor)
+        objects = query.order_by(*(column.desc() if descending else column for column in columns)) \
+            .limit(limit + 1).all()
+        if len(objects) <= limit:
+            return objects, None
+        objects = objects[:limit]
+        return objects, self._encode_cursor(objects[-1], columns)
 
+    @replica_read
     def find_by_id(self, key: int) -> object:
         """
         Gets object from database table by integer key.
         :param key: integer key (surrogate primary key)
         :return: search object
         """
-        return self._session.query(self._domain_type).get(key)
+        return self._query().get(key)
+
+    @replica_read
+    def find_by_ids(self, keys: List[object], fields: Optional[List[str]] = None,
+                    list_query: Optional[ListQuery] = None) -> Tuple[List[object], List[object]]:
+        """
+        Gets objects by list of keys with one IN query per chunk of keys.
+        Objects already in identity map of the session with required attributes loaded are not queried again.
+        :param keys: values of single-column primary key (strings are converted to its type)
+        :param fields: DTO fields to load (see to_dto) or None for whole objects
+        :param list_query: filters and includes or None
+        :return: found objects in order of keys (duplicates once) and keys which were not found
+        :raise ValueError: too many keys, key of wrong type, composite primary key, unknown field or invalid list query
+        """
+        mapper: Mapper = inspect(self._domain_type)
+        if len(mapper.primary_key) != 1:
+            raise ValueError(f"{self._domain_type.__name__} has composite primary key")
+        if len(keys) > self._max_ids:
+            raise ValueError(f"More than {self._max_ids} ids requested")
+        column = mapper.primary_key[0]
+        python_type = self._python_type(column)
+        keys = list(dict.fromkeys(self._filter_value(python_type, key) if isinstance(key, str) else key
+                                  for key in keys))
+        required = self._required_attributes(fields)
+        found = {}
+        if list_query is None or not list_query.filters:
+            if list_query is not None:
+                required.update(self._include_tree(self._domain_type, tuple(list_query.include)))
+            for key in keys:
+                obj = self._session.identity_map.get(mapper.identity_key_from_primary_key([key]))
+                if obj is not None and not required & inspect(obj).unloaded:
+                    found[key] = obj
+        query = self._query(fields, list_query)
+        attribute = self._column_attribute(column)
+        rest = iter([key for key in keys if key not in found])
+        while chunk := list(islice(rest, self._ids_chunk_size)):
+            for obj in query.filter(column.in_(chunk)):
+                found[getattr(obj, attribute)] = obj
+        return [found[key] for key in keys if key in found], [key for key in keys if key not in found]
+
+    def find_dto_by_id(self, key: int) -> Optional[Dict[str, Any]]:
+        """
+        Gets DTO of object by integer key, served from entity cache when it is configured
+        (and the session has no uncommitted writes, whose evictions are still pending).
+        DTO read from database is not cached when an eviction ran meanwhile, since the row may be stale.
+        :param key: integer key (surrogate primary key)
+        :return: DTO of search object or None
+        """
+        cache = self._entity_cache
+        if cache is None or has_uncommitted_writes(self._session):
+            obj = self.find_by_id(key)
+            return None if obj is None else obj.put_into_dto()
+        cache_key = self._cache_key(key)
+        generation = cache.generation
+        dto = cache.get(cache_key)
+        if dto is None:
+            obj = self.find_by_id(key)
+            if obj is None:
+                return None
+            dto = obj.put_into_dto()
+            cache.set(cache_key, dto, generation)
+        return dto
+
+    def find_dto_and_version(self, key: object) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """
+        Gets current DTO and row version of object from primary database bypassing entity cache,
+        used to check preconditions of conditional writes.
+        :param key: primary key value (tuple for composite key)
+        :return: DTO and version or (None, None) if there is no object with such key
+        """
+        obj = self._query().populate_existing().get(key)
+        if obj is None:
+            return None, None
+        return obj.put_into_dto(), getattr(obj, self._version_column)
 
     def create(self, obj: object) -> object:
         """
@@ -42,7 +328,7 @@ class GeneralDAO(ABC):
         :return: created object
         """
         self._session.add(obj)
-        self._session.commit()
+        self._commit()
         return obj
 
     def create_all(self, obj_list: List[object]) -> List[object]:
@@ -52,51 +338,683 @@ class GeneralDAO(ABC):
         :return: list of created object
         """
         self._session.add_all(obj_list)
-        self._session.commit()
+        self._commit()
         return obj_list
 
-    def update(self, key: int, in_obj: object) -> None:
+    def create_bulk(self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                    return_ids: bool = False) -> Tuple[int, List[object]]:
+        """
+        Creates objects from DTO rows with one multi-row INSERT per chunk in one transaction.
+        Primary keys are fetched only when requested (RETURNING or ORM flush when dialect lacks it).
+        :param rows: iterable of DTO dictionaries (may be lazy)
+        :param chunk_size: count of rows per INSERT statement
+        :param return_ids: whether primary keys of created rows are needed
+        :return: count of created rows and list of their primary keys
+        :raise ValueError: row is not a dictionary of table columns or chunk lacks required columns
         """
-        Updates object in database table
+        mapper: Mapper = inspect(self._domain_type)
+        table = self._domain_type.__table__
+        chunk_size = chunk_size or self._bulk_chunk_size
+        returning = return_ids and self._session.get_bind().dialect.insert_executemany_returning
+        count, ids = 0, []
+        rows = iter(rows)
+        try:
+            while chunk := [self._column_values(mapper, row) for row in islice(rows, chunk_size)]:
+                self._check_chunk(table, chunk)
+                if returning:
+                    result = self._session.execute(insert(table).returning(*mapper.primary_key), chunk)
+                    ids.extend(self._key_of_row(row) for row in result)
+                elif return_ids:
+                    objects = [self._domain_type(**row) for row in chunk]
+                    self._session.add_all(objects)
+                    self._session.flush()
+                    ids.extend(self._key_of_row(mapper.primary_key_from_instance(obj)) for obj in objects)
+                else:
+                    self._session.execute(insert(table), chunk)
+                count += len(chunk)
+            self._commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return count, ids
+
+    def update(self, key: int, in_obj: object, version: Optional[int] = None) -> bool:
+        """
+        Updates object in database table with single UPDATE statement (no pre-SELECT)
         :param key: integer key (surrogate primary key)
         :param in_obj: object to update in Database
+        :param version: expected row version or None for unconditional update
+        :return: False if there is no object with such key
+        :raise VersionConflict: row version differs from expected one
         """
-        domain_obj = self._session.query(self._domain_type).get(key)
         mapper: Mapper = inspect(type(in_obj))  # Metadata
-        columns = mapper.columns._collection
-        for column_name, column_obj, *_ in columns:
-            if not column_obj.primary_key:
-                value = getattr(in_obj, column_name)
-                setattr(domain_obj, column_name, value)
-        self._session.commit()
+        values = {column.key: getattr(in_obj, mapper.get_property_by_column(column).key)
+                  for column in mapper.columns if not column.primary_key}
+        return self._update_values(key, values, version)
 
-    def patch(self, key: int, field_name: str, value: object) -> None:
+    def patch(self, key: int, value_dict: Dict[str, Any], version: Optional[int] = None) -> bool:
         """
-        Modifies defined field of object in database table.
+        Modifies defined fields of object in database table with single UPDATE statement.
         :param key: integer key (surrogate primary key)
-        :param field_name: field name of object
-        :param value: field value of object
+        :param value_dict: field names and values of object
+        :param version: expected row version or None for unconditional update
+        :return: False if there is no object with such key
+        :raise ValueError: no fields or unknown field name
+        :raise VersionConflict: row version differs from expected one
         """
-        domain_obj = self._session.query(self._domain_type).get(key)
-        setattr(domain_obj, field_name, value)
-        self._session.commit()
+        if not value_dict:
+            raise ValueError("Nothing to patch")
+        return self._update_values(key, self._column_values(inspect(self._domain_type), value_dict), version)
 
-    def delete(self, key: int) -> None:
+    def delete(self, key: int, version: Optional[int] = None) -> bool:
         """
-        Deletes object from database table by integer key.
+        Deletes object from database table by integer key with single DELETE statement.
         :param key: integer key (surrogate primary key)
+        :param version: expected row version or None for unconditional delete
+        :return: False if there is no object with such key
+        :raise VersionConflict: row version differs from expected one
         """
-        domain_obj = self._session.query(self._domain_type).get(key)
-        self._session.delete(domain_obj)
         try:
-            self._session.commit()
+            rowcount = self._session.query(self._domain_type).filter(*self._key_criteria(key, version)) \
+                .delete(synchronize_session=False)
+            if rowcount == 0 and version is not None:
+                self._check_version_conflict(key)
+            self._commit()
         except Exception:
             self._session.rollback()
-            raise 
+            raise
+        self._evict(key)
+        return rowcount > 0
 
     def delete_all(self) -> None:
         """
         Deletes all objects from database table.
         """
         self._session.query(self._domain_type).delete()
+        self._commit()
+        self._evict(None)
+
+    def _export_columns(self) -> List[object]:
+        """
+        Gets exported columns of domain table: all but the internal row version.
+        :return: list of columns
+        """
+        return [column for column in self._domain_type.__table__.columns if column.key != self._version_column]
+
+    def _export_batches(self, criteria: List[object]) -> Iterator[Dict[str, Any]]:
+        key = inspect(self._domain_type).primary_key[0]
+        last_key = None
+        while True:
+            batch = self._export_batch(criteria, key, last_key)
+            yield from batch
+            if len(batch) < self._export_batch_size:
+                return
+            last_key = batch[-1][key.key]
+
+    @replica_read
+    def _export_batch(self, criteria: List[object], key: object, last_key: object) -> List[Dict[str, Any]]:
+        """
+        Reads next batch of export on its own connection (to replica or primary, as chosen by the session),
+        so the read transaction ends with the batch and transaction of the session (e.g. of atomic POST /batch)
+        is not touched.
+        :param criteria: filter criteria
+        :param key: primary key column
+        :param last_key: primary key of the last exported row or None
+        :return: list of dictionaries of column values
+        """
+        statement = select(*self._export_columns()).where(*criteria)
+        if last_key is not None:
+            statement = statement.where(key > last_key)
+        statement = statement.order_by(key).limit(self._export_batch_size) \
+            .execution_options(stream_results=True, yield_per=self._export_batch_size)
+        engine = self._session.get_bind(inspect(self._domain_type), clause=statement)
+        with engine.connect() as connection:
+            return [dict(row._mapping) for row in connection.execute(statement)]
+
+    def _parking_criterion(self, parking_id: int) -> object:
+        """
+        Builds criterion selecting rows of parking by _export_parking_path.
+        :param parking_id: id of parking
+        :return: criterion
+        :raise ValueError: domain type is not related to parking
+        """
+        if self._export_parking_path is None:
+            raise ValueError(f"{self._domain_type.__name__} cannot be filtered by parking")
+        *relationships, column_name = self._export_parking_path.split(".")
+        if not relationships:
+            return getattr(self._domain_type, column_name) == parking_id
+        relationship = getattr(self._domain_type, relationships[0]).property
+        (local_column,) = relationship.local_columns
+        target = relationship.mapper.class_
+        return local_column.in_(select(*inspect(target).primary_key)
+                                .where(getattr(target, column_name) == parking_id))
+
+    def _etag_tables(self) -> List[Table]:
+        """
+        Gets domain table and tables of relationships from load profile.
+        :return: list of tables
+        """
+        tables = [self._domain_type.__table__]
+        for path in self._load_profile:
+            owner = self._domain_type
+            for name in path.split("."):
+                owner = getattr(owner, name).property.mapper.class_
+            if owner.__table__ not in tables:
+                tables.append(owner.__table__)
+        return tables
+
+    def _commit(self) -> None:
+        """
+        Commits transaction of write method; extension point for work which must be in the same transaction.
+        Change counter of domain table (marker of list ETag) is incremented in the same transaction.
+        """
+        self._count_change()
         self._session.commit()
+
+    def _count_change(self) -> None:
+        """
+        Increments change counter of domain table, creating its row on the first write.
+        The row stays locked until commit, so writers of one table commit their counter updates in turn.
+        """
+        table = TableChange.__table__
+        dialect = self._session.get_bind().dialect.name
+        row = {"table_name": self._domain_type.__tablename__, "changes": 1}
+        if dialect == "mysql":
+            statement = mysql.insert(table).values(row).on_duplicate_key_update(changes=table.c.changes + 1)
+        elif dialect in ("sqlite", "postgresql"):
+            statement = (sqlite if dialect == "sqlite" else postgresql).insert(table).values(row) \
+                .on_conflict_do_update(index_elements=[table.c.table_name], set_={"changes": table.c.changes + 1})
+        else:
+            updated = self._session.execute(table.update().where(table.c.table_name == row["table_name"])
+                                            .values(changes=table.c.changes + 1))
+            if updated.rowcount:
+                return
+            statement = table.insert().values(row)
+        self._session.execute(statement)
+
+    def _query(self, fields: Optional[List[str]] = None, list_query: Optional[ListQuery] = None) -> Query:
+        """
+        Creates query of domain type with eager loading of declared load profile, filtered by list query,
+        with included relationships loaded level by level (see _include_options).
+        With fields, only columns and relationships which the fields are built from are selected
+        (plus primary key and sort columns needed by pagination and keys of included relationships).
+        :param fields: DTO fields or None for whole objects
+        :param list_query: filters and includes (sort order is applied by callers) or None
+        :return: Query object
+        :raise ValueError: unknown field, invalid filter or unknown relationship
+        """
+        query = self._session.query(self._domain_type)
+        include_tree = {}
+        if list_query is not None:
+            query = query.filter(*self._filter_criteria(list_query))
+            include_tree = self._include_tree(self._domain_type, tuple(list_query.include))
+            query = query.options(*self._include_options(None, self._domain_type, include_tree))
+        if fields is None:
+            profiled = {path.split(".")[0] for path in self._load_profile}
+            return query.options(*self._loader_options(profiled - include_tree.keys() if include_tree else None))
+        mapper: Mapper = inspect(self._domain_type)
+        attributes = set(self._field_attributes(fields).values())
+        relationships = {name for name in attributes if name in mapper.relationships}
+        columns = {self._column_attribute(column) for column in self._keyset_columns(list_query)}
+        columns.update(name for name in attributes if name in mapper.column_attrs)
+        for name in relationships | include_tree.keys():
+            columns.update(self._column_attribute(column) for column in mapper.relationships[name].local_columns)
+        relationships -= include_tree.keys()
+        options = self._loader_options(relationships)
+        options.extend(orm.selectinload(getattr(self._domain_type, name))
+                       for name in relationships if name not in self._load_profile)
+        load_only = orm.load_only(*(getattr(self._domain_type, name) for name in sorted(columns)))
+        return query.options(load_only, *options)
+
+    def _ordered_query(self, fields: Optional[List[str]] = None, list_query: Optional[ListQuery] = None) -> Query:
+        """
+        Creates query of _query sorted by requested columns and primary key (by primary key without sort request).
+        :param fields: DTO fields or None for whole objects
+        :param list_query: filters, sort order and includes or None
+        :return: Query object
+        :raise ValueError: unknown field or invalid list query
+        """
+        query = self._query(fields, list_query)
+        mapper: Mapper = inspect(self._domain_type)
+        if list_query is None or not list_query.sort:
+            return query.order_by(*mapper.primary_key)
+        order = [(self._mapped_column(name), descending) for name, descending in list_query.sort]
+        sorted_columns = [column for column, _ in order]
+        order.extend((column, False) for column in mapper.primary_key if column not in sorted_columns)
+        return query.order_by(*(column.desc() if descending else column for column, descending in order))
+
+    def _filter_criteria(self, list_query: ListQuery) -> List[object]:
+        """
+        Compiles filters of list query into SQL predicates on table columns (usable by indexes).
+        :param list_query: list query
+        :return: list of criteria
+        :raise ValueError: unknown column, operator not applicable to column or invalid value
+        """
+        criteria = []
+        for name, operator, raw in list_query.filters:
+            column = self._mapped_column(name)
+            if operator == "null":
+                criteria.append(column.is_(None) if self._filter_value(bool, raw) else column.is_not(None))
+            elif operator == "in":
+                values = [self._filter_value(self._python_type(column), item) for item in raw.split(",")]
+                if len(values) > MAX_IN_VALUES:
+                    raise ValueError(f"Filter {name}[in] has more than {MAX_IN_VALUES} values")
+                criteria.append(column.in_(values))
+            elif operator == "prefix":
+                if self._python_type(column) is not str:
+                    raise ValueError(f"Filter {name}[prefix] needs text column")
+                criteria.append(column.startswith(raw, autoescape=True))
+            else:
+                criteria.append(COMPARISONS[operator](column, self._filter_value(self._python_type(column), raw)))
+        return criteria
+
+    def _mapped_column(self, name: str) -> object:
+        """
+        Gets table column of mapped column attribute named in list query.
+        :param name: attribute name
+        :return: table column
+        :raise ValueError: domain type has no such column
+        """
+        attributes = inspect(self._domain_type).column_attrs
+        if name not in attributes:
+            raise ValueError(f"Unknown column {name!r} of {self._domain_type.__name__}")
+        return attributes[name].columns[0]
+
+    @staticmethod
+    def _python_type(column: object) -> type:
+        """
+        Gets Python type of column values (str for types which do not declare it).
+        :param column: table column
+        :return: Python type
+        """
+        try:
+            return column.type.python_type
+        except NotImplementedError:
+            return str
+
+    @staticmethod
+    def _filter_value(python_type: type, raw: str) -> object:
+        """
+        Converts raw filter value to type of column.
+        :param python_type: Python type of column
+        :param raw: value from request
+        :return: converted value
+        :raise ValueError: value cannot be converted
+        """
+        if python_type is bool:
+            if raw.lower() not in ("true", "false", "1", "0"):
+                raise ValueError(f"Expected true or false, got {raw!r}")
+            return raw.lower() in ("true", "1")
+        if python_type in (datetime, date):
+            return python_type.fromisoformat(raw)
+        if python_type in (int, float):
+            return python_type(raw)
+        return raw
+
+    def _required_attributes(self, fields: Optional[List[str]]) -> Set[str]:
+        """
+        Gets attributes which DTO of object reads directly: built from fields,
+        or all columns and top-level relationships of load profile for full DTO.
+        :param fields: DTO fields or None for full DTO
+        :return: set of attribute names
+        """
+        if fields is not None:
+            return set(self._field_attributes(fields).values())
+        mapper: Mapper = inspect(self._domain_type)
+        return set(mapper.column_attrs.keys()) | {path.split(".")[0] for path in self._load_profile}
+
+    def _field_attributes(self, fields: List[str]) -> Dict[str, str]:
+        """
+        Resolves requested DTO fields to mapped attributes they are built from.
+        :param fields: DTO fields
+        :return: dictionary of DTO field and attribute name
+        :raise ValueError: field is not in DTO of domain type
+        """
+        known = self._dto_fields(self._domain_type)
+        unknown = [field for field in fields if field not in known]
+        if unknown:
+            raise ValueError(f"Unknown fields of {self._domain_type.__name__}: {', '.join(unknown)}")
+        return {field: self._dto_attributes.get(field, field) for field in fields}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _dto_fields(domain_type: type) -> Tuple[str, ...]:
+        """
+        Gets field names of DTO of domain type (from DTO of empty transient object).
+        :param domain_type: domain type
+        :return: field names
+        """
+        return tuple(domain_type().put_into_dto())
+
+    def _column_attribute(self, column: object) -> str:
+        """
+        Gets name of mapped attribute of table column.
+        :param column: table column
+        :return: attribute name
+        """
+        return inspect(self._domain_type).get_property_by_column(column).key
+
+    def _loader_options(self, relationships: Optional[Set[str]] = None) -> List[object]:
+        """
+        Builds loader options from load profile, e.g. {"user": "joined", "user.user_type": "joined"}.
+        :param relationships: top-level relationships to load or None for whole load profile
+        :return: list of loader options
+        """
+        return self._profile_options(None, self._domain_type, self._load_profile, relationships)
+
+    @staticmethod
+    def _profile_options(base: Optional[object], owner_type: type, profile: Dict[str, str],
+                         relationships: Optional[Set[str]] = None) -> List[object]:
+        """
+        Builds loader options of load profile of owner type, chained to base option.
+        :param base: loader option of owner type relative to queried type or None when owner type is queried
+        :param owner_type: domain type the profile paths start from
+        :param profile: load profile
+        :param relationships: top-level relationships to load or None for whole load profile
+        :return: list of loader options
+        """
+        options = []
+        for path, strategy in profile.items():
+            if relationships is not None and path.split(".")[0] not in relationships:
+                continue
+            option, owner, prefix = base, owner_type, []
+            for name in path.split("."):
+                prefix.append(name)
+                attribute = getattr(owner, name)
+                loader = profile.get(".".join(prefix), strategy) + "load"
+                option = getattr(orm if option is None else option, loader)(attribute)
+                owner = attribute.property.mapper.class_
+            options.append(option)
+        return options
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _include_tree(domain_type: type, include: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Validates included relationship paths and merges them into a tree,
+        e.g. ("parking_place.parking", "user") -> {"parking_place": {"parking": {}}, "user": {}}.
+        :param domain_type: domain type the paths start from
+        :param include: dotted relationship paths
+        :return: tree of relationship names
+        :raise ValueError: unknown relationship
+        """
+        tree = {}
+        for path in include:
+            node, owner = tree, domain_type
+            for name in path.split("."):
+                relationships = inspect(owner).relationships
+                if name not in relationships:
+                    raise ValueError(f"Unknown relationship {name!r} of {owner.__name__}")
+                node = node.setdefault(name, {})
+                owner = relationships[name].mapper.class_
+        return tree
+
+    @staticmethod
+    def _include_options(base: Optional[object], owner_type: type, tree: Dict[str, Any]) -> List[object]:
+        """
+        Builds loader options of included relationships: one batched SELECT ... IN query per level
+        (selectin loading), plus load profile of every included type, which its put_into_dto reads
+        (relationships both in load profile and included are loaded as included).
+        :param base: loader option of owner type or None for queried type
+        :param owner_type: domain type of the tree level
+        :param tree: tree of relationship names
+        :return: list of loader options
+        """
+        options = []
+        for name, subtree in tree.items():
+            attribute = getattr(owner_type, name)
+            option = (orm if base is None else base).selectinload(attribute)
+            target_type = attribute.property.mapper.class_
+            options.append(option)
+            profile = GeneralDAO._profile_of(target_type)
+            not_included = {path.split(".")[0] for path in profile} - subtree.keys()
+            options.extend(GeneralDAO._profile_options(option, target_type, profile, not_included))
+            options.extend(GeneralDAO._include_options(option, target_type, subtree))
+        return options
+
+    @staticmethod
+    def _profile_of(domain_type: type) -> Dict[str, str]:
+        """
+        Gets load profile declared by DAO of domain type.
+        :param domain_type: domain type
+        :return: load profile (empty when no DAO declares it)
+        """
+        for dao_type in GeneralDAO._dao_types:
+            if dao_type._domain_type is domain_type:
+                return dao_type._load_profile
+        return {}
+
+    def _embed_includes(self, dto: Dict[str, Any], obj: object, tree: Dict[str, Any]) -> None:
+        """
+        Puts DTOs of included relationships (recursively) into DTO of object.
+        :param dto: DTO of object
+        :param obj: object with included relationships loaded
+        :param tree: tree of relationship names
+        """
+        for name, subtree in tree.items():
+            value = getattr(obj, name)
+            if isinstance(value, list):
+                dto[name] = [self._included_dto(item, subtree) for item in value]
+            else:
+                dto[name] = None if value is None else self._included_dto(value, subtree)
+
+    def _included_dto(self, obj: object, tree: Dict[str, Any]) -> Dict[str, Any]:
+        dto = obj.put_into_dto()
+        self._embed_includes(dto, obj, tree)
+        return dto
+
+    def _update_values(self, key: object, values: Dict[str, Any], version: Optional[int] = None) -> bool:
+        """
+        Sets column values of the row and increments its version with UPDATE ... WHERE key [AND version] and commits.
+        Existence of the row is decided from count of matched rows.
+        :param key: primary key value (tuple for composite key)
+        :param values: column values (version among them is ignored)
+        :param version: expected row version or None for unconditional update
+        :return: False if there is no object with such key
+        :raise VersionConflict: row version differs from expected one
+        """
+        version_column = getattr(self._domain_type, self._version_column)
+        values = {name: value for name, value in values.items() if name != self._version_column}
+        values[self._version_column] = version_column + 1
+        try:
+            rowcount = self._session.query(self._domain_type).filter(*self._key_criteria(key, version)) \
+                .update(values, synchronize_session=False)
+            if rowcount == 0 and version is not None:
+                self._check_version_conflict(key)
+            self._commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        self._evict(key)
+        return rowcount > 0
+
+    @classmethod
+    def _drop_cache(cls) -> None:
+        """
+        Drops cached DTOs of domain type; extension point of DAOs which keep own caches.
+        """
+        cache = GeneralDAO._entity_cache
+        if cache is not None:
+            cache.clear(f"{cls._domain_type.__tablename__}:")
+
+    def _cache_key(self, key: object) -> str:
+        """
+        Builds entity cache key of object.
+        :param key: primary key value
+        :return: cache key
+        """
+        return f"{self._domain_type.__tablename__}:{key}"
+
+    def _evict(self, key: object) -> None:
+        """
+        Removes object (all objects when key is None) and DTOs embedding this domain type from entity cache
+        once the write is committed (see after_commit).
+        :param key: primary key value or None
+        """
+        if self._entity_cache is not None:
+            after_commit(self._session, ("evict", self._domain_type.__tablename__, key), partial(self._evict_now, key))
+
+    def _evict_now(self, key: object) -> None:
+        cache = self._entity_cache
+        if key is None:
+            cache.clear(self._cache_key(""))
+        else:
+            cache.delete(self._cache_key(key))
+        for table_name in self._embedding_tables():
+            cache.clear(f"{table_name}:")
+
+    def _embedding_tables(self) -> Set[str]:
+        """
+        Gets tables which DTOs embed objects of domain type, according to load profiles of all DAOs.
+        :return: set of table names
+        """
+        tables = set()
+        for dao_type in GeneralDAO._dao_types:
+            for path in dao_type._load_profile:
+                owner = dao_type._domain_type
+                for name in path.split("."):
+                    owner = getattr(owner, name).property.mapper.class_
+                if owner is self._domain_type:
+                    tables.add(dao_type._domain_type.__tablename__)
+        return tables
+
+    def _key_criteria(self, key: object, version: Optional[int] = None) -> List[object]:
+        """
+        Builds WHERE criteria for primary key value and, for conditional writes, row version.
+        :param key: primary key value (tuple for composite key)
+        :param version: expected row version or None
+        :return: list of criteria
+        """
+        mapper: Mapper = inspect(self._domain_type)
+        values = key if isinstance(key, (tuple, list)) else (key,)
+        criteria = [column == value for column, value in zip(mapper.primary_key, values)]
+        if version is not None:
+            criteria.append(getattr(self._domain_type, self._version_column) == version)
+        return criteria
+
+    def _check_version_conflict(self, key: object) -> None:
+        """
+        Tells apart missing row from row with other version after conditional write matched no rows.
+        :param key: primary key value (tuple for composite key)
+        :raise VersionConflict: row exists, so its version differs from expected one
+        """
+        exists = self._session.query(self._domain_type).filter(*self._key_criteria(key)).with_entities(
+            getattr(self._domain_type, self._version_column)).first()
+        if exists is not None:
+            raise VersionConflict(key)
+
+    @staticmethod
+    def _column_values(mapper: Mapper, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Checks DTO row against mapped columns and converts ISO strings of datetime columns.
+        :param mapper: mapper of domain type
+        :param row: DTO dictionary
+        :return: dictionary of column values
+        :raise ValueError: row is not a dictionary of table columns
+        """
+        if not isinstance(row, dict) or not row.keys() <= set(mapper.columns.keys()):
+            raise ValueError(f"Row {row!r} does not match columns of {mapper.class_.__name__}")
+        values = {}
+        for name, value in row.items():
+            if isinstance(value, str) and mapper.columns[name].type.python_type is datetime:
+                value = datetime.fromisoformat(value)
+            values[name] = value
+        return values
+
+    @staticmethod
+    def _check_chunk(table: Table, chunk: List[Dict[str, Any]]) -> None:
+        """
+        Checks that rows of one multi-row INSERT have the same columns, including every required one.
+        :param table: table of domain type
+        :param chunk: dictionaries of column values
+        :raise ValueError: rows have different columns or lack a NOT NULL column without default
+        """
+        names = chunk[0].keys()
+        if any(row.keys() != names for row in chunk):
+            raise ValueError(f"Rows of {table.name} must have the same columns")
+        missing = [column.name for column in table.columns
+                   if not column.nullable and column.default is None and column.server_default is None
+                   and column is not table.autoincrement_column and column.name not in names]
+        if missing:
+            raise ValueError(f"Rows of {table.name} lack required columns: {', '.join(missing)}")
+
+    @staticmethod
+    def _as_datetime(value: object) -> datetime:
+        """
+        Converts ISO string from DTO to datetime.
+        :param value: datetime or ISO string
+        :return: datetime
+        :raise ValueError: value is not a datetime
+        """
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        if not isinstance(value, datetime):
+            raise ValueError(f"Expected datetime, got {value!r}")
+        return value
+
+    @staticmethod
+    def _key_of_row(row: Iterable[object]) -> object:
+        """
+        Gets primary key value (tuple for composite key) of result row.
+        :param row: primary key columns of row
+        :return: primary key value
+        """
+        key = tuple(row)
+        return key[0] if len(key) == 1 else list(key)
+
+    def _keyset_columns(self, list_query: Optional[ListQuery] = None) -> List[object]:
+        """
+        Gets columns which define the order of pages: requested (or declared) sort columns and primary key.
+        :param list_query: list query with sort order or None
+        :return: list of table columns
+        :raise ValueError: unknown sort column
+        """
+        mapper: Mapper = inspect(self._domain_type)
+        if list_query is not None and list_query.sort:
+            columns = [self._mapped_column(name) for name, _ in list_query.sort]
+        else:
+            columns = [mapper.columns[name] for name in self._sort_columns]
+        return columns + [column for column in mapper.primary_key if column not in columns]
+
+    @staticmethod
+    def _keyset_descending(list_query: Optional[ListQuery]) -> bool:
+        """
+        Gets direction of pages.
+        :param list_query: list query with sort order or None
+        :return: whether pages are in descending order
+        :raise ValueError: sort columns have different directions
+        """
+        directions = {descending for _, descending in list_query.sort} if list_query is not None else set()
+        if len(directions) > 1:
+            raise ValueError("Pages cannot be sorted in different directions")
+        return directions.pop() if directions else False
+
+    def _encode_cursor(self, obj: object, columns: List[object]) -> str:
+        """
+        Puts keyset values of object into opaque cursor.
+        :param obj: last object of the page
+        :param columns: keyset columns
+        :return: url-safe cursor
+        """
+        mapper: Mapper = inspect(self._domain_type)
+        values = [getattr(obj, mapper.get_property_by_column(column).key) for column in columns]
+        raw = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str, columns: List[object]) -> List[object]:
+        """
+        Extracts keyset values from opaque cursor.
+        :param cursor: cursor of the previous page
+        :param columns: keyset columns
+        :return: list of keyset values
+        :raise ValueError: cursor is malformed
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(columns):
+                raise ValueError("wrong count of keyset values")
+            return [datetime.fromisoformat(value) if column.type.python_type is datetime else value
+                    for column, value in zip(columns, values)]
+        except (ValueError, TypeError) as error:
+            raise ValueError(f"Malformed cursor {cursor!r}") from error
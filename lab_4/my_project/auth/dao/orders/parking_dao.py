@@ -1,6 +1,134 @@
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import exists, func
+from sqlalchemy.orm import joinedload
+from my_project.auth.dao.availability_index import ParkingAvailability, Place, availability_index
 from my_project.auth.dao.general_dao import GeneralDAO
+from my_project.auth.domain.orders.occupancy_rollup import OccupancyRollup
+from my_project.auth.domain.orders.parking_network import ParkingNetwork
 from my_project.auth.domain.orders.parking import Parking
+from my_project.auth.domain.orders.parking_place import ParkingPlace
+from my_project.auth.domain.orders.parking_place_history import ParkingPlaceHistory
+from my_project.auth.domain.orders.reservations import Reservations
+from my_project.routing_session import has_uncommitted_writes, replica_read
 
 
 class ParkingDAO(GeneralDAO):
     _domain_type = Parking
+
+    def find_free_places(self, parking_id: int, start: datetime, stop: datetime) -> Optional[List[Place]]:
+        """
+        Gets places of parking without reservations overlapping [start, stop).
+        Served from availability index, or by SQL query when the index is disabled
+        or the session has uncommitted writes (of an atomic batch).
+        :param parking_id: id of parking
+        :param start: start of period
+        :param stop: end of period
+        :return: tuples of place id, row and row_place ordered by id, or None if there is no such parking
+        """
+        if not availability_index.enabled or has_uncommitted_writes(self._session):
+            return self._find_free_places_sql(parking_id, start, stop)
+        availability = availability_index.get(parking_id)
+        if availability is None:
+            generation = availability_index.generation
+            availability = self._load_availability(parking_id)
+            if availability is None:
+                return None
+            availability_index.put(parking_id, availability, generation)
+        return availability.free_places(start, stop)
+
+    @replica_read
+    def find_snapshot(self, parking_id: int,
+                      at: datetime) -> Optional[Tuple[Parking, List[ParkingPlace], List[Reservations]]]:
+        """
+        Gets everything shown on parking screen with three queries whatever the count of places:
+        parking with address and network (with its owner), places with status, reservations active at the moment.
+        :param parking_id: id of parking
+        :param at: moment of active reservations
+        :return: parking, its places ordered by row and row place, and active reservations ordered by start,
+            or None if there is no such parking
+        """
+        parking = self._session.query(Parking).options(
+            joinedload(Parking.address),
+            joinedload(Parking.parking_network).joinedload(ParkingNetwork.owner),
+        ).filter(Parking.id == parking_id).one_or_none()
+        if parking is None:
+            return None
+        places = self._session.query(ParkingPlace).options(joinedload(ParkingPlace.status)) \
+            .filter(ParkingPlace.parking_id == parking_id) \
+            .order_by(ParkingPlace.row, ParkingPlace.row_place, ParkingPlace.id).all()
+        reservations = self._session.query(Reservations) \
+            .join(ParkingPlace, ParkingPlace.id == Reservations.parking_place_id) \
+            .filter(ParkingPlace.parking_id == parking_id,
+                    Reservations.reservation_start <= at,
+                    Reservations.reservation_stop > at) \
+            .order_by(Reservations.reservation_start, Reservations.id).all()
+        return parking, places, reservations
+
+    def _load_availability(self, parking_id: int) -> Optional[ParkingAvailability]:
+        """
+        Reads places of parking and their reservations from primary database.
+        :param parking_id: id of parking
+        :return: availability or None if there is no such parking
+        """
+        if self._session.query(Parking.id).filter(Parking.id == parking_id).first() is None:
+            return None
+        places = self._session.query(ParkingPlace.id, ParkingPlace.row, ParkingPlace.row_place) \
+            .filter(ParkingPlace.parking_id == parking_id)
+        reservations = self._session.query(
+            Reservations.parking_place_id, Reservations.reservation_start, Reservations.reservation_stop
+        ).join(ParkingPlace, ParkingPlace.id == Reservations.parking_place_id) \
+            .filter(ParkingPlace.parking_id == parking_id)
+        return ParkingAvailability((tuple(row) for row in places), (tuple(row) for row in reservations))
+
+    @replica_read
+    def _find_free_places_sql(self, parking_id: int, start: datetime, stop: datetime) -> Optional[List[Place]]:
+        if self._session.query(Parking.id).filter(Parking.id == parking_id).first() is None:
+            return None
+        overlapping = exists().where(
+            Reservations.parking_place_id == ParkingPlace.id,
+            Reservations.reservation_start < stop,
+            Reservations.reservation_stop > start,
+        )
+        return [tuple(row) for row in self._session.query(ParkingPlace.id, ParkingPlace.row, ParkingPlace.row_place)
+                .filter(ParkingPlace.parking_id == parking_id, ~overlapping)
+                .order_by(ParkingPlace.id)]
+
+    @replica_read
+    def find_occupancy_intervals(self, parking_id: int, start: datetime,
+                                 stop: datetime) -> Optional[Tuple[int, Iterator[Tuple[datetime, datetime]]]]:
+        """
+        Gets count of places of parking and occupation intervals of its places overlapping [start, stop).
+        :param parking_id: id of parking
+        :param start: start of period
+        :param stop: end of period
+        :return: count of places and iterator of (occupied_from, occupied_to), or None if there is no such parking
+        """
+        if self._session.query(Parking.id).filter(Parking.id == parking_id).first() is None:
+            return None
+        place_count = self._session.query(func.count(ParkingPlace.id)) \
+            .filter(ParkingPlace.parking_id == parking_id).scalar()
+        intervals = self._session.query(ParkingPlaceHistory.occupied_from, ParkingPlaceHistory.occupied_to) \
+            .join(ParkingPlace, ParkingPlace.id == ParkingPlaceHistory.parking_place_id) \
+            .filter(ParkingPlace.parking_id == parking_id,
+                    ParkingPlaceHistory.occupied_from < stop,
+                    ParkingPlaceHistory.occupied_to > start) \
+            .yield_per(self._stream_batch_size)
+        return place_count, iter(intervals)
+
+    @replica_read
+    def find_hourly_occupancy(self, parking_id: int, start: datetime, stop: datetime) -> Optional[List[OccupancyRollup]]:
+        """
+        Gets hourly occupancy rollup of parking for hours starting in [start, stop).
+        :param parking_id: id of parking
+        :param start: start of period
+        :param stop: end of period
+        :return: rollup rows ordered by hour, or None if there is no such parking
+        """
+        if self._session.query(Parking.id).filter(Parking.id == parking_id).first() is None:
+            return None
+        return self._session.query(OccupancyRollup).filter(
+            OccupancyRollup.parking_id == parking_id,
+            OccupancyRollup.hour >= start,
+            OccupancyRollup.hour < stop,
+        ).order_by(OccupancyRollup.hour).all()
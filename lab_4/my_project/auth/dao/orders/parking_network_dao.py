@@ -4,3 +4,5 @@ from my_project.auth.domain.orders.parking_network import ParkingNetwork
 
 class ParkingNetworkDAO(GeneralDAO):
     _domain_type = ParkingNetwork
+    _load_profile = {"owner": "joined"}
+    _dto_attributes = {"owner_id": "owner"}
@@ -1,6 +1,7 @@
+from my_project.auth.dao.availability_index import AvailabilityWrites
 from my_project.auth.dao.general_dao import GeneralDAO
 from my_project.auth.domain.orders.parking_place import ParkingPlace
 
 
-class ParkingPlaceDAO(GeneralDAO):
+class ParkingPlaceDAO(AvailabilityWrites, GeneralDAO):
     _domain_type = ParkingPlace
@@ -1,6 +1,237 @@
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from my_project.auth.dao.general_dao import GeneralDAO
+from my_project.auth.domain.orders.occupancy_rollup import OccupancyRollup
+from my_project.auth.domain.orders.parking_place import ParkingPlace
 from my_project.auth.domain.orders.parking_place_history import ParkingPlaceHistory
 
+PENDING_ROLLUP = "occupancy_rollup_pending"
+HOUR = timedelta(hours=1)
+ROLLUP_COUNTERS = ("occupied_minutes", "entries", "exits")
+
+Period = Tuple[int, datetime, datetime, int]  # parking_place_id, occupied_from, occupied_to, sign
+Deltas = Dict[Tuple[int, datetime], List[float]]  # (parking_id, hour) -> occupied minutes, entries, exits
+
+
+def add_deltas(deltas: Deltas, key: int, occupied_from: datetime, occupied_to: datetime, sign: int) -> None:
+    """
+    Adds occupation period to rollup deltas: minutes split by hours, entry at start hour and exit at stop hour.
+    :param deltas: accumulated deltas
+    :param key: id of parking (or of parking place, for deltas of PendingRollup)
+    :param occupied_from: period start
+    :param occupied_to: period stop
+    :param sign: 1 to add period, -1 to subtract it
+    """
+    hour = occupied_from.replace(minute=0, second=0, microsecond=0)
+    deltas.setdefault((key, hour), [0.0, 0, 0])[1] += sign
+    while hour < occupied_to:
+        minutes = (min(hour + HOUR, occupied_to) - max(hour, occupied_from)).total_seconds() / 60
+        deltas.setdefault((key, hour), [0.0, 0, 0])[0] += sign * minutes
+        hour += HOUR
+    stop_hour = occupied_to.replace(minute=0, second=0, microsecond=0)
+    deltas.setdefault((key, stop_hour), [0.0, 0, 0])[2] += sign
+
+
+class PendingRollup:
+    """
+    Changes of history made in the current transaction which are not yet applied to occupancy_rollup.
+    Periods are folded into deltas of parking places by hour as they are written,
+    so memory depends on count of touched hours, not on count of written rows.
+    """
+
+    def __init__(self) -> None:
+        self.deltas: Deltas = {}  # (parking_place_id, hour) -> occupied minutes, entries, exits
+        self.keys: List[int] = []
+        self.cleared = False
+
+    def add_period(self, place_id: int, occupied_from: object, occupied_to: object, sign: int) -> None:
+        add_deltas(self.deltas, place_id, GeneralDAO._as_datetime(occupied_from),
+                   GeneralDAO._as_datetime(occupied_to), sign)
+
+    def track_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            self.add_period(row["parking_place_id"], row["occupied_from"], row["occupied_to"], 1)
+        except (KeyError, TypeError, ValueError):
+            pass  # malformed row is rejected by create_bulk itself
+        return row
+
 
 class ParkingPlaceHistoryDAO(GeneralDAO):
+    """
+    Every write of history also updates hourly occupancy_rollup of the parking in the same transaction.
+    """
     _domain_type = ParkingPlaceHistory
+    _export_time_column = "occupied_from"
+    _export_parking_path = "parking_place.parking_id"
+    _rollup_chunk_size = 1000
+
+    def create(self, obj: ParkingPlaceHistory) -> ParkingPlaceHistory:
+        self._check_places({obj.parking_place_id})
+        self._with_datetimes(obj)
+        self._begin_rollup().add_period(obj.parking_place_id, obj.occupied_from, obj.occupied_to, 1)
+        return super().create(obj)
+
+    def create_all(self, obj_list: List[ParkingPlaceHistory]) -> List[ParkingPlaceHistory]:
+        self._check_places({obj.parking_place_id for obj in obj_list})
+        pending = self._begin_rollup()
+        for obj in obj_list:
+            self._with_datetimes(obj)
+            pending.add_period(obj.parking_place_id, obj.occupied_from, obj.occupied_to, 1)
+        return super().create_all(obj_list)
+
+    def create_bulk(self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                    return_ids: bool = False) -> Tuple[int, List[object]]:
+        pending = self._begin_rollup()
+        return super().create_bulk((pending.track_row(row) for row in rows), chunk_size, return_ids)
+
+    def delete(self, key: int, version: Optional[int] = None) -> bool:
+        self._begin_rollup()
+        self._track_key(key)
+        return super().delete(key, version)
+
+    def delete_all(self) -> None:
+        self._begin_rollup().cleared = True
+        super().delete_all()
+
+    def rebuild_rollup(self, parking_id: Optional[int] = None) -> int:
+        """
+        Recomputes occupancy_rollup from whole history (of one parking or of all parkings) in one transaction.
+        History written by other processes while rebuilding may be missed; run when history is not written.
+        :param parking_id: id of parking or None for all parkings
+        :return: count of rollup rows
+        """
+        try:
+            rollups = self._session.query(OccupancyRollup)
+            histories = self._session.query(
+                ParkingPlace.parking_id, ParkingPlaceHistory.occupied_from, ParkingPlaceHistory.occupied_to
+            ).join(ParkingPlace, ParkingPlace.id == ParkingPlaceHistory.parking_place_id)
+            if parking_id is not None:
+                rollups = rollups.filter(OccupancyRollup.parking_id == parking_id)
+                histories = histories.filter(ParkingPlace.parking_id == parking_id)
+            rollups.delete(synchronize_session=False)
+            deltas: Deltas = {}
+            for place_parking_id, occupied_from, occupied_to in histories.yield_per(self._stream_batch_size):
+                add_deltas(deltas, place_parking_id, occupied_from, occupied_to, 1)
+            self._upsert_rollup(deltas)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return len(deltas)
+
+    def _update_values(self, key: object, values: Dict[str, Any], version: Optional[int] = None) -> bool:
+        values = {name: self._as_datetime(value) if name in ("occupied_from", "occupied_to") else value
+                  for name, value in values.items()}
+        self._begin_rollup()
+        self._track_key(key)
+        return super()._update_values(key, values, version)
+
+    def _commit(self) -> None:
+        pending = self._session.info.pop(PENDING_ROLLUP, None)
+        if pending is not None:
+            self._apply_rollup(pending)
+        super()._commit()
+
+    def _with_datetimes(self, obj: ParkingPlaceHistory) -> ParkingPlaceHistory:
+        obj.occupied_from = self._as_datetime(obj.occupied_from)
+        obj.occupied_to = self._as_datetime(obj.occupied_to)
+        return obj
+
+    def _check_places(self, place_ids: Set[int]) -> None:
+        """
+        Rejects history of parking places which do not exist (not every database enforces the foreign key).
+        :param place_ids: ids of parking places of new history rows
+        :raise ValueError: some parking place does not exist
+        """
+        found = {place_id for place_id, in self._session.query(ParkingPlace.id).filter(ParkingPlace.id.in_(place_ids))}
+        if place_ids - found:
+            raise ValueError(f"Parking places {sorted(place_ids - found)} do not exist")
+
+    def _begin_rollup(self) -> PendingRollup:
+        """
+        Starts collecting history changes of the current write method.
+        :return: collector of changes
+        """
+        pending = PendingRollup()
+        self._session.info[PENDING_ROLLUP] = pending
+        return pending
+
+    def _track_key(self, key: int) -> None:
+        """
+        Locks history row which is going to be updated or deleted and subtracts its old period.
+        Period of the row is added back (with new values) when the transaction is committed.
+        :param key: integer key (surrogate primary key)
+        """
+        pending = self._session.info[PENDING_ROLLUP]
+        for period in self._periods_of_keys([key], -1, lock=True):
+            pending.add_period(*period)
+        pending.keys.append(key)
+
+    def _periods_of_keys(self, keys: List[int], sign: int, lock: bool = False) -> List[Period]:
+        query = self._session.query(
+            ParkingPlaceHistory.parking_place_id, ParkingPlaceHistory.occupied_from, ParkingPlaceHistory.occupied_to
+        ).filter(ParkingPlaceHistory.id.in_(keys))
+        if lock:
+            query = query.with_for_update()
+        return [(place_id, occupied_from, occupied_to, sign) for place_id, occupied_from, occupied_to in query]
+
+    def _apply_rollup(self, pending: PendingRollup) -> None:
+        """
+        Applies history changes of the transaction to occupancy_rollup.
+        :param pending: collected changes
+        :raise ValueError: history refers to parking place which does not exist (rows of bulk insert or update)
+        """
+        if pending.cleared:
+            self._session.query(OccupancyRollup).delete(synchronize_session=False)
+            return
+        for period in self._periods_of_keys(pending.keys, 1) if pending.keys else ():
+            pending.add_period(*period)
+        if not pending.deltas:
+            return
+        place_ids = {place_id for place_id, _ in pending.deltas}
+        parking_of_place = dict(self._session.query(ParkingPlace.id, ParkingPlace.parking_id)
+                                .filter(ParkingPlace.id.in_(place_ids)))
+        if place_ids - parking_of_place.keys():
+            raise ValueError(f"Parking places {sorted(place_ids - parking_of_place.keys())} do not exist")
+        deltas: Deltas = {}
+        for (place_id, hour), counters in pending.deltas.items():
+            totals = deltas.setdefault((parking_of_place[place_id], hour), [0.0, 0, 0])
+            for index, value in enumerate(counters):
+                totals[index] += value
+        self._upsert_rollup(deltas)
+
+    def _upsert_rollup(self, deltas: Deltas) -> None:
+        """
+        Adds deltas to counters of occupancy_rollup rows, creating missing rows.
+        :param deltas: deltas keyed by parking id and hour
+        """
+        table = OccupancyRollup.__table__
+        dialect = self._session.get_bind().dialect.name
+        rows = iter({"parking_id": parking_id, "hour": hour, "occupied_minutes": minutes,
+                     "entries": entries, "exits": exits}
+                    for (parking_id, hour), (minutes, entries, exits) in deltas.items())
+        while chunk := list(islice(rows, self._rollup_chunk_size)):
+            if dialect == "mysql":
+                statement = mysql.insert(table)
+                statement = statement.on_duplicate_key_update(
+                    {name: table.c[name] + statement.inserted[name] for name in ROLLUP_COUNTERS})
+            elif dialect in ("sqlite", "postgresql"):
+                statement = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+                statement = statement.on_conflict_do_update(
+                    index_elements=[table.c.parking_id, table.c.hour],
+                    set_={name: table.c[name] + statement.excluded[name] for name in ROLLUP_COUNTERS})
+            else:
+                self._upsert_rollup_rows(chunk)
+                continue
+            self._session.execute(statement, chunk)
+
+    def _upsert_rollup_rows(self, rows: List[Dict[str, Any]]) -> None:
+        table = OccupancyRollup.__table__
+        for row in rows:
+            key = (table.c.parking_id == row["parking_id"]) & (table.c.hour == row["hour"])
+            updated = self._session.execute(table.update().where(key).values(
+                {name: table.c[name] + row[name] for name in ROLLUP_COUNTERS}))
+            if updated.rowcount == 0:
+                self._session.execute(table.insert().values(row))
@@ -1,6 +1,129 @@
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, Optional
+from my_project.auth.dao.availability_index import AvailabilityWrites, availability_index
 from my_project.auth.dao.general_dao import GeneralDAO
+from my_project.auth.domain.orders.parking_place import ParkingPlace
 from my_project.auth.domain.orders.reservations import Reservations
+from my_project.routing_session import after_commit
 
+PERIOD_COLUMNS = ("reservation_start", "reservation_stop")
 
-class ReservationsDAO(GeneralDAO):
+
+class ReservationConflict(Exception):
+    """
+    Raised when reservation overlaps existing reservation of the same parking place.
+    """
+
+    def __init__(self, conflict_id: int) -> None:
+        super().__init__(f"Parking place is already reserved by reservation {conflict_id}")
+        self.conflict_id = conflict_id
+
+
+class ReservationsDAO(AvailabilityWrites, GeneralDAO):
     _domain_type = Reservations
+    _export_time_column = "reservation_start"
+    _export_parking_path = "parking_place.parking_id"
+
+    def create(self, reservation: Reservations) -> Reservations:
+        """
+        Creates reservation when its parking place is free for the whole period.
+        Row of parking place is locked (SELECT ... FOR UPDATE) in the same transaction,
+        so concurrent reservations of one place are serialized between overlap check and INSERT.
+        :param reservation: reservation to create in Database
+        :return: created reservation
+        :raise ValueError: period is empty or parking place does not exist
+        :raise ReservationConflict: period overlaps existing reservation
+        """
+        start = self._as_datetime(reservation.reservation_start)
+        stop = self._as_datetime(reservation.reservation_stop)
+        if start >= stop:
+            raise ValueError("reservation_start must be before reservation_stop")
+        reservation.reservation_start, reservation.reservation_stop = start, stop
+        try:
+            self._lock_place(reservation.parking_place_id)
+            conflict_id = self.find_overlapping_id(reservation.parking_place_id, start, stop)
+            if conflict_id is not None:
+                raise ReservationConflict(conflict_id)
+            self._session.add(reservation)
+            self._commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        after_commit(self._session, ("reservation", reservation.id),
+                     partial(availability_index.add_reservation, reservation.parking_place_id, start, stop))
+        return reservation
+
+    def find_overlapping_id(self, parking_place_id: int, start: datetime, stop: datetime,
+                            exclude_id: Optional[int] = None) -> Optional[int]:
+        """
+        Gets id of any reservation of parking place overlapping [start, stop).
+        Range scan of ix_reservations_parking_place_id_reservation_start; reads with shared lock,
+        so the latest committed reservations are seen inside a running transaction.
+        :param parking_place_id: id of parking place
+        :param start: start of period
+        :param stop: end of period
+        :param exclude_id: id of reservation which is not checked (the one being updated) or None
+        :return: id of overlapping reservation or None
+        """
+        query = self._session.query(Reservations.id).filter(
+            Reservations.parking_place_id == parking_place_id,
+            Reservations.reservation_start < stop,
+            Reservations.reservation_stop > start,
+        )
+        if exclude_id is not None:
+            query = query.filter(Reservations.id != exclude_id)
+        row = query.with_for_update(read=True).first()
+        return None if row is None else row[0]
+
+    def _update_values(self, key: object, values: Dict[str, Any], version: Optional[int] = None) -> bool:
+        """
+        Updates reservation (update and patch) when its new period is free on its new parking place.
+        Parking place row is locked first, as in create, so the check and the UPDATE are serialized
+        with concurrent reservations of the place.
+        :raise ValueError: period is empty or parking place does not exist
+        :raise ReservationConflict: period overlaps other reservation of the parking place
+        """
+        values = {name: self._as_datetime(value) if name in PERIOD_COLUMNS else value for name, value in values.items()}
+        if not values.keys() & {"parking_place_id", *PERIOD_COLUMNS}:
+            return super()._update_values(key, values, version)
+        try:
+            current, locked_place_id = self._current_period(key), None
+            while current is not None:
+                place_id = values.get("parking_place_id", current.parking_place_id)
+                if place_id == locked_place_id:
+                    break
+                self._lock_place(place_id)
+                locked_place_id, current = place_id, self._current_period(key)
+            if current is not None:
+                start = values.get("reservation_start", current.reservation_start)
+                stop = values.get("reservation_stop", current.reservation_stop)
+                if start >= stop:
+                    raise ValueError("reservation_start must be before reservation_stop")
+                conflict_id = self.find_overlapping_id(locked_place_id, start, stop, exclude_id=key)
+                if conflict_id is not None:
+                    raise ReservationConflict(conflict_id)
+        except Exception:
+            self._session.rollback()
+            raise
+        return super()._update_values(key, values, version)
+
+    def _current_period(self, key: object) -> Optional[object]:
+        """
+        Reads parking place and period of reservation (repeated once its parking place is locked).
+        :param key: id of reservation
+        :return: row with parking_place_id, reservation_start and reservation_stop or None
+        """
+        return self._session.query(Reservations.parking_place_id, Reservations.reservation_start,
+                                   Reservations.reservation_stop).filter(Reservations.id == key).one_or_none()
+
+    def _lock_place(self, parking_place_id: int) -> None:
+        """
+        Locks row of parking place (SELECT ... FOR UPDATE) until the end of transaction.
+        :param parking_place_id: id of parking place
+        :raise ValueError: parking place does not exist
+        """
+        place = self._session.query(ParkingPlace.id).filter(ParkingPlace.id == parking_place_id) \
+            .with_for_update().one_or_none()
+        if place is None:
+            raise ValueError(f"Parking place {parking_place_id} does not exist")
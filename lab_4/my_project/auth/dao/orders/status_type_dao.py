@@ -1,6 +1,10 @@
-from my_project.auth.dao.general_dao import GeneralDAO
+from typing import List
+from my_project.auth.dao.cached_dao import CachedDAO
 from my_project.auth.domain.orders.status_type import StatusType
 
 
-class StatusTypeDAO(GeneralDAO):
+class StatusTypeDAO(CachedDAO):
     _domain_type = StatusType
+
+    def find_by_type(self, type_name: str) -> List[StatusType]:
+        return [status_type for status_type in self.find_all() if status_type.type == type_name]
@@ -1,6 +1,10 @@
-from my_project.auth.dao.general_dao import GeneralDAO
+from typing import List
+from my_project.auth.dao.cached_dao import CachedDAO
 from my_project.auth.domain.orders.type_of_voucher import TypeOfVoucher
 
 
-class TypeOfVoucherDAO(GeneralDAO):
+class TypeOfVoucherDAO(CachedDAO):
     _domain_type = TypeOfVoucher
+
+    def find_by_type(self, type_name: str) -> List[TypeOfVoucher]:
+        return [type_of_voucher for type_of_voucher in self.find_all() if type_of_voucher.type == type_name]
@@ -1,23 +1,30 @@
-from typing import List
+from typing import List, Optional
 from my_project.auth.dao.general_dao import GeneralDAO
 from my_project.auth.domain.orders.user import User
+from my_project.list_query import ListQuery
+from my_project.routing_session import replica_read
 
 
 class UserDAO(GeneralDAO):
     _domain_type = User
+    _load_profile = {"user_type": "joined"}
 
     def create(self, user: User) -> None:
         self._session.add(user)
-        self._session.commit()
+        self._commit()
 
-    def find_all(self) -> List[User]:
-        return self._session.query(User).all()
+    @replica_read
+    def find_all(self, fields: Optional[List[str]] = None, list_query: Optional[ListQuery] = None) -> List[User]:
+        return self._ordered_query(fields, list_query).all()
 
+    @replica_read
     def find_by_email(self, email: str) -> List[User]:
-        return self._session.query(User).filter(User.email == email).order_by(User.email).all()  # reviewed
+        return self._query().filter(User.email == email).all()
 
+    @replica_read
     def find_by_name(self, name: str) -> List[User]:
-        return self._session.query(User).filter(User.name == name).order_by(User.name).all()  # reviewed
+        return self._query().filter(User.name == name).all()
 
+    @replica_read
     def find_by_surname(self, surname: str):
-        return self._session.query(User).filter_by(surname=surname).all()
+        return self._query().filter_by(surname=surname).all()
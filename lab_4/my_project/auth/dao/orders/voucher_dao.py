@@ -4,3 +4,5 @@ from my_project.auth.domain.orders.voucher import Voucher
 
 class VoucherDAO(GeneralDAO):
     _domain_type = Voucher
+    _export_time_column = "issued_time"
+    _export_parking_path = "parking_id"
@@ -0,0 +1,141 @@
+"""
+Metrics of database connection pool collected with pool events.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+    Counters of connection pool of one engine (bind) in the current process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._engine = None
+        self.connects = 0
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.invalidations = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.waits = 0
+
+    def install(self, engine: Engine) -> None:
+        """
+        Subscribes to events of engine pool and makes MeteredQueuePool of the engine record its checkout latency.
+        :param engine: SQLAlchemy engine
+        """
+        self._engine = engine
+        if isinstance(engine.pool, MeteredQueuePool):
+            engine.pool.metrics = self
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        Records time spent waiting for connection checkout.
+        :param seconds: checkout latency
+        """
+        with self._lock:
+            self.waits += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Gets current state of pool and accumulated counters.
+        :return: dictionary of metrics
+        """
+        pool = self._engine.pool if self._engine is not None else None
+        state = {}
+        if isinstance(pool, QueuePool):
+            state = {
+                "size": pool.size(),
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        with self._lock:
+            return {
+                **state,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "invalidations": self.invalidations,
+                "checkout_wait_avg_ms": 1000 * self.wait_total / self.waits if self.waits else None,
+                "checkout_wait_max_ms": 1000 * self.wait_max,
+            }
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        # the checked out connection is already counted, so it is an overflow one when more are out than pool size
+        pool = self._engine.pool
+        overflow = isinstance(pool, QueuePool) and pool.checkedout() > pool.size()
+        with self._lock:
+            self.checkouts += 1
+            if overflow:
+                self.overflow_checkouts += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+
+class PoolMetricsRegistry:
+    """
+    Pool metrics of every engine of the application, labeled by bind ("primary" or key of replica bind).
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, PoolMetrics] = {}
+
+    def install(self, engine: Engine, bind: str) -> None:
+        """
+        Collects metrics of pool of the engine under the bind label.
+        :param engine: SQLAlchemy engine
+        :param bind: label of the engine
+        """
+        metrics = PoolMetrics()
+        metrics.install(engine)
+        self._metrics[bind] = metrics
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Gets metrics of pools of all engines.
+        :return: dictionary of metrics by bind label
+        """
+        return {bind: metrics.snapshot() for bind, metrics in self._metrics.items()}
+
+
+pool_metrics = PoolMetricsRegistry()
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    QueuePool which records checkout latency into PoolMetrics of its engine (see PoolMetrics.install).
+    """
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self) -> "MeteredQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
@@ -12,5 +12,7 @@ from my_project.auth.domain.orders.owner import Owner
 from my_project.auth.domain.orders.parking_network import ParkingNetwork
 from my_project.auth.domain.orders.type_of_voucher import TypeOfVoucher
 from my_project.auth.domain.orders.voucher import Voucher
+from my_project.auth.domain.orders.occupancy_rollup import OccupancyRollup
 
 
+from my_project.auth.domain.orders.table_change import TableChange
@@ -12,6 +12,7 @@ class Address(db.Model, IDto):
     street = db.Column(db.String(100), nullable=False)
     number = db.Column(db.Integer, nullable=False)
     index = db.Column(db.Integer, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     parking = relationship('Parking', back_populates='address', uselist=False)
 
@@ -13,6 +13,7 @@ class Cars(db.Model, IDto):
     car_brand = db.Column(db.String(30), nullable=False)
     car_model = db.Column(db.String(30), nullable=False)
     car_number = db.Column(db.String(30), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     user_car_associations = relationship('UserCarId', back_populates='car')
     reservation = relationship('Reservations', back_populates='car', uselist=False)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from typing import Dict, Any
+from sqlalchemy import ForeignKey
+from my_project import db
+from my_project.auth.domain.i_dto import IDto
+
+
+class OccupancyRollup(db.Model, IDto):
+    """
+    Hourly occupancy of parking aggregated from parking_place_history.
+    Maintained by ParkingPlaceHistoryDAO; rebuilt with `flask backfill-occupancy-rollup`.
+    """
+    __tablename__ = "occupancy_rollup"
+
+    parking_id = db.Column(db.Integer, ForeignKey('parking.id'), primary_key=True)
+    hour = db.Column(db.DateTime, primary_key=True)
+    occupied_minutes = db.Column(db.Float, nullable=False, default=0)
+    entries = db.Column(db.Integer, nullable=False, default=0)
+    exits = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"OccupancyRollup({self.parking_id}, {self.hour}, {self.occupied_minutes}, {self.entries}, {self.exits})"
+
+    def put_into_dto(self) -> Dict[str, Any]:
+        return {
+            "parking_id": self.parking_id,
+            "hour": self.hour,
+            "occupied_minutes": self.occupied_minutes,
+            "entries": self.entries,
+            "exits": self.exits
+        }
+
+    @staticmethod
+    def create_from_dto(dto_dict: Dict[str, Any]) -> OccupancyRollup:
+        obj = OccupancyRollup(**dto_dict)
+        return obj
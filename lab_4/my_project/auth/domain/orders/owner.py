@@ -9,10 +9,11 @@ class Owner(db.Model, IDto):
     __tablename__ = "owner"
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    name = db.Column(db.String(50), nullable=False)
+    name = db.Column(db.String(50), nullable=False, index=True)
     surname = db.Column(db.String(50), nullable=False)
     age = db.Column(db.Integer, nullable=False)
     password = db.Column(db.String(50), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     parking_networks = relationship('ParkingNetwork', back_populates='owner')
 
@@ -12,6 +12,7 @@ class ParkingNetwork(db.Model, IDto):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     owner_id = db.Column(db.Integer, ForeignKey('owner.id'), nullable=False)
     parking_amount = db.Column(db.Integer, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     owner = relationship('Owner', back_populates='parking_networks')
     parkings = relationship('Parking', back_populates='parking_network')
@@ -14,6 +14,7 @@ class ParkingPlace(db.Model, IDto):
     status_id = db.Column(db.Integer, ForeignKey('status_type.id'), nullable=False)
     row = db.Column(db.Integer, nullable=False)
     row_place = db.Column(db.Integer, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     parking = relationship('Parking', back_populates='parking_places')
     status = relationship('StatusType', back_populates='parking_places')
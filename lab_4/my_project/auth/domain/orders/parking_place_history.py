@@ -8,12 +8,16 @@ from my_project.auth.domain.i_dto import IDto
 
 class ParkingPlaceHistory(db.Model, IDto):
     __tablename__ = "parking_place_history"
+    __table_args__ = (
+        db.Index("ix_parking_place_history_parking_place_id_occupied_from", "parking_place_id", "occupied_from"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     parking_place_id = db.Column(db.Integer, ForeignKey('parking_place.id'), nullable=False)
     car_id = db.Column(db.Integer, ForeignKey('cars.id'), nullable=False)
     occupied_from = db.Column(db.DateTime, nullable=False)
     occupied_to = db.Column(db.DateTime, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     parking_place = relationship('ParkingPlace', back_populates='histories')
     car = relationship('Cars', back_populates='history_records')
@@ -8,6 +8,9 @@ from my_project.auth.domain.i_dto import IDto
 
 class Reservations(db.Model, IDto):
     __tablename__ = "reservations"
+    __table_args__ = (
+        db.Index("ix_reservations_parking_place_id_reservation_start", "parking_place_id", "reservation_start"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, ForeignKey('user.id'), nullable=False)
@@ -15,6 +18,7 @@ class Reservations(db.Model, IDto):
     parking_place_id = db.Column(db.Integer, ForeignKey('parking_place.id'), nullable=False)
     reservation_start = db.Column(db.DateTime, nullable=False)
     reservation_stop = db.Column(db.DateTime, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     user = relationship('User', back_populates='reservations')
     car = relationship('Cars', back_populates='reservation', uselist=False)
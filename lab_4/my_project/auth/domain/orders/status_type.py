@@ -10,6 +10,7 @@ class StatusType(db.Model, IDto):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     type = db.Column(db.String(30), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     parking_places = relationship('ParkingPlace', back_populates='status')
 
@@ -0,0 +1,29 @@
+from __future__ import annotations
+from typing import Dict, Any
+from my_project import db
+from my_project.auth.domain.i_dto import IDto
+
+
+class TableChange(db.Model, IDto):
+    """
+    Count of committed DAO writes of a table, used as change marker of list ETags.
+    Maintained by GeneralDAO._commit in the transaction of the write.
+    """
+    __tablename__ = "table_change"
+
+    table_name = db.Column(db.String(64), primary_key=True)
+    changes = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"TableChange({self.table_name}, {self.changes})"
+
+    def put_into_dto(self) -> Dict[str, Any]:
+        return {
+            "table_name": self.table_name,
+            "changes": self.changes
+        }
+
+    @staticmethod
+    def create_from_dto(dto_dict: Dict[str, Any]) -> TableChange:
+        obj = TableChange(**dto_dict)
+        return obj
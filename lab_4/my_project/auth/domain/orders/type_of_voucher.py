@@ -10,6 +10,7 @@ class TypeOfVoucher(db.Model, IDto):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     type = db.Column(db.String(50), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     vouchers = relationship('Voucher', back_populates='type_of_voucher')
 
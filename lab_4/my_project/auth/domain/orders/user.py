@@ -11,9 +11,10 @@ class User(db.Model, IDto):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_type_id = Column(Integer, ForeignKey('user_type.id'), nullable=False)
-    name = db.Column(db.String(30), nullable=False)
-    surname = db.Column(db.String(30), nullable=False)
-    email = db.Column(db.String(30), nullable=False)
+    name = db.Column(db.String(30), nullable=False, index=True)
+    surname = db.Column(db.String(30), nullable=False, index=True)
+    email = db.Column(db.String(30), nullable=False, index=True)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     user_type = relationship('UserType', back_populates='users')
     user_car_associations = relationship('UserCarId', back_populates='user')
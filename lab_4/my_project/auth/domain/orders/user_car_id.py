@@ -13,6 +13,7 @@ class UserCarId(db.Model, IDto):
 
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
     car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     user = relationship('User', back_populates='user_car_associations')
     car = relationship('Cars', back_populates='user_car_associations')
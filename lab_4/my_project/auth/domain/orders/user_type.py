@@ -12,7 +12,8 @@ class UserType(db.Model, IDto):
     __tablename__ = "user_type"
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    type = db.Column(db.String(30), nullable=False)
+    type = db.Column(db.String(30), nullable=False, index=True)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     users = relationship('User', back_populates='user_type')
 
@@ -15,6 +15,7 @@ class Voucher(db.Model, IDto):
     parking_id = db.Column(db.Integer, ForeignKey('parking.id'), nullable=False)
     issued_time = db.Column(db.DateTime, nullable=False)
     car_id = db.Column(db.Integer, ForeignKey('cars.id'), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     user = relationship('User', back_populates='vouchers')
     car = relationship('Cars', back_populates='vouchers')
@@ -17,6 +17,8 @@ def register_routes(app: Flask) -> None:
     from .orders.type_of_voucher_route import type_of_voucher_bp
     from .orders.voucher_route import voucher_bp
     from .auth.login import auth_bp
+    from .internal.metrics import internal_bp
+    from .batch.batch_route import batch_bp
 
     app.register_blueprint(users_bp)
     app.register_blueprint(user_types_bp)
@@ -33,3 +35,5 @@ def register_routes(app: Flask) -> None:
     app.register_blueprint(type_of_voucher_bp)
     app.register_blueprint(voucher_bp)
     app.register_blueprint(auth_bp)
+    app.register_blueprint(internal_bp)
+    app.register_blueprint(batch_bp)
@@ -0,0 +1,35 @@
+"""
+JWT protection of endpoints shared by all blueprints.
+"""
+
+from functools import wraps
+from typing import Any, Callable
+
+import flask_jwt_extended
+from flask import current_app, request
+
+BATCH_JWT = "my_project.batch_jwt"
+
+
+def jwt_required(*args: Any, **kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Same as flask_jwt_extended.jwt_required, except for sub-requests of /batch.
+    A sub-request runs in the application context of the batch, so the JWT verified by the batch request
+    (get_jwt, get_jwt_identity) is already in place and the token is not decoded once more per sub-request.
+    Only in-process dispatch can mark a sub-request: the marker is a WSGI environ key, not a header.
+    :param args: positional arguments of flask_jwt_extended.jwt_required
+    :param kwargs: keyword arguments of flask_jwt_extended.jwt_required
+    :return: decorator of view function
+    """
+    def wrapper(fn: Callable[..., Any]) -> Callable[..., Any]:
+        protected = flask_jwt_extended.jwt_required(*args, **kwargs)(fn)
+
+        @wraps(fn)
+        def decorator(*fn_args: Any, **fn_kwargs: Any) -> Any:
+            if request.environ.get(BATCH_JWT) is None:
+                return protected(*fn_args, **fn_kwargs)
+            return current_app.ensure_sync(fn)(*fn_args, **fn_kwargs)
+
+        return decorator
+
+    return wrapper
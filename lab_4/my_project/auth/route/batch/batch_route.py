@@ -0,0 +1,181 @@
+"""
+Batch endpoint: many sub-requests to other blueprints in one HTTP request.
+"""
+
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import Blueprint, Response, abort, current_app, jsonify, make_response, request
+from flask_jwt_extended import get_jwt
+from werkzeug.test import EnvironBuilder
+
+from my_project import db
+from my_project.auth.route.authorization import BATCH_JWT, jwt_required
+from my_project.routing_session import deferred_commit
+
+batch_bp = Blueprint('batch', __name__, url_prefix='/batch')
+
+METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+RESPONSE_HEADERS = ("ETag", "Location")
+
+
+@batch_bp.post('')
+@jwt_required()
+def post_batch() -> Response:
+    """
+    Execute many requests in one
+    ---
+    tags:
+      - Batch
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          properties:
+            atomic:
+              type: boolean
+              example: true
+            requests:
+              type: array
+              items:
+                type: object
+                required:
+                  - path
+                properties:
+                  method:
+                    type: string
+                    example: "PATCH"
+                  path:
+                    type: string
+                    example: "/parking_places/7"
+                  headers:
+                    type: object
+                    example: {"If-Match": "\\"5f0c...\\""}
+                  body:
+                    type: object
+                    example: {"status_id": 2}
+    responses:
+      200:
+        description: Responses (status, headers, body) in order of requests
+      422:
+        description: Malformed batch, sub-request with own Authorization or more requests than BATCH_MAX_REQUESTS
+    """
+    content = request.get_json(silent=True)
+    if isinstance(content, list):
+        content = {"requests": content}
+    if not isinstance(content, dict):
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    operations = content.get("requests")
+    atomic = content.get("atomic", False)
+    if not _valid_operations(operations) or not isinstance(atomic, bool):
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    if atomic:
+        results, status = _run_atomic(operations)
+    else:
+        results, status = [_run(operation, rollback_on_error=True) for operation in operations], HTTPStatus.OK
+    return make_response(jsonify(results), status)
+
+
+def _valid_operations(operations: Any) -> bool:
+    """
+    Checks that sub-requests are well-formed, within BATCH_MAX_REQUESTS and do not target the batch endpoint.
+    Sub-requests run as the identity of the batch, so they may not set Authorization header.
+    :param operations: value of `requests` of the body
+    :return: whether sub-requests can be executed
+    """
+    if not isinstance(operations, list) or not operations \
+            or len(operations) > current_app.config["BATCH_MAX_REQUESTS"]:
+        return False
+    for operation in operations:
+        if not isinstance(operation, dict) or not isinstance(operation.get("path"), str):
+            return False
+        path = operation["path"]
+        if not path.startswith("/") or path.split("?")[0].rstrip("/") == batch_bp.url_prefix:
+            return False
+        if str(operation.get("method", "GET")).upper() not in METHODS:
+            return False
+        headers = operation.get("headers", {})
+        if not isinstance(headers, dict) or any(str(name).lower() == "authorization" for name in headers):
+            return False
+    return True
+
+
+def _run_atomic(operations: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Executes sub-requests in one transaction which is committed only when every sub-request succeeds.
+    On the first failed sub-request the transaction is rolled back and the rest are not executed.
+    Cache evictions of the writes run only after the commit (see after_commit); nothing is evicted on rollback.
+    :param operations: sub-requests
+    :return: responses (the failed one and 424 for the others on failure) and status of the batch
+    """
+    session = db.session
+    results, failed = [], None
+    try:
+        with deferred_commit(session):
+            for number, operation in enumerate(operations):
+                result = _run(operation, rollback_on_error=False)
+                results.append(result)
+                if result["status"] >= HTTPStatus.BAD_REQUEST:
+                    failed = number
+                    break
+        if failed is None:
+            session.commit()
+            return results, HTTPStatus.OK
+        session.rollback()
+    except Exception:
+        session.rollback()
+        raise
+    rolled_back = {"status": HTTPStatus.FAILED_DEPENDENCY, "headers": {},
+                   "body": f"Not applied: request {failed} of atomic batch failed"}
+    results = [results[failed] if number == failed else rolled_back for number in range(len(operations))]
+    return results, results[failed]["status"]
+
+
+def _run(operation: Dict[str, Any], rollback_on_error: bool) -> Dict[str, Any]:
+    """
+    Dispatches sub-request in-process, sharing application context (and so database session) of the batch.
+    Sub-request runs as the identity of the batch: JWT verified by the batch request is reused, not decoded again.
+    :param operation: sub-request with method, path (with query string), optional headers and JSON body
+    :param rollback_on_error: whether to roll back the session after unhandled error, so next sub-requests can run
+    :return: status, selected headers and body (JSON or text) of the response
+    """
+    builder = EnvironBuilder(path=operation["path"], method=str(operation.get("method", "GET")).upper(),
+                             base_url=request.host_url, headers=operation.get("headers", {}),
+                             json=operation.get("body"))
+    try:
+        environ = builder.get_environ()
+        environ[BATCH_JWT] = get_jwt()
+        with current_app.request_context(environ):
+            try:
+                response = current_app.full_dispatch_request()
+            except Exception:
+                current_app.logger.exception("Batch request %s %s failed", builder.method, builder.path)
+                if rollback_on_error:
+                    db.session.rollback()
+                response = make_response("Internal server error", HTTPStatus.INTERNAL_SERVER_ERROR)
+            return {
+                "status": response.status_code,
+                "headers": {name: response.headers[name] for name in RESPONSE_HEADERS if name in response.headers},
+                "body": _response_body(response),
+            }
+    finally:
+        builder.close()
+
+
+def _response_body(response: Response) -> Optional[Any]:
+    """
+    Reads body of sub-response (also of streamed lists).
+    :param response: response of sub-request
+    :return: parsed JSON, text or None for empty body
+    """
+    if response.is_json:
+        return response.get_json()
+    data = response.get_data(as_text=True)
+    return data or None
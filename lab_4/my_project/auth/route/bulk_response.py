@@ -0,0 +1,46 @@
+"""
+Common realization of bulk create endpoints shared by all blueprints.
+"""
+
+import json
+from http import HTTPStatus
+from typing import Any, Dict, Iterator
+
+from flask import Response, abort, jsonify, make_response, request
+
+from my_project.auth.controller.general_controller import GeneralController
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+TRUE_VALUES = {"1", "true", "yes"}
+
+
+def bulk_create_response(controller: GeneralController) -> Response:
+    """
+    Builds response of bulk create endpoint.
+    Body is JSON array of DTOs or NDJSON stream (`Content-Type: application/x-ndjson`),
+    `?chunk_size=` sets count of rows per INSERT and `?return_ids=true` adds primary keys to the response.
+    :param controller: controller of the resource
+    :return: Response object
+    """
+    if request.mimetype == NDJSON_MIMETYPE:
+        rows = _ndjson_rows()
+    else:
+        rows = request.get_json()
+        if not isinstance(rows, list):
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    chunk_size = request.args.get("chunk_size", type=int)
+    if "chunk_size" in request.args and (chunk_size is None or chunk_size <= 0):
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    return_ids = request.args.get("return_ids", "").lower() in TRUE_VALUES
+    result = controller.create_bulk(rows, chunk_size, return_ids)
+    return make_response(jsonify(result), HTTPStatus.CREATED)
+
+
+def _ndjson_rows() -> Iterator[Dict[str, Any]]:
+    """
+    Parses request body line by line without reading it into memory.
+    :return: iterator of DTO dictionaries
+    """
+    for line in request.stream:
+        if line.strip():
+            yield json.loads(line)
@@ -0,0 +1,52 @@
+"""
+Conditional GET (ETag / If-None-Match) shared by all blueprints.
+"""
+
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Optional
+
+from flask import Response, jsonify, make_response, request
+
+from my_project.etag import dto_etag
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """
+    Checks If-None-Match of the request against current ETag.
+    :param etag: current ETag of the resource
+    :return: 304 response when client has current representation, otherwise None
+    """
+    if request.if_none_match.contains(etag):
+        response = Response(status=HTTPStatus.NOT_MODIFIED)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def item_response(dto: Optional[Dict[str, Any]], error: str) -> Response:
+    """
+    Builds response of item endpoint with ETag; 304 without body when client has current DTO.
+    :param dto: DTO of the item or None
+    :param error: message of 404 response
+    :return: Response object
+    """
+    if dto is None:
+        return make_response(jsonify({"error": error}), HTTPStatus.NOT_FOUND)
+    etag = dto_etag(dto)
+    response = not_modified(etag) or make_response(jsonify(dto), HTTPStatus.OK)
+    response.set_etag(etag)
+    return response
+
+
+def conditional_response(etag: str, build: Callable[[], Response]) -> Response:
+    """
+    Builds response only when client does not have current representation.
+    :param etag: current ETag computed without building the payload
+    :param build: builder of full response
+    :return: 304 response or built response with ETag
+    """
+    response = not_modified(etag)
+    if response is None:
+        response = build()
+        response.set_etag(etag)
+    return response
@@ -39,3 +39,13 @@ def handle_409(error: int) -> Response:
     :return: Response object
     """
     return make_response("Such object is already exists in DB", HTTPStatus.CONFLICT)
+
+
+@err_handler_bp.app_errorhandler(HTTPStatus.PRECONDITION_FAILED)
+def handle_412(error: int) -> Response:
+    """
+    Informs user that object was changed since it was read (If-Match does not match)
+    :param error: status code
+    :return: Response object
+    """
+    return make_response("Object was modified by another request", HTTPStatus.PRECONDITION_FAILED)
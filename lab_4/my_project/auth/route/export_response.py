@@ -0,0 +1,43 @@
+"""
+Common realization of export endpoints.
+"""
+
+from datetime import datetime
+from http import HTTPStatus
+
+from flask import Response, abort, request, stream_with_context
+
+from my_project.auth.controller.general_controller import GeneralController
+from my_project.auth.route.bulk_response import TRUE_VALUES
+from my_project.row_files import CSV, NDJSON, gzip_chunks, write_rows
+
+EXPORT_MIMETYPES = {CSV: "text/csv", NDJSON: "application/x-ndjson"}
+
+
+def export_response(controller: GeneralController, name: str) -> Response:
+    """
+    Builds streaming response of export endpoint.
+    `?from=&to=` filter by time column (ISO datetimes), `?parking_id=` by parking,
+    `?format=csv|ndjson` selects format and `?gzip=false` disables compression (gzip by default).
+    :param controller: controller of the resource
+    :param name: base name of downloaded file
+    :return: Response object
+    """
+    file_format = request.args.get("format", CSV)
+    if file_format not in EXPORT_MIMETYPES:
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    try:
+        start, stop = (None if request.args.get(arg) is None else datetime.fromisoformat(request.args[arg])
+                       for arg in ("from", "to"))
+    except ValueError:
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    parking_id = request.args.get("parking_id", type=int)
+    if "parking_id" in request.args and parking_id is None:
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    columns, rows = controller.export(start, stop, parking_id)
+    chunks = write_rows(rows, file_format, columns)
+    filename, mimetype = f"{name}.{file_format}", EXPORT_MIMETYPES[file_format]
+    if request.args.get("gzip", "true").lower() in TRUE_VALUES:
+        chunks, filename, mimetype = gzip_chunks(chunks), filename + ".gz", "application/gzip"
+    return Response(stream_with_context(chunks), status=HTTPStatus.OK, mimetype=mimetype,
+                    headers={"Content-Disposition": f'attachment; filename="{filename}"'})
@@ -0,0 +1,36 @@
+"""
+Common realization of file import endpoints.
+"""
+
+from http import HTTPStatus
+
+from flask import Response, abort, jsonify, make_response, request
+
+from my_project.auth.controller.general_controller import GeneralController
+from my_project.row_files import GZIP_MIMETYPES, detect_format, read_rows
+
+
+def import_response(controller: GeneralController) -> Response:
+    """
+    Builds response of import endpoint.
+    File is uploaded as multipart field `file` or sent as raw body; CSV (with header) or NDJSON,
+    gzip-compressed when named *.gz, sent with `Content-Encoding: gzip` or `?format=csv.gz|ndjson.gz`.
+    `?chunk_size=` sets count of rows committed per transaction.
+    :param controller: controller of the resource with import_rows method
+    :return: Response object with import report
+    """
+    upload = request.files.get("file")
+    if upload is not None:
+        stream, filename, mimetype = upload.stream, upload.filename, upload.mimetype
+    else:
+        stream, filename, mimetype = request.stream, None, request.mimetype
+    try:
+        file_format, compressed = detect_format(filename, mimetype, request.args.get("format"))
+    except ValueError as error:
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY, str(error))
+    compressed = compressed or mimetype in GZIP_MIMETYPES or request.content_encoding == "gzip"
+    chunk_size = request.args.get("chunk_size", type=int)
+    if "chunk_size" in request.args and (chunk_size is None or chunk_size <= 0):
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    report = controller.import_rows(read_rows(stream, file_format, compressed), chunk_size)
+    return make_response(jsonify(report), HTTPStatus.OK)
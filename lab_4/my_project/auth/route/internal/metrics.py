@@ -0,0 +1,50 @@
+from http import HTTPStatus
+from flask import Blueprint, Response, jsonify, make_response
+from my_project.auth.route.authorization import jwt_required
+from my_project.auth.dao.general_dao import GeneralDAO
+from my_project.auth.dao.pool_metrics import pool_metrics
+
+internal_bp = Blueprint('internal', __name__, url_prefix='/internal')
+
+
+@internal_bp.get('/cache')
+@jwt_required()
+def get_cache_stats() -> Response:
+    """
+    Entity cache counters
+    ---
+    tags:
+      - Internal
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+    responses:
+      200:
+        description: Hits and misses of entity cache of this process (null when cache is disabled)
+    """
+    cache = GeneralDAO.get_entity_cache()
+    return make_response(jsonify(cache.stats() if cache else None), HTTPStatus.OK)
+
+
+@internal_bp.get('/pool')
+@jwt_required()
+def get_pool_stats() -> Response:
+    """
+    Connection pool metrics
+    ---
+    tags:
+      - Internal
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+    responses:
+      200:
+        description: In-use/idle/overflow connections and checkout latency of this process by bind (primary, replica_N)
+    """
+    return make_response(jsonify(pool_metrics.snapshot()), HTTPStatus.OK)
@@ -0,0 +1,112 @@
+"""
+Common realization of list endpoints shared by all blueprints.
+"""
+
+from http import HTTPStatus
+from typing import Dict, Iterator, List, Optional
+
+from flask import Response, abort, current_app, jsonify, make_response, request, stream_with_context
+
+from my_project.auth.controller.general_controller import GeneralController
+from my_project.auth.route.conditional import conditional_response
+from my_project.etag import dto_etag
+from my_project.list_query import ListQuery
+
+PAGE_ARGS = {"limit", "after"}
+STREAM_MIMETYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def list_response(controller: GeneralController) -> Response:
+    """
+    Builds response of list endpoint.
+    Returns objects with listed keys (`?ids=3,1,2`, in this order, with keys which were not found),
+    one page (`?limit=&after=`) when pagination arguments are present,
+    chunked JSON array or NDJSON (`?stream=json|ndjson`) in streaming mode, otherwise the whole table.
+    `?fields=id,car_number` restricts DTOs (and selected columns) to the listed fields in every mode,
+    `?filter[column][op]=value&sort=-column` filters and sorts rows in database (see ListQuery),
+    `?include=relationship.relationship` embeds related objects loaded with one query per level.
+    Responses except streams carry ETag; whole table is not read when If-None-Match matches it
+    (unless relationships are included, since ETag of the table does not cover related tables).
+    :param controller: controller of the resource
+    :return: Response object
+    """
+    fields = _requested_fields()
+    try:
+        list_query = ListQuery.from_args(request.args)
+    except ValueError:
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    if "ids" in request.args:
+        keys = [key.strip() for key in request.args["ids"].split(",") if key.strip()]
+        if not keys:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        response = make_response(jsonify(controller.find_by_ids(keys, fields, list_query)), HTTPStatus.OK)
+        response.add_etag()
+        return response.make_conditional(request)
+    if "stream" in request.args:
+        stream_format = request.args["stream"] or "ndjson"
+        if stream_format not in STREAM_MIMETYPES:
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        chunks = _ndjson_chunks if stream_format == "ndjson" else _json_array_chunks
+        return Response(stream_with_context(chunks(controller.stream_all(fields, list_query))),
+                        status=HTTPStatus.OK, mimetype=STREAM_MIMETYPES[stream_format])
+    if PAGE_ARGS & request.args.keys():
+        limit = request.args.get("limit", type=int)
+        if "limit" in request.args and (limit is None or limit <= 0):
+            abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+        page = controller.find_page(limit, request.args.get("after"), fields, list_query)
+        response = make_response(jsonify(page), HTTPStatus.OK)
+        response.add_etag()
+        return response.make_conditional(request)
+    if list_query.include:
+        response = make_response(jsonify(controller.find_list(fields, list_query)), HTTPStatus.OK)
+        response.add_etag()
+        return response.make_conditional(request)
+    if fields is not None or list_query:
+        return conditional_response(
+            dto_etag({"list": controller.list_etag(), "fields": fields,
+                      "filters": list_query.filters, "sort": list_query.sort}),
+            lambda: make_response(jsonify(controller.find_list(fields, list_query)), HTTPStatus.OK))
+    return conditional_response(
+        controller.list_etag(),
+        lambda: make_response(jsonify([obj.put_into_dto() for obj in controller.find_all()]), HTTPStatus.OK))
+
+
+def _requested_fields() -> Optional[List[str]]:
+    """
+    Parses comma-separated `?fields=` argument of the request.
+    :return: list of unique DTO fields or None when argument is absent
+    """
+    if "fields" not in request.args:
+        return None
+    fields = list(dict.fromkeys(field.strip() for field in request.args["fields"].split(",") if field.strip()))
+    if not fields:
+        abort(HTTPStatus.UNPROCESSABLE_ENTITY)
+    return fields
+
+
+def _ndjson_chunks(dto_iter: Iterator[Dict[str, object]]) -> Iterator[str]:
+    """
+    Serializes DTOs one by one as newline-delimited JSON.
+    :param dto_iter: iterator of DTOs
+    :return: iterator of response chunks
+    """
+    dumps = current_app.json.dumps
+    for dto in dto_iter:
+        yield dumps(dto) + "\n"
+
+
+def _json_array_chunks(dto_iter: Iterator[Dict[str, object]]) -> Iterator[str]:
+    """
+    Serializes DTOs one by one as items of JSON array.
+    :param dto_iter: iterator of DTOs
+    :return: iterator of response chunks
+    """
+    dumps = current_app.json.dumps
+    separator = "["
+    for dto in dto_iter:
+        yield separator + dumps(dto)
+        separator = ","
+    yield "[]" if separator == "[" else "]"
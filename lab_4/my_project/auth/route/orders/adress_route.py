@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import address_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.address import Address
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 address_bp = Blueprint('address', __name__, url_prefix='/address')
 
@@ -22,6 +25,17 @@ def get_all_addresses() -> Response:
         required: true
         description: JWT token
         example: "Bearer <your_jwt_token>"
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size; returns {"items", "next"} instead of the whole list
+        example: 100
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from "next" of the previous page
     responses:
       200:
         description: List of all addresses
@@ -43,9 +57,7 @@ def get_all_addresses() -> Response:
                 type: integer
                 example: 79000
     """
-    addresses = address_controller.find_all()
-    address_dto = [address.put_into_dto() for address in addresses]
-    return make_response(jsonify(address_dto), HTTPStatus.OK)
+    return list_response(address_controller)
 
 
 @address_bp.route('', methods=['POST'])
@@ -100,6 +112,51 @@ def create_address() -> Response:
     return make_response(jsonify(address.put_into_dto()), HTTPStatus.CREATED)
 
 
+@address_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_address_bulk() -> Response:
+    """
+    Create many Address records in chunks
+    ---
+    tags:
+      - Address
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+      - name: chunk_size
+        in: query
+        type: integer
+        required: false
+        description: Count of rows per INSERT statement
+      - name: return_ids
+        in: query
+        type: boolean
+        required: false
+        description: Return primary keys of created rows
+      - name: body
+        in: body
+        required: true
+        description: JSON array of objects (or NDJSON with Content-Type application/x-ndjson)
+        schema:
+          type: array
+          items:
+            type: object
+    responses:
+      201:
+        description: Count of created rows
+        schema:
+          type: object
+          properties:
+            created:
+              type: integer
+              example: 1000
+    """
+    return bulk_create_response(address_controller)
+
+
 @address_bp.route('/<int:address_id>', methods=['GET'])
 @jwt_required()
 def get_address_by_id(address_id: int) -> Response:
@@ -146,10 +203,7 @@ def get_address_by_id(address_id: int) -> Response:
               type: string
               example: "Address not found"
     """
-    address = address_controller.find_by_id(address_id)
-    if address:
-        return make_response(jsonify(address.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Address not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(address_controller.find_dto_by_id(address_id), "Address not found")
 
 
 @address_bp.route('/<int:address_id>', methods=['PUT'])
@@ -203,6 +257,41 @@ def update_address(address_id: int) -> Response:
     return make_response("Address updated", HTTPStatus.OK)
 
 
+@address_bp.route('/<int:address_id>', methods=['PATCH'])
+@jwt_required()
+def patch_address(address_id: int) -> Response:
+    """
+    Modify defined fields of Address by ID
+    ---
+    tags:
+      - Address
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+      - name: address_id
+        in: path
+        required: true
+        type: integer
+        example: 1
+      - name: body
+        in: body
+        required: true
+        description: Fields to modify
+        schema:
+          type: object
+    responses:
+      200:
+        description: Address updated successfully
+      404:
+        description: Address not found
+    """
+    address_controller.patch(address_id, request.get_json())
+    return make_response("Address updated", HTTPStatus.OK)
+
+
 @address_bp.route('/<int:address_id>', methods=['DELETE'])
 @jwt_required()
 def delete_address(address_id: int) -> Response:
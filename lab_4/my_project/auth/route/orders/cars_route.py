@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import cars_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.cars import Cars
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 cars_bp = Blueprint('cars', __name__, url_prefix='/cars')
 
@@ -22,6 +25,17 @@ def get_all_cars() -> Response:
         required: true
         description: JWT token
         example: "Bearer <your_jwt_token>"
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size; returns {"items", "next"} instead of the whole list
+        example: 100
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from "next" of the previous page
     responses:
       200:
         description: List of all cars
@@ -46,9 +60,7 @@ def get_all_cars() -> Response:
                 type: string
                 example: "AA1234BC"
     """
-    cars = cars_controller.find_all()
-    car_dto = [car.put_into_dto() for car in cars]
-    return make_response(jsonify(car_dto), HTTPStatus.OK)
+    return list_response(cars_controller)
 
 
 @cars_bp.route('', methods=['POST'])
@@ -110,6 +122,51 @@ def create_car() -> Response:
     return make_response(jsonify(car.put_into_dto()), HTTPStatus.CREATED)
 
 
+@cars_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_car_bulk() -> Response:
+    """
+    Create many Cars records in chunks
+    ---
+    tags:
+      - Cars
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+      - name: chunk_size
+        in: query
+        type: integer
+        required: false
+        description: Count of rows per INSERT statement
+      - name: return_ids
+        in: query
+        type: boolean
+        required: false
+        description: Return primary keys of created rows
+      - name: body
+        in: body
+        required: true
+        description: JSON array of objects (or NDJSON with Content-Type application/x-ndjson)
+        schema:
+          type: array
+          items:
+            type: object
+    responses:
+      201:
+        description: Count of created rows
+        schema:
+          type: object
+          properties:
+            created:
+              type: integer
+              example: 1000
+    """
+    return bulk_create_response(cars_controller)
+
+
 @cars_bp.route('/<int:car_id>', methods=['GET'])
 @jwt_required()
 def get_car_by_id(car_id: int) -> Response:
@@ -159,10 +216,7 @@ def get_car_by_id(car_id: int) -> Response:
               type: string
               example: "Car not found"
     """
-    car = cars_controller.find_by_id(car_id)
-    if car:
-        return make_response(jsonify(car.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Car not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(cars_controller.find_dto_by_id(car_id), "Car not found")
 
 
 @cars_bp.route('/<int:car_id>', methods=['PUT'])
@@ -220,6 +274,41 @@ def update_car(car_id: int) -> Response:
     return make_response("Car updated", HTTPStatus.OK)
 
 
+@cars_bp.route('/<int:car_id>', methods=['PATCH'])
+@jwt_required()
+def patch_car(car_id: int) -> Response:
+    """
+    Modify defined fields of Cars by ID
+    ---
+    tags:
+      - Cars
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+      - name: car_id
+        in: path
+        required: true
+        type: integer
+        example: 1
+      - name: body
+        in: body
+        required: true
+        description: Fields to modify
+        schema:
+          type: object
+    responses:
+      200:
+        description: Cars updated successfully
+      404:
+        description: Cars not found
+    """
+    cars_controller.patch(car_id, request.get_json())
+    return make_response("Car updated", HTTPStatus.OK)
+
+
 @cars_bp.route('/<int:car_id>', methods=['DELETE'])
 @jwt_required()
 def delete_car(car_id: int) -> Response:
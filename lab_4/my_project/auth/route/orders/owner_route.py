@@ -1,8 +1,10 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import owner_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
 from my_project.auth.domain.orders.owner import Owner
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 
 owner_bp = Blueprint('owner', __name__, url_prefix='/owners')
@@ -106,6 +108,51 @@ def create_owner() -> Response:
     return make_response(jsonify(owner.put_into_dto()), HTTPStatus.CREATED)
 
 
+@owner_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_owner_bulk() -> Response:
+    """
+    Create many Owner records in chunks
+    ---
+    tags:
+      - Owner
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+      - name: chunk_size
+        in: query
+        type: integer
+        required: false
+        description: Count of rows per INSERT statement
+      - name: return_ids
+        in: query
+        type: boolean
+        required: false
+        description: Return primary keys of created rows
+      - name: body
+        in: body
+        required: true
+        description: JSON array of objects (or NDJSON with Content-Type application/x-ndjson)
+        schema:
+          type: array
+          items:
+            type: object
+    responses:
+      201:
+        description: Count of created rows
+        schema:
+          type: object
+          properties:
+            created:
+              type: integer
+              example: 1000
+    """
+    return bulk_create_response(owner_controller)
+
+
 @owner_bp.route('/<int:owner_id>', methods=['GET'])
 @jwt_required()
 def get_owner_by_id(owner_id: int) -> Response:
@@ -153,10 +200,7 @@ def get_owner_by_id(owner_id: int) -> Response:
               type: string
               example: "Owner not found"
     """
-    owner = owner_controller.find_by_id(owner_id)
-    if owner:
-        return make_response(jsonify(owner.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Owner not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(owner_controller.find_dto_by_id(owner_id), "Owner not found")
 
 
 @owner_bp.route('/<int:owner_id>', methods=['PUT'])
@@ -215,6 +259,41 @@ def update_owner(owner_id: int) -> Response:
     return make_response("Owner updated", HTTPStatus.OK)
 
 
+@owner_bp.route('/<int:owner_id>', methods=['PATCH'])
+@jwt_required()
+def patch_owner(owner_id: int) -> Response:
+    """
+    Modify defined fields of Owner by ID
+    ---
+    tags:
+      - Owner
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        example: "Bearer <your_jwt_token>"
+      - name: owner_id
+        in: path
+        required: true
+        type: integer
+        example: 1
+      - name: body
+        in: body
+        required: true
+        description: Fields to modify
+        schema:
+          type: object
+    responses:
+      200:
+        description: Owner updated successfully
+      404:
+        description: Owner not found
+    """
+    owner_controller.patch(owner_id, request.get_json())
+    return make_response("Owner updated", HTTPStatus.OK)
+
+
 @owner_bp.route('/<int:owner_id>', methods=['DELETE'])
 @jwt_required()
 def delete_owner(owner_id: int) -> Response:
@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import parking_network_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.parking_network import ParkingNetwork
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 parking_network_bp = Blueprint('parking_network', __name__, url_prefix='/parking_networks')
 
@@ -10,9 +13,7 @@ parking_network_bp = Blueprint('parking_network', __name__, url_prefix='/parking
 @parking_network_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_parking_networks() -> Response:
-    parking_networks = parking_network_controller.find_all()
-    parking_network_dto = [network.put_into_dto() for network in parking_networks]
-    return make_response(jsonify(parking_network_dto), HTTPStatus.OK)
+    return list_response(parking_network_controller)
 
 
 @parking_network_bp.route('', methods=['POST'])
@@ -23,13 +24,16 @@ def create_parking_network() -> Response:
     return make_response(jsonify(parking_network.put_into_dto()), HTTPStatus.CREATED)
 
 
+@parking_network_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_parking_network_bulk() -> Response:
+    return bulk_create_response(parking_network_controller)
+
+
 @parking_network_bp.route('/<int:parking_network_id>', methods=['GET'])
 @jwt_required()
 def get_parking_network_by_id(parking_network_id: int) -> Response:
-    parking_network = parking_network_controller.find_by_id(parking_network_id)
-    if parking_network:
-        return make_response(jsonify(parking_network.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Parking Network not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(parking_network_controller.find_dto_by_id(parking_network_id), "Parking Network not found")
 
 
 @parking_network_bp.route('/<int:parking_network_id>', methods=['PUT'])
@@ -41,6 +45,13 @@ def update_parking_network(parking_network_id: int) -> Response:
     return make_response("Parking Network updated", HTTPStatus.OK)
 
 
+@parking_network_bp.route('/<int:parking_network_id>', methods=['PATCH'])
+@jwt_required()
+def patch_parking_network(parking_network_id: int) -> Response:
+    parking_network_controller.patch(parking_network_id, request.get_json())
+    return make_response("Parking Network updated", HTTPStatus.OK)
+
+
 @parking_network_bp.route('/<int:parking_network_id>', methods=['DELETE'])
 @jwt_required()
 def delete_parking_network(parking_network_id: int) -> Response:
@@ -1,8 +1,13 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import parking_place_history_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.export_response import export_response
+from my_project.auth.route.import_response import import_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.parking_place_history import ParkingPlaceHistory
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 parking_place_history_bp = Blueprint('parking_place_history', __name__, url_prefix='/parking_place_histories')
 
@@ -10,9 +15,7 @@ parking_place_history_bp = Blueprint('parking_place_history', __name__, url_pref
 @parking_place_history_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_parking_place_histories() -> Response:
-    histories = parking_place_history_controller.find_all()
-    histories_dto = [history.put_into_dto() for history in histories]
-    return make_response(jsonify(histories_dto), HTTPStatus.OK)
+    return list_response(parking_place_history_controller)
 
 
 @parking_place_history_bp.route('', methods=['POST'])
@@ -23,13 +26,28 @@ def create_parking_place_history() -> Response:
     return make_response(jsonify(history.put_into_dto()), HTTPStatus.CREATED)
 
 
+@parking_place_history_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_parking_place_history_bulk() -> Response:
+    return bulk_create_response(parking_place_history_controller)
+
+
+@parking_place_history_bp.route('/import', methods=['POST'])
+@jwt_required()
+def import_parking_place_histories() -> Response:
+    return import_response(parking_place_history_controller)
+
+
+@parking_place_history_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_parking_place_histories() -> Response:
+    return export_response(parking_place_history_controller, 'parking_place_histories')
+
+
 @parking_place_history_bp.route('/<int:history_id>', methods=['GET'])
 @jwt_required()
 def get_parking_place_history_by_id(history_id: int) -> Response:
-    history = parking_place_history_controller.find_by_id(history_id)
-    if history:
-        return make_response(jsonify(history.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Parking Place History not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(parking_place_history_controller.find_dto_by_id(history_id), "Parking Place History not found")
 
 
 @parking_place_history_bp.route('/<int:history_id>', methods=['PUT'])
@@ -41,6 +59,13 @@ def update_parking_place_history(history_id: int) -> Response:
     return make_response("Parking Place History updated", HTTPStatus.OK)
 
 
+@parking_place_history_bp.route('/<int:history_id>', methods=['PATCH'])
+@jwt_required()
+def patch_parking_place_history(history_id: int) -> Response:
+    parking_place_history_controller.patch(history_id, request.get_json())
+    return make_response("Parking Place History updated", HTTPStatus.OK)
+
+
 @parking_place_history_bp.route('/<int:history_id>', methods=['DELETE'])
 @jwt_required()
 def delete_parking_place_history(history_id: int) -> Response:
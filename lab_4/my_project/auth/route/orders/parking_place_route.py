@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import parking_place_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.parking_place import ParkingPlace
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 parking_place_bp = Blueprint('parking_place', __name__, url_prefix='/parking_places')
 
@@ -10,9 +13,7 @@ parking_place_bp = Blueprint('parking_place', __name__, url_prefix='/parking_pla
 @parking_place_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_parking_places() -> Response:
-    parking_places = parking_place_controller.find_all()
-    parking_place_dto = [parking_place.put_into_dto() for parking_place in parking_places]
-    return make_response(jsonify(parking_place_dto), HTTPStatus.OK)
+    return list_response(parking_place_controller)
 
 
 @parking_place_bp.route('', methods=['POST'])
@@ -23,13 +24,16 @@ def create_parking_place() -> Response:
     return make_response(jsonify(parking_place.put_into_dto()), HTTPStatus.CREATED)
 
 
+@parking_place_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_parking_place_bulk() -> Response:
+    return bulk_create_response(parking_place_controller)
+
+
 @parking_place_bp.route('/<int:parking_place_id>', methods=['GET'])
 @jwt_required()
 def get_parking_place_by_id(parking_place_id: int) -> Response:
-    parking_place = parking_place_controller.find_by_id(parking_place_id)
-    if parking_place:
-        return make_response(jsonify(parking_place.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Parking Place not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(parking_place_controller.find_dto_by_id(parking_place_id), "Parking Place not found")
 
 
 @parking_place_bp.route('/<int:parking_place_id>', methods=['PUT'])
@@ -41,6 +45,13 @@ def update_parking_place(parking_place_id: int) -> Response:
     return make_response("Parking Place updated", HTTPStatus.OK)
 
 
+@parking_place_bp.route('/<int:parking_place_id>', methods=['PATCH'])
+@jwt_required()
+def patch_parking_place(parking_place_id: int) -> Response:
+    parking_place_controller.patch(parking_place_id, request.get_json())
+    return make_response("Parking Place updated", HTTPStatus.OK)
+
+
 @parking_place_bp.route('/<int:parking_place_id>', methods=['DELETE'])
 @jwt_required()
 def delete_parking_place(parking_place_id: int) -> Response:
@@ -1,26 +1,48 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 from my_project.auth.controller import parking_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.parking import Parking
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 parking_bp = Blueprint('parking', __name__, url_prefix='/parkings')
 
 @parking_bp.get('/<int:parking_id>')
 @jwt_required()
 def get_parking(parking_id: int) -> Response:
-    parking = parking_controller.find_by_id(parking_id)
-    if parking:
-        return make_response(jsonify(parking.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Parking not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(parking_controller.find_dto_by_id(parking_id), "Parking not found")
+
+@parking_bp.get('/<int:parking_id>/snapshot')
+@jwt_required()
+def get_parking_snapshot(parking_id: int) -> Response:
+    return item_response(parking_controller.find_snapshot(parking_id, request.args.get('at')), "Parking not found")
+
+@parking_bp.get('/<int:parking_id>/availability')
+@jwt_required()
+def get_parking_availability(parking_id: int) -> Response:
+    availability = parking_controller.find_availability(parking_id, request.args.get('from'), request.args.get('to'))
+    return make_response(jsonify(availability), HTTPStatus.OK)
+
+@parking_bp.get('/<int:parking_id>/occupancy')
+@jwt_required()
+def get_parking_occupancy(parking_id: int) -> Response:
+    stats = parking_controller.find_occupancy(parking_id, request.args.get('from'), request.args.get('to'),
+                                              request.args.get('bucket', 3600, type=int))
+    return make_response(jsonify(stats), HTTPStatus.OK)
+
+@parking_bp.get('/<int:parking_id>/occupancy/hourly')
+@jwt_required()
+def get_parking_hourly_occupancy(parking_id: int) -> Response:
+    rollup = parking_controller.find_hourly_occupancy(parking_id, request.args.get('from'), request.args.get('to'))
+    return make_response(jsonify(rollup), HTTPStatus.OK)
 
 @parking_bp.get('')
 @jwt_required()
 def get_all_parkings() -> Response:
-    parkings = parking_controller.find_all()
-    parking_dto = [parking.put_into_dto() for parking in parkings]
-    return make_response(jsonify(parking_dto), HTTPStatus.OK)
+    return list_response(parking_controller)
 
 @parking_bp.post('')
 def create_parking() -> Response:
@@ -29,6 +51,11 @@ def create_parking() -> Response:
     parking_controller.create_parking(parking)
     return make_response(jsonify(parking.put_into_dto()), HTTPStatus.CREATED)
 
+@parking_bp.post('/bulk')
+@jwt_required()
+def create_parking_bulk() -> Response:
+    return bulk_create_response(parking_controller)
+
 @parking_bp.put('/<int:parking_id>')
 @jwt_required()
 def update_parking(parking_id: int) -> Response:
@@ -37,6 +64,12 @@ def update_parking(parking_id: int) -> Response:
     parking_controller.update_parking(parking_id, parking)
     return make_response("Parking updated", HTTPStatus.OK)
 
+@parking_bp.patch('/<int:parking_id>')
+@jwt_required()
+def patch_parking(parking_id: int) -> Response:
+    parking_controller.patch(parking_id, request.get_json())
+    return make_response("Parking updated", HTTPStatus.OK)
+
 @parking_bp.delete('/<int:parking_id>')
 @jwt_required()
 def delete_parking(parking_id: int) -> Response:
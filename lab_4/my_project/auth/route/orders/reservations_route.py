@@ -1,8 +1,12 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import reservations_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.export_response import export_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.reservations import Reservations
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 reservations_bp = Blueprint('reservations', __name__, url_prefix='/reservations')
 
@@ -10,9 +14,7 @@ reservations_bp = Blueprint('reservations', __name__, url_prefix='/reservations'
 @reservations_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_reservations() -> Response:
-    reservations = reservations_controller.find_all()
-    reservations_dto = [reservation.put_into_dto() for reservation in reservations]
-    return make_response(jsonify(reservations_dto), HTTPStatus.OK)
+    return list_response(reservations_controller)
 
 
 @reservations_bp.route('', methods=['POST'])
@@ -23,13 +25,22 @@ def create_reservation() -> Response:
     return make_response(jsonify(reservation.put_into_dto()), HTTPStatus.CREATED)
 
 
+@reservations_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_reservation_bulk() -> Response:
+    return bulk_create_response(reservations_controller)
+
+
+@reservations_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_reservations() -> Response:
+    return export_response(reservations_controller, 'reservations')
+
+
 @reservations_bp.route('/<int:reservation_id>', methods=['GET'])
 @jwt_required()
 def get_reservation_by_id(reservation_id: int) -> Response:
-    reservation = reservations_controller.find_by_id(reservation_id)
-    if reservation:
-        return make_response(jsonify(reservation.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Reservation not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(reservations_controller.find_dto_by_id(reservation_id), "Reservation not found")
 
 
 @reservations_bp.route('/<int:reservation_id>', methods=['PUT'])
@@ -41,6 +52,13 @@ def update_reservation(reservation_id: int) -> Response:
     return make_response("Reservation updated", HTTPStatus.OK)
 
 
+@reservations_bp.route('/<int:reservation_id>', methods=['PATCH'])
+@jwt_required()
+def patch_reservation(reservation_id: int) -> Response:
+    reservations_controller.patch(reservation_id, request.get_json())
+    return make_response("Reservation updated", HTTPStatus.OK)
+
+
 @reservations_bp.route('/<int:reservation_id>', methods=['DELETE'])
 @jwt_required()
 def delete_reservation(reservation_id: int) -> Response:
@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import status_type_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.status_type import StatusType
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 status_type_bp = Blueprint('status_type', __name__, url_prefix='/status_types')
 
@@ -10,9 +13,7 @@ status_type_bp = Blueprint('status_type', __name__, url_prefix='/status_types')
 @status_type_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_status_types() -> Response:
-    status_types = status_type_controller.find_all()
-    status_type_dto = [status_type.put_into_dto() for status_type in status_types]
-    return make_response(jsonify(status_type_dto), HTTPStatus.OK)
+    return list_response(status_type_controller)
 
 
 @status_type_bp.route('', methods=['POST'])
@@ -23,13 +24,16 @@ def create_status_type() -> Response:
     return make_response(jsonify(status_type.put_into_dto()), HTTPStatus.CREATED)
 
 
+@status_type_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_status_type_bulk() -> Response:
+    return bulk_create_response(status_type_controller)
+
+
 @status_type_bp.route('/<int:status_type_id>', methods=['GET'])
 @jwt_required()
 def get_status_type_by_id(status_type_id: int) -> Response:
-    status_type = status_type_controller.find_by_id(status_type_id)
-    if status_type:
-        return make_response(jsonify(status_type.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Status Type not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(status_type_controller.find_dto_by_id(status_type_id), "Status Type not found")
 
 
 @status_type_bp.route('/<int:status_type_id>', methods=['PUT'])
@@ -41,6 +45,13 @@ def update_status_type(status_type_id: int) -> Response:
     return make_response("Status Type updated", HTTPStatus.OK)
 
 
+@status_type_bp.route('/<int:status_type_id>', methods=['PATCH'])
+@jwt_required()
+def patch_status_type(status_type_id: int) -> Response:
+    status_type_controller.patch(status_type_id, request.get_json())
+    return make_response("Status Type updated", HTTPStatus.OK)
+
+
 @status_type_bp.route('/<int:status_type_id>', methods=['DELETE'])
 @jwt_required()
 def delete_status_type(status_type_id: int) -> Response:
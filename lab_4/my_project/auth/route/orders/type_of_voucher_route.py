@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import type_of_voucher_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.type_of_voucher import TypeOfVoucher
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 type_of_voucher_bp = Blueprint('type_of_voucher', __name__, url_prefix='/type_of_voucher')
 
@@ -10,9 +13,7 @@ type_of_voucher_bp = Blueprint('type_of_voucher', __name__, url_prefix='/type_of
 @type_of_voucher_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_types_of_vouchers() -> Response:
-    types_of_vouchers = type_of_voucher_controller.find_all()
-    type_of_voucher_dto = [type_of_voucher.put_into_dto() for type_of_voucher in types_of_vouchers]
-    return make_response(jsonify(type_of_voucher_dto), HTTPStatus.OK)
+    return list_response(type_of_voucher_controller)
 
 
 @type_of_voucher_bp.route('', methods=['POST'])
@@ -23,13 +24,16 @@ def create_type_of_voucher() -> Response:
     return make_response(jsonify(type_of_voucher.put_into_dto()), HTTPStatus.CREATED)
 
 
+@type_of_voucher_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_type_of_voucher_bulk() -> Response:
+    return bulk_create_response(type_of_voucher_controller)
+
+
 @type_of_voucher_bp.route('/<int:type_of_voucher_id>', methods=['GET'])
 @jwt_required()
 def get_type_of_voucher_by_id(type_of_voucher_id: int) -> Response:
-    type_of_voucher = type_of_voucher_controller.find_by_id(type_of_voucher_id)
-    if type_of_voucher:
-        return make_response(jsonify(type_of_voucher.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Type of Voucher not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(type_of_voucher_controller.find_dto_by_id(type_of_voucher_id), "Type of Voucher not found")
 
 
 @type_of_voucher_bp.route('/<int:type_of_voucher_id>', methods=['PUT'])
@@ -41,6 +45,13 @@ def update_type_of_voucher(type_of_voucher_id: int) -> Response:
     return make_response("Type of Voucher updated", HTTPStatus.OK)
 
 
+@type_of_voucher_bp.route('/<int:type_of_voucher_id>', methods=['PATCH'])
+@jwt_required()
+def patch_type_of_voucher(type_of_voucher_id: int) -> Response:
+    type_of_voucher_controller.patch(type_of_voucher_id, request.get_json())
+    return make_response("Type of Voucher updated", HTTPStatus.OK)
+
+
 @type_of_voucher_bp.route('/<int:type_of_voucher_id>', methods=['DELETE'])
 @jwt_required()
 def delete_type_of_voucher(type_of_voucher_id: int) -> Response:
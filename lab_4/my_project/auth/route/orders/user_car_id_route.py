@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import user_car_id_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.user_car_id import UserCarId
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 user_car_id_bp = Blueprint('user_car_id', __name__, url_prefix='/user_car_id')
 
@@ -10,9 +13,7 @@ user_car_id_bp = Blueprint('user_car_id', __name__, url_prefix='/user_car_id')
 @user_car_id_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_user_car_ids() -> Response:
-    user_car_ids = user_car_id_controller.find_all()
-    user_car_id_dto = [user_car_id.put_into_dto() for user_car_id in user_car_ids]
-    return make_response(jsonify(user_car_id_dto), HTTPStatus.OK)
+    return list_response(user_car_id_controller)
 
 
 @user_car_id_bp.route('', methods=['POST'])
@@ -23,13 +24,17 @@ def create_user_car_id() -> Response:
     return make_response(jsonify(user_car_id.put_into_dto()), HTTPStatus.CREATED)
 
 
+@user_car_id_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_user_car_id_bulk() -> Response:
+    return bulk_create_response(user_car_id_controller)
+
+
 @user_car_id_bp.route('/<int:user_id>/<int:car_id>', methods=['GET'])
 @jwt_required()
 def get_user_car_id_by_user_and_car_id(user_id: int, car_id: int) -> Response:
     user_car_id = user_car_id_controller.find_by_user_and_car_id(user_id, car_id)
-    if user_car_id:
-        return make_response(jsonify(user_car_id.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "UserCarId not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(user_car_id.put_into_dto() if user_car_id else None, "UserCarId not found")
 
 
 @user_car_id_bp.route('/<int:user_id>/<int:car_id>', methods=['PUT'])
@@ -41,6 +46,13 @@ def update_user_car_id(user_id: int, car_id: int) -> Response:
     return make_response("UserCarId updated", HTTPStatus.OK)
 
 
+@user_car_id_bp.route('/<int:user_id>/<int:car_id>', methods=['PATCH'])
+@jwt_required()
+def patch_user_car_id(user_id: int, car_id: int) -> Response:
+    user_car_id_controller.patch((user_id, car_id), request.get_json())
+    return make_response("UserCarId updated", HTTPStatus.OK)
+
+
 @user_car_id_bp.route('/<int:user_id>/<int:car_id>', methods=['DELETE'])
 @jwt_required()
 def delete_user_car_id(user_id: int, car_id: int) -> Response:
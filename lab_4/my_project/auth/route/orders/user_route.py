@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import user_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.user import User
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 users_bp = Blueprint('users', __name__, url_prefix='/users')
 
@@ -10,9 +13,7 @@ users_bp = Blueprint('users', __name__, url_prefix='/users')
 @users_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_users() -> Response:
-    users = user_controller.find_all()
-    user_dto = [user.put_into_dto() for user in users]
-    return make_response(jsonify(user_dto), HTTPStatus.OK)
+    return list_response(user_controller)
 
 
 @users_bp.route('', methods=['POST'])
@@ -23,13 +24,16 @@ def create_user() -> Response:
     return make_response(jsonify(user.put_into_dto()), HTTPStatus.CREATED)
 
 
+@users_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_user_bulk() -> Response:
+    return bulk_create_response(user_controller)
+
+
 @users_bp.route('/<int:user_id>', methods=['GET'])
 @jwt_required()
 def get_user_by_id(user_id: int) -> Response:
-    user = user_controller.find_by_id(user_id)
-    if user:
-        return make_response(jsonify(user.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "User not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(user_controller.find_dto_by_id(user_id), "User not found")
 
 
 @users_bp.route('/<int:user_id>', methods=['PUT'])
@@ -41,6 +45,13 @@ def update_user(user_id: int) -> Response:
     return make_response("User updated", HTTPStatus.OK)
 
 
+@users_bp.route('/<int:user_id>', methods=['PATCH'])
+@jwt_required()
+def patch_user(user_id: int) -> Response:
+    user_controller.patch(user_id, request.get_json())
+    return make_response("User updated", HTTPStatus.OK)
+
+
 @users_bp.route('/<int:user_id>', methods=['DELETE'])
 @jwt_required()
 def delete_user(user_id: int) -> Response:
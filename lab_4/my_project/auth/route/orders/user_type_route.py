@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import user_type_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.user_type import UserType
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 user_types_bp = Blueprint('user_types', __name__, url_prefix='/user_types')
 
@@ -10,9 +13,7 @@ user_types_bp = Blueprint('user_types', __name__, url_prefix='/user_types')
 @user_types_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_user_types() -> Response:
-    user_types = user_type_controller.find_all()
-    user_type_dto = [user_type.put_into_dto() for user_type in user_types]
-    return make_response(jsonify(user_type_dto), HTTPStatus.OK)
+    return list_response(user_type_controller)
 
 
 @user_types_bp.route('', methods=['POST'])
@@ -23,13 +24,16 @@ def create_user_type() -> Response:
     return make_response(jsonify(user_type.put_into_dto()), HTTPStatus.CREATED)
 
 
+@user_types_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_user_type_bulk() -> Response:
+    return bulk_create_response(user_type_controller)
+
+
 @user_types_bp.route('/<int:user_type_id>', methods=['GET'])
 @jwt_required()
 def get_user_type_by_id(user_type_id: int) -> Response:
-    user_type = user_type_controller.find_by_id(user_type_id)
-    if user_type:
-        return make_response(jsonify(user_type.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "User type not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(user_type_controller.find_dto_by_id(user_type_id), "User type not found")
 
 
 @user_types_bp.route('/<int:user_type_id>', methods=['PUT'])
@@ -41,6 +45,13 @@ def update_user_type(user_type_id: int) -> Response:
     return make_response("User type updated", HTTPStatus.OK)
 
 
+@user_types_bp.route('/<int:user_type_id>', methods=['PATCH'])
+@jwt_required()
+def patch_user_type(user_type_id: int) -> Response:
+    user_type_controller.patch(user_type_id, request.get_json())
+    return make_response("User type updated", HTTPStatus.OK)
+
+
 @user_types_bp.route('/<int:user_type_id>', methods=['DELETE'])
 @jwt_required()
 def delete_user_type(user_type_id: int) -> Response:
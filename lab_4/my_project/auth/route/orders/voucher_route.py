@@ -1,8 +1,12 @@
 from http import HTTPStatus
 from flask import Blueprint, jsonify, Response, request, make_response
 from my_project.auth.controller import voucher_controller
+from my_project.auth.route.bulk_response import bulk_create_response
+from my_project.auth.route.conditional import item_response
+from my_project.auth.route.export_response import export_response
+from my_project.auth.route.list_response import list_response
 from my_project.auth.domain.orders.voucher import Voucher
-from flask_jwt_extended import jwt_required
+from my_project.auth.route.authorization import jwt_required
 
 voucher_bp = Blueprint('voucher', __name__, url_prefix='/voucher')
 
@@ -10,9 +14,7 @@ voucher_bp = Blueprint('voucher', __name__, url_prefix='/voucher')
 @voucher_bp.route('', methods=['GET'])
 @jwt_required()
 def get_all_vouchers() -> Response:
-    vouchers = voucher_controller.find_all()
-    voucher_dto = [voucher.put_into_dto() for voucher in vouchers]
-    return make_response(jsonify(voucher_dto), HTTPStatus.OK)
+    return list_response(voucher_controller)
 
 
 @voucher_bp.route('', methods=['POST'])
@@ -23,13 +25,22 @@ def create_voucher() -> Response:
     return make_response(jsonify(voucher.put_into_dto()), HTTPStatus.CREATED)
 
 
+@voucher_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_voucher_bulk() -> Response:
+    return bulk_create_response(voucher_controller)
+
+
+@voucher_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_vouchers() -> Response:
+    return export_response(voucher_controller, 'vouchers')
+
+
 @voucher_bp.route('/<int:voucher_id>', methods=['GET'])
 @jwt_required()
 def get_voucher_by_id(voucher_id: int) -> Response:
-    voucher = voucher_controller.find_by_id(voucher_id)
-    if voucher:
-        return make_response(jsonify(voucher.put_into_dto()), HTTPStatus.OK)
-    return make_response(jsonify({"error": "Voucher not found"}), HTTPStatus.NOT_FOUND)
+    return item_response(voucher_controller.find_dto_by_id(voucher_id), "Voucher not found")
 
 
 @voucher_bp.route('/<int:voucher_id>', methods=['PUT'])
@@ -41,6 +52,13 @@ def update_voucher(voucher_id: int) -> Response:
     return make_response("Voucher updated", HTTPStatus.OK)
 
 
+@voucher_bp.route('/<int:voucher_id>', methods=['PATCH'])
+@jwt_required()
+def patch_voucher(voucher_id: int) -> Response:
+    voucher_controller.patch(voucher_id, request.get_json())
+    return make_response("Voucher updated", HTTPStatus.OK)
+
+
 @voucher_bp.route('/<int:voucher_id>', methods=['DELETE'])
 @jwt_required()
 def delete_voucher(voucher_id: int) -> Response:
@@ -5,7 +5,10 @@ apavelchak@gmail.com
 """
 
 from abc import ABC
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from my_project.list_query import ListQuery
 
 
 class GeneralService(ABC):
@@ -14,12 +17,55 @@ class GeneralService(ABC):
     """
     _dao = None
 
-    def find_all(self) -> List[object]:
+    def find_all(self, fields: Optional[List[str]] = None, list_query: Optional[ListQuery] = None) -> List[object]:
         """
         Gets all objects from table using Data Access layer.
+        :param fields: DTO fields to load or None for whole objects
+        :param list_query: filters, sort order and includes or None
         :return: list of all objects
         """
-        return self._dao.find_all()
+        return self._dao.find_all(fields, list_query)
+
+    def stream_all(self, fields: Optional[List[str]] = None,
+                   list_query: Optional[ListQuery] = None) -> Iterator[object]:
+        """
+        Iterates over all objects of table using Data Access layer.
+        :param fields: DTO fields to load or None for whole objects
+        :param list_query: filters, sort order and includes or None
+        :return: iterator of objects
+        """
+        return self._dao.stream_all(fields, list_query)
+
+    def to_dto(self, obj: object, fields: Optional[List[str]] = None,
+               list_query: Optional[ListQuery] = None) -> Dict[str, Any]:
+        """
+        Builds DTO of object restricted to requested fields, with included relationships, using Data Access layer.
+        :param obj: object of domain type
+        :param fields: DTO fields or None for full DTO
+        :param list_query: list query with includes or None
+        :return: DTO object as dictionary
+        """
+        return self._dao.to_dto(obj, fields, list_query)
+
+    def list_etag(self) -> str:
+        """
+        Computes ETag of list of all objects using Data Access layer.
+        :return: ETag value (unquoted)
+        """
+        return self._dao.list_etag()
+
+    def find_page(self, limit: Optional[int] = None, after: Optional[str] = None,
+                  fields: Optional[List[str]] = None,
+                  list_query: Optional[ListQuery] = None) -> Tuple[List[object], Optional[str]]:
+        """
+        Gets one page of objects using Data Access layer.
+        :param limit: maximum count of objects on the page
+        :param after: cursor of the previous page
+        :param fields: DTO fields to load or None for whole objects
+        :param list_query: filters, sort order and includes or None
+        :return: objects of the page and cursor of the next page
+        """
+        return self._dao.find_page(limit, after, fields, list_query)
 
     def find_by_id(self, key: int) -> object:
         """
@@ -29,6 +75,25 @@ class GeneralService(ABC):
         """
         return self._dao.find_by_id(key)
 
+    def find_by_ids(self, keys: List[object], fields: Optional[List[str]] = None,
+                    list_query: Optional[ListQuery] = None) -> Tuple[List[object], List[object]]:
+        """
+        Gets objects by list of keys using Data Access layer.
+        :param keys: values of primary key
+        :param fields: DTO fields to load or None for whole objects
+        :param list_query: filters and includes or None
+        :return: found objects in order of keys and keys which were not found
+        """
+        return self._dao.find_by_ids(keys, fields, list_query)
+
+    def find_dto_by_id(self, key: int) -> Optional[Dict[str, Any]]:
+        """
+        Gets DTO of object by integer key using Data Access layer.
+        :param key: integer key (surrogate primary key)
+        :return: DTO of search object or None
+        """
+        return self._dao.find_dto_by_id(key)
+
     def create(self, obj: object) -> object:
         """
         Creates object in database table using Data Access layer.
@@ -45,29 +110,64 @@ class GeneralService(ABC):
         """
         return self._dao.create_all(obj_list)
 
-    def update(self, key: int, obj: object) -> None:
+    def export(self, start: Optional[datetime] = None, stop: Optional[datetime] = None,
+               parking_id: Optional[int] = None) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """
+        Iterates over rows filtered by time range and parking using Data Access layer.
+        :param start: minimal value of time column
+        :param stop: upper bound (exclusive) of time column
+        :param parking_id: id of parking
+        :return: column names and iterator of dictionaries of column values
+        """
+        return self._dao.export(start, stop, parking_id)
+
+    def create_bulk(self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                    return_ids: bool = False) -> Tuple[int, List[object]]:
+        """
+        Creates objects from DTO rows in chunks using Data Access layer.
+        :param rows: iterable of DTO dictionaries
+        :param chunk_size: count of rows per INSERT statement
+        :param return_ids: whether primary keys of created rows are needed
+        :return: count of created rows and list of their primary keys
+        """
+        return self._dao.create_bulk(rows, chunk_size, return_ids)
+
+    def find_dto_and_version(self, key: object) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """
+        Gets current DTO and row version of object using Data Access layer.
+        :param key: primary key value (tuple for composite key)
+        :return: DTO and version or (None, None) if there is no object with such key
+        """
+        return self._dao.find_dto_and_version(key)
+
+    def update(self, key: int, obj: object, version: Optional[int] = None) -> bool:
         """
         Updates object in database table using Data Access layer.
         :param key: integer key (surrogate primary key)
         :param obj: object to create in Database
+        :param version: expected row version or None for unconditional update
+        :return: False if there is no object with such key
         """
-        self._dao.update(key, obj)
+        return self._dao.update(key, obj, version)
 
-    def patch(self, key: int, field_name: str, value: object) -> None:
+    def patch(self, key: int, value_dict: Dict[str, Any], version: Optional[int] = None) -> bool:
         """
-        Modifies defined field of object in database table using Data Access layer.
+        Modifies defined fields of object in database table using Data Access layer.
         :param key: integer key (surrogate primary key)
-        :param field_name: field name of object
-        :param value: field value of object
+        :param value_dict: field names and values of object
+        :param version: expected row version or None for unconditional update
+        :return: False if there is no object with such key
         """
-        self._dao.patch(key, field_name, value)
+        return self._dao.patch(key, value_dict, version)
 
-    def delete(self, key: int) -> None:
+    def delete(self, key: int, version: Optional[int] = None) -> bool:
         """
         Deletes object from database table by integer key from Data Access layer.
         :param key: integer key (surrogate primary key)
+        :param version: expected row version or None for unconditional delete
+        :return: False if there is no object with such key
         """
-        self._dao.delete(key)
+        return self._dao.delete(key, version)
 
     def delete_all(self) -> None:
         """
@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.address_dao import AddressDAO
 from my_project.auth.domain.orders.address import Address
 
 
-class AddressService:
+class AddressService(GeneralService):
     def __init__(self):
         self._dao = AddressDAO()
 
@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.cars_dao import CarsDAO
 from my_project.auth.domain.orders.cars import Cars
 
 
-class CarsService:
+class CarsService(GeneralService):
     def __init__(self):
         self._dao = CarsDAO()
 
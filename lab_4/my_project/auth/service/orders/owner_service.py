@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.owner_dao import OwnerDAO
 from my_project.auth.domain.orders.owner import Owner
 
 
-class OwnerService:
+class OwnerService(GeneralService):
     def __init__(self):
         self._dao = OwnerDAO()
 
@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.parking_network_dao import ParkingNetworkDAO
 from my_project.auth.domain.orders.parking_network import ParkingNetwork
 
 
-class ParkingNetworkService:
+class ParkingNetworkService(GeneralService):
     def __init__(self):
         self._dao = ParkingNetworkDAO()
 
@@ -1,8 +1,18 @@
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Optional, Tuple
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.parking_place_history_dao import ParkingPlaceHistoryDAO
 from my_project.auth.domain.orders.parking_place_history import ParkingPlaceHistory
 
+MAX_ERRORS_PER_CHUNK = 20
+
+
+class ParkingPlaceHistoryService(GeneralService):
+    _import_chunk_size = 1000
 
-class ParkingPlaceHistoryService:
     def __init__(self):
         self._dao = ParkingPlaceHistoryDAO()
 
@@ -20,3 +30,74 @@ class ParkingPlaceHistoryService:
 
     def delete_parking_place_history(self, history_id: int):
         return self._dao.delete(history_id)
+
+    def import_rows(self, rows: Iterable[Tuple[int, object]], chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Imports history rows (e.g. sensor logs) committing every chunk in its own transaction.
+        Invalid rows are skipped; a chunk which fails to insert (rejected by database, unknown parking place
+        or any other error) is rolled back as a whole and reported, and the import goes on with the next chunk.
+        :param rows: iterable of line number and parsed row (or ValueError of unparsable line)
+        :param chunk_size: count of rows per transaction
+        :return: report with totals and errors of chunks which had any
+        """
+        chunk_size = chunk_size or self._import_chunk_size
+        report = {"imported": 0, "rejected": 0, "chunks": 0, "failed_chunks": []}
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            report["chunks"] += 1
+            valid, errors = [], []
+            for line, row in chunk:
+                try:
+                    valid.append(self._history_values(row))
+                except (ValueError, TypeError, KeyError) as error:
+                    errors.append({"line": line, "error": str(error)})
+            imported = 0
+            if valid:
+                try:
+                    imported, _ = self._dao.create_bulk(valid, chunk_size)
+                except SQLAlchemyError as error:
+                    errors.append({"line": None, "error": f"Chunk rejected by database: {getattr(error, 'orig', error)}"})
+                except ValueError as error:
+                    errors.append({"line": None, "error": f"Chunk rejected: {error}"})
+                except Exception as error:
+                    current_app.logger.exception("Import of chunk %d failed", report["chunks"])
+                    errors.append({"line": None, "error": f"Chunk failed: {type(error).__name__}"})
+            report["imported"] += imported
+            report["rejected"] += len(chunk) - imported
+            if errors:
+                report["failed_chunks"].append({
+                    "chunk": report["chunks"],
+                    "first_line": chunk[0][0],
+                    "last_line": chunk[-1][0],
+                    "imported": imported,
+                    "rejected": len(chunk) - imported,
+                    "errors": errors[:MAX_ERRORS_PER_CHUNK],
+                })
+        return report
+
+    @staticmethod
+    def _history_values(row: object) -> Dict[str, Any]:
+        """
+        Validates imported row and converts its values to column types.
+        :param row: parsed row
+        :return: column values of history row
+        :raise ValueError: row is invalid
+        """
+        if isinstance(row, ValueError):
+            raise row
+        if not isinstance(row, dict):
+            raise ValueError("Row is not an object")
+        try:
+            values = {
+                "parking_place_id": int(row["parking_place_id"]),
+                "car_id": int(row["car_id"]),
+                "occupied_from": datetime.fromisoformat(row["occupied_from"]),
+                "occupied_to": datetime.fromisoformat(row["occupied_to"]),
+            }
+        except KeyError as error:
+            raise ValueError(f"Missing field {error}") from None
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Invalid value: {error}") from None
+        if values["occupied_from"] >= values["occupied_to"]:
+            raise ValueError("occupied_from must be before occupied_to")
+        return values
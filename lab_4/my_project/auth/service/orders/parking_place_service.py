@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.parking_place_dao import ParkingPlaceDAO
 from my_project.auth.domain.orders.parking_place import ParkingPlace
 
 
-class ParkingPlaceService:
+class ParkingPlaceService(GeneralService):
     def __init__(self):
         self._dao = ParkingPlaceDAO()
 
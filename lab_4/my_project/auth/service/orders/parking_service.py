@@ -1,8 +1,11 @@
+from datetime import datetime
+from my_project import occupancy
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.parking_dao import ParkingDAO
 from my_project.auth.domain.orders.parking import Parking
 
 
-class ParkingService:
+class ParkingService(GeneralService):
     def __init__(self):
         self._dao = ParkingDAO()
 
@@ -20,3 +23,21 @@ class ParkingService:
 
     def delete_parking(self, parking_id: int):
         return self._dao.delete(parking_id)
+
+    def find_free_places(self, parking_id: int, start: datetime, stop: datetime):
+        return self._dao.find_free_places(parking_id, start, stop)
+
+    def get_occupancy(self, parking_id: int, start: datetime, stop: datetime, bucket: int):
+        found = self._dao.find_occupancy_intervals(parking_id, start, stop)
+        if found is None:
+            return None
+        place_count, intervals = found
+        starts, stops = occupancy.to_arrays(intervals)
+        return occupancy.occupancy_stats(starts, stops, place_count,
+                                         occupancy.to_seconds(start), occupancy.to_seconds(stop), bucket)
+
+    def get_snapshot(self, parking_id: int, at: datetime):
+        return self._dao.find_snapshot(parking_id, at)
+
+    def get_hourly_occupancy(self, parking_id: int, start: datetime, stop: datetime):
+        return self._dao.find_hourly_occupancy(parking_id, start, stop)
@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.reservations_dao import ReservationsDAO
 from my_project.auth.domain.orders.reservations import Reservations
 
 
-class ReservationsService:
+class ReservationsService(GeneralService):
     def __init__(self):
         self._dao = ReservationsDAO()
 
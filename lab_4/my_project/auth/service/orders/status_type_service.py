@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.status_type_dao import StatusTypeDAO
 from my_project.auth.domain.orders.status_type import StatusType
 
 
-class StatusTypeService:
+class StatusTypeService(GeneralService):
     def __init__(self):
         self._dao = StatusTypeDAO()
 
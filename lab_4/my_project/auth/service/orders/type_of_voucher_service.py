@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.type_of_voucher_dao import TypeOfVoucherDAO
 from my_project.auth.domain.orders.type_of_voucher import TypeOfVoucher
 
 
-class TypeOfVoucherService:
+class TypeOfVoucherService(GeneralService):
     def __init__(self):
         self._dao = TypeOfVoucherDAO()
 
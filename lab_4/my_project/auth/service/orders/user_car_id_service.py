@@ -1,8 +1,10 @@
+from typing import Optional
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.user_car_id_dao import UserCarIdDAO
 from my_project.auth.domain.orders.user_car_id import UserCarId
 
 
-class UserCarIdService:
+class UserCarIdService(GeneralService):
     def __init__(self):
         self._dao = UserCarIdDAO()
 
@@ -15,8 +17,8 @@ class UserCarIdService:
     def find_by_user_and_car_id(self, user_id: int, car_id: int):
         return self._dao.find_by_two_id(user_id, car_id)
 
-    def update_user_car_id(self, user_id: int, car_id: int, user_car_id: UserCarId):
-        return self._dao.update_by_two_id((user_id, car_id), user_car_id)
+    def update_user_car_id(self, user_id: int, car_id: int, user_car_id: UserCarId, version: Optional[int] = None):
+        return self._dao.update_by_two_id((user_id, car_id), user_car_id, version)
 
-    def delete_user_car_id(self, user_id: int, car_id: int):
-        return self._dao.delete((user_id, car_id))
+    def delete_user_car_id(self, user_id: int, car_id: int, version: Optional[int] = None):
+        return self._dao.delete((user_id, car_id), version)
@@ -1,6 +1,7 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.user_dao import UserDAO
 
-class UserService:
+class UserService(GeneralService):
     def __init__(self):
         self._dao = UserDAO()
 
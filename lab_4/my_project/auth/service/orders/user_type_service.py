@@ -1,9 +1,10 @@
 from typing import List
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.user_type_dao import UserTypeDAO
 from my_project.auth.domain.orders.user_type import UserType
 
 
-class UserTypeService:
+class UserTypeService(GeneralService):
     def __init__(self):
         self._dao = UserTypeDAO()
 
@@ -1,8 +1,9 @@
+from my_project.auth.service.general_service import GeneralService
 from my_project.auth.dao.orders.voucher_dao import VoucherDAO
 from my_project.auth.domain.orders.voucher import Voucher
 
 
-class VoucherService:
+class VoucherService(GeneralService):
     def __init__(self):
         self._dao = VoucherDAO()
 
@@ -0,0 +1,17 @@
+"""
+Strong entity tags of DTOs shared by conditional reads (If-None-Match) and conditional writes (If-Match).
+"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+
+def dto_etag(dto: Dict[str, Any]) -> str:
+    """
+    Computes strong ETag of DTO as hash of its canonical JSON.
+    :param dto: DTO object as dictionary
+    :return: ETag value (unquoted)
+    """
+    canonical = json.dumps(dto, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()
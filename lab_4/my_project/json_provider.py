@@ -0,0 +1,73 @@
+"""
+JSON provider of the application: ISO-8601 datetimes and C-accelerated encoding with orjson when it is installed.
+"""
+
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, Optional, Union
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used instead
+    orjson = None
+
+# keyword arguments of json.dumps which have an orjson equivalent
+_FAST_KWARGS = {"default", "sort_keys", "ensure_ascii", "separators", "indent"}
+
+
+def _default(value: Any) -> Any:
+    """
+    Serializes values unknown to JSON, datetimes as ISO-8601 instead of RFC 822 of Flask.
+    :param value: value to serialize
+    :return: JSON-compatible value
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return DefaultJSONProvider.default(value)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Drop-in replacement of Flask's provider used by jsonify, request.get_json and streamed lists.
+    Output of orjson and stdlib fallback is the same except for whitespace of non-compact output.
+    """
+    default: Callable[[Any], Any] = staticmethod(_default)
+
+    def __init__(self, app: Flask, fast: Optional[bool] = None) -> None:
+        super().__init__(app)
+        self.fast = orjson is not None and (fast if fast is not None else app.config.get("JSON_FAST_ENCODER", True))
+        if self.fast:
+            self.ensure_ascii = False  # orjson always writes UTF-8
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if self.fast and kwargs.keys() <= _FAST_KWARGS:
+            return self._dump_bytes(obj, kwargs).decode()
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if self.fast and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if not self.fast:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        dump_args = {"indent": 2} if (self.compact is None and self._app.debug) or self.compact is False else {}
+        return self._app.response_class(self._dump_bytes(obj, dump_args) + b"\n", mimetype=self.mimetype)
+
+    def _dump_bytes(self, obj: Any, kwargs: Dict[str, Any]) -> bytes:
+        """
+        Serializes object with orjson honoring provider settings and supported json.dumps arguments.
+        :param obj: object to serialize
+        :param kwargs: json.dumps keyword arguments (separators are always compact)
+        :return: UTF-8 encoded JSON
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option)
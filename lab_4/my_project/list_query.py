@@ -0,0 +1,79 @@
+"""
+Filter, sort and include language of list endpoints:
+`?filter[column][op]=value&sort=-column,column&include=relationship,relationship.relationship`.
+Parsed here from request arguments and compiled into SQL and loader options by GeneralDAO.
+"""
+
+import re
+from typing import List, Mapping, Optional, Tuple
+
+OPERATORS = ("eq", "ne", "lt", "lte", "gt", "gte", "in", "prefix", "null")
+MAX_IN_VALUES = 1000
+MAX_INCLUDES = 10
+MAX_INCLUDE_DEPTH = 3
+
+_FILTER_ARG = re.compile(r"^filter\[(?P<column>[A-Za-z_][A-Za-z0-9_]*)\](?:\[(?P<operator>[a-z]+)\])?$")
+_INCLUDE_PATH = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+class ListQuery:
+    """
+    Filters (ANDed), sort order and included relationships of list request;
+    columns and relationships are validated against the domain type by DAO.
+    """
+
+    def __init__(self, filters: Optional[List[Tuple[str, str, str]]] = None,
+                 sort: Optional[List[Tuple[str, bool]]] = None, include: Optional[List[str]] = None) -> None:
+        """
+        :param filters: list of column, operator and raw value
+        :param sort: list of column and whether order is descending
+        :param include: dotted relationship paths to embed into DTOs
+        """
+        self.filters = filters or []
+        self.sort = sort or []
+        self.include = include or []
+
+    def __bool__(self) -> bool:
+        return bool(self.filters or self.sort or self.include)
+
+    def __repr__(self) -> str:
+        return f"ListQuery({self.filters!r}, {self.sort!r}, {self.include!r})"
+
+    @staticmethod
+    def from_args(args: Mapping[str, str]) -> "ListQuery":
+        """
+        Parses filter, sort and include arguments of request; other arguments are ignored.
+        `filter[column]=value` is a shortcut of `filter[column][eq]=value`,
+        `in` takes comma-separated values, `null` takes true or false;
+        `include` takes comma-separated relationship paths, e.g. `parking_place.parking,user`.
+        :param args: request arguments
+        :return: parsed query (empty when there are no such arguments)
+        :raise ValueError: malformed argument or unknown operator
+        """
+        filters = []
+        for name, value in args.items():
+            if not name.startswith("filter"):
+                continue
+            match = _FILTER_ARG.match(name)
+            if match is None:
+                raise ValueError(f"Malformed filter argument {name!r}")
+            operator = match.group("operator") or "eq"
+            if operator not in OPERATORS:
+                raise ValueError(f"Unknown filter operator {operator!r}, expected one of {', '.join(OPERATORS)}")
+            filters.append((match.group("column"), operator, value))
+        sort = []
+        for item in args.get("sort", "").split(","):
+            item = item.strip()
+            if item:
+                sort.append((item.lstrip("-"), item.startswith("-")))
+        if "sort" in args and not sort:
+            raise ValueError("Empty sort argument")
+        include = list(dict.fromkeys(path.strip() for path in args.get("include", "").split(",") if path.strip()))
+        if "include" in args and not include:
+            raise ValueError("Empty include argument")
+        if len(include) > MAX_INCLUDES:
+            raise ValueError(f"More than {MAX_INCLUDES} includes requested")
+        for path in include:
+            if not _INCLUDE_PATH.match(path) or path.count(".") >= MAX_INCLUDE_DEPTH:
+                raise ValueError(f"Malformed include {path!r} (at most {MAX_INCLUDE_DEPTH} levels)")
+        return ListQuery(filters, sort, include)
@@ -0,0 +1,127 @@
+"""
+Schema and data migrations which are safe to run on existing database, and data import commands.
+Schema migrations run with `flask ensure-schema` (or `ensure-columns` / `ensure-indexes`),
+or at startup when DB_ENSURE_SCHEMA is set.
+"""
+
+from typing import List, Optional
+
+import click
+from flask import Flask
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn
+
+
+def ensure_columns(engine: Engine, metadata: MetaData) -> List[str]:
+    """
+    Adds columns declared on domain models which are missing in existing tables (ALTER TABLE ... ADD COLUMN).
+    Columns which are NOT NULL without server default cannot be added to filled table and are skipped.
+    :param engine: engine of database to migrate
+    :param metadata: metadata with declared tables
+    :return: names of added columns as "table.column"
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    preparer = engine.dialect.identifier_preparer
+    added = []
+    with engine.begin() as connection:
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            names = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in names or column.primary_key:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    continue
+                definition = CreateColumn(column).compile(dialect=engine.dialect)
+                connection.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {definition}"))
+                added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def ensure_indexes(engine: Engine, metadata: MetaData) -> List[str]:
+    """
+    Creates indexes declared on domain models which are missing in existing tables.
+    Index is treated as present when the table has an index with the same name or the same columns.
+    Tables themselves are not touched (db.create_all creates only missing tables).
+    :param engine: engine of database to migrate
+    :param metadata: metadata with declared tables
+    :return: names of created indexes
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = inspector.get_indexes(table.name)
+        names = {index["name"] for index in existing}
+        column_lists = {tuple(index["column_names"]) for index in existing}
+        for index in table.indexes:
+            if index.name in names or tuple(column.name for column in index.columns) in column_lists:
+                continue
+            index.create(bind=engine)
+            created.append(index.name)
+    return created
+
+
+def register_commands(app: Flask) -> None:
+    """
+    Registers migration commands of `flask` CLI.
+    :param app: Flask application
+    """
+    @app.cli.command("ensure-columns")
+    def ensure_columns_command() -> None:
+        """Add columns declared on models which are missing in database."""
+        from my_project import db
+
+        added = ensure_columns(db.engine, db.metadata)
+        click.echo(f"Added columns: {', '.join(added)}" if added else "All columns are present")
+
+    @app.cli.command("ensure-indexes")
+    def ensure_indexes_command() -> None:
+        """Create indexes declared on models which are missing in database."""
+        from my_project import db
+
+        created = ensure_indexes(db.engine, db.metadata)
+        click.echo(f"Created indexes: {', '.join(created)}" if created else "All indexes are present")
+
+    @app.cli.command("ensure-schema")
+    def ensure_schema_command() -> None:
+        """Add missing columns, then create missing indexes (run once per deploy)."""
+        from my_project import db
+
+        added = ensure_columns(db.engine, db.metadata)
+        click.echo(f"Added columns: {', '.join(added)}" if added else "All columns are present")
+        created = ensure_indexes(db.engine, db.metadata)
+        click.echo(f"Created indexes: {', '.join(created)}" if created else "All indexes are present")
+
+    @app.cli.command("backfill-occupancy-rollup")
+    @click.option("--parking-id", type=int, default=None, help="Rebuild only this parking.")
+    def backfill_occupancy_rollup_command(parking_id: Optional[int]) -> None:
+        """Rebuild hourly occupancy rollup from parking place history."""
+        from my_project.auth.dao import parking_place_history_dao
+
+        count = parking_place_history_dao.rebuild_rollup(parking_id)
+        click.echo(f"Rollup rows: {count}")
+
+    @app.cli.command("import-history")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--format", "file_format", default=None, help="csv, ndjson, csv.gz or ndjson.gz (default: by name).")
+    @click.option("--chunk-size", type=int, default=None, help="Rows committed per transaction.")
+    def import_history_command(path: str, file_format: Optional[str], chunk_size: Optional[int]) -> None:
+        """Import parking place history from CSV or NDJSON file (optionally gzip-compressed)."""
+        from my_project.auth.controller import parking_place_history_controller
+        from my_project.row_files import detect_format, read_rows
+
+        file_format, compressed = detect_format(path, file_format=file_format)
+        with open(path, "rb") as file:
+            report = parking_place_history_controller.import_rows(read_rows(file, file_format, compressed), chunk_size)
+        for chunk in report["failed_chunks"]:
+            click.echo(f"Chunk {chunk['chunk']} (lines {chunk['first_line']}-{chunk['last_line']}): "
+                       f"{chunk['rejected']} rejected", err=True)
+            for error in chunk["errors"]:
+                click.echo(f"  line {error['line']}: {error['error']}", err=True)
+        click.echo(f"Imported: {report['imported']}, rejected: {report['rejected']}, chunks: {report['chunks']}")
@@ -0,0 +1,208 @@
+"""
+Session which sends read-only DAO calls to replica databases
+and can merge commits of several DAO calls into one transaction.
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Hashable, Iterator, List, Optional
+
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+READ_ONLY = "read_only"
+WROTE = "wrote"
+REPLICA = "replica"
+PINNED_REPLICA = "pinned_replica"
+DEFERRED_COMMIT = "deferred_commit"
+AFTER_COMMIT = "after_commit"
+
+
+class ReplicaRouter:
+    """
+    Round-robin choice among replica binds with temporary ejection of failed replicas.
+    """
+
+    def __init__(self, eject_seconds: float = 30.0) -> None:
+        self.eject_seconds = eject_seconds
+        self._keys: List[str] = []
+        self._down_until = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def configure(self, keys: List[str], eject_seconds: Optional[float] = None) -> None:
+        """
+        Sets bind keys of replicas.
+        :param keys: bind keys of SQLALCHEMY_BINDS
+        :param eject_seconds: time a failed replica is skipped
+        """
+        with self._lock:
+            self._keys = list(keys)
+            self._down_until = {}
+            if eject_seconds is not None:
+                self.eject_seconds = eject_seconds
+
+    def choose(self) -> Optional[str]:
+        """
+        Gets bind key of next healthy replica.
+        :return: bind key or None when there is no healthy replica
+        """
+        now = time.monotonic()
+        healthy = [key for key in self._keys if self._down_until.get(key, 0) <= now]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def is_healthy(self, key: str) -> bool:
+        """
+        Checks whether replica is configured and not ejected.
+        :param key: bind key of replica
+        :return: whether reads may be routed to the replica
+        """
+        return key in self._keys and self._down_until.get(key, 0) <= time.monotonic()
+
+    def eject(self, key: str) -> None:
+        """
+        Excludes replica from routing for eject_seconds.
+        :param key: bind key of failed replica
+        """
+        with self._lock:
+            self._down_until[key] = time.monotonic() + self.eject_seconds
+
+    def watch(self, key: str, engine) -> None:
+        """
+        Ejects replica when its engine fails to connect or loses connection.
+        :param key: bind key of replica
+        :param engine: engine of replica
+        """
+        @event.listens_for(engine, "handle_error")
+        def _on_error(context) -> None:
+            if context.is_disconnect or context.connection is None:
+                self.eject(key)
+
+
+replica_router = ReplicaRouter()
+
+
+class RoutingSession(Session):
+    """
+    Session which reads from replica inside `read_only` block
+    unless this session has already written (read-your-writes); everything else goes to primary.
+    All reads of the session go to the same replica while it is healthy, so reads of one request
+    (e.g. list ETag and the list itself) see the same replication lag.
+    Inside `deferred_commit` block commit only flushes, so the block stays in one transaction;
+    cache maintenance registered with `after_commit` runs after the real commit and is dropped on rollback.
+    """
+
+    def commit(self) -> None:
+        if self.info.get(DEFERRED_COMMIT):
+            self.flush()
+            return
+        super().commit()
+        for callback in self.info.pop(AFTER_COMMIT, {}).values():
+            callback()
+
+    def rollback(self) -> None:
+        super().rollback()
+        self.info.pop(AFTER_COMMIT, None)
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if getattr(clause, "is_dml", False):
+            self.info[WROTE] = True
+        elif bind is None and self.info.get(READ_ONLY) and not self.info.get(WROTE):
+            key = self.info.get(PINNED_REPLICA)
+            if key is None or not replica_router.is_healthy(key):
+                key = self.info[PINNED_REPLICA] = replica_router.choose()
+            if key is not None:
+                self.info[REPLICA] = key
+                return self._db.engines[key]
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush(session, flush_context) -> None:
+    session.info[WROTE] = True
+
+
+@contextmanager
+def read_only(session) -> Iterator[None]:
+    """
+    Marks statements executed inside the block as allowed to go to replica.
+    :param session: session or scoped session
+    """
+    info = session.info
+    previous = info.get(READ_ONLY)
+    info[READ_ONLY] = True
+    try:
+        yield
+    finally:
+        info[READ_ONLY] = previous
+
+
+@contextmanager
+def deferred_commit(session) -> Iterator[None]:
+    """
+    Turns commits of DAO calls inside the block into flushes;
+    the caller commits or rolls back the whole block afterwards.
+    A DAO call which fails inside the block rolls back everything written since the block started.
+    :param session: session or scoped session
+    """
+    info = session.info
+    info[DEFERRED_COMMIT] = True
+    try:
+        yield
+    finally:
+        info.pop(DEFERRED_COMMIT, None)
+
+
+def after_commit(session, key: Hashable, callback: Callable[[], None]) -> None:
+    """
+    Runs cache maintenance of a committed DAO write: at once, or inside `deferred_commit` block
+    after the block's transaction is committed, so concurrent readers cannot cache rows it replaces.
+    Callbacks are deduplicated by key (e.g. table and primary key of evicted object).
+    :param session: session or scoped session
+    :param key: identity of the maintenance
+    :param callback: function evicting or updating cached data
+    """
+    if session.info.get(DEFERRED_COMMIT):
+        session.info.setdefault(AFTER_COMMIT, {})[key] = callback
+    else:
+        callback()
+
+
+def has_uncommitted_writes(session) -> bool:
+    """
+    Checks whether the session wrote in a `deferred_commit` block which is not committed yet.
+    Caches must be neither read for nor filled from such a session.
+    :param session: session or scoped session
+    :return: whether cache maintenance is pending
+    """
+    return bool(session.info.get(AFTER_COMMIT))
+
+
+def replica_read(method: Callable) -> Callable:
+    """
+    Decorates DAO method which only reads, so its queries may be served by replica.
+    When the chosen replica fails, the replica is ejected and the call is repeated on primary.
+    :param method: DAO method using self._session
+    :return: decorated method
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        info = self._session.info
+        info[REPLICA] = None
+        with read_only(self._session):
+            try:
+                return method(self, *args, **kwargs)
+            except OperationalError:
+                key = info.pop(REPLICA, None)
+                if key is None:
+                    raise
+                replica_router.eject(key)
+                self._session.rollback()
+        return method(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,126 @@
+"""
+Streaming reader and writer of row files (CSV or NDJSON, optionally gzip-compressed) used by imports and exports.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import zlib
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+CSV = "csv"
+NDJSON = "ndjson"
+FORMATS_BY_SUFFIX = {".csv": CSV, ".ndjson": NDJSON, ".jsonl": NDJSON}
+FORMATS_BY_MIMETYPE = {"text/csv": CSV, "application/x-ndjson": NDJSON}
+GZIP_MIMETYPES = {"application/gzip", "application/x-gzip"}
+
+Row = Union[Dict[str, object], ValueError]  # parsed row or error of unparsable line
+
+
+def detect_format(filename: Optional[str] = None, mimetype: Optional[str] = None,
+                  file_format: Optional[str] = None) -> Tuple[str, bool]:
+    """
+    Detects format and compression of row file from explicit format, file name or MIME type.
+    :param filename: name of file, e.g. "history.csv.gz"
+    :param mimetype: MIME type of file
+    :param file_format: explicit format "csv", "ndjson", "csv.gz" or "ndjson.gz"
+    :return: format and whether file is gzip-compressed
+    :raise ValueError: format cannot be detected
+    """
+    if file_format:
+        name, compressed = file_format.lower(), file_format.lower().endswith(".gz")
+        name = name[:-3] if compressed else name
+        if name not in (CSV, NDJSON):
+            raise ValueError(f"Unknown format {file_format!r}")
+        return name, compressed
+    if filename:
+        root, suffix = os.path.splitext(filename.lower())
+        compressed = suffix == ".gz"
+        if compressed:
+            suffix = os.path.splitext(root)[1]
+        if suffix in FORMATS_BY_SUFFIX:
+            return FORMATS_BY_SUFFIX[suffix], compressed
+    if mimetype in FORMATS_BY_MIMETYPE:
+        return FORMATS_BY_MIMETYPE[mimetype], False
+    raise ValueError("Cannot detect format of file, pass csv, ndjson, csv.gz or ndjson.gz")
+
+
+def read_rows(binary: BinaryIO, file_format: str, compressed: bool = False) -> Iterator[Tuple[int, Row]]:
+    """
+    Parses row file lazily, so memory does not depend on file size.
+    Unparsable NDJSON lines are yielded as ValueError to be reported together with invalid rows.
+    :param binary: binary stream of file
+    :param file_format: "csv" (with header line) or "ndjson"
+    :param compressed: whether stream is gzip-compressed
+    :return: iterator of line number and row
+    """
+    if isinstance(binary, io.RawIOBase):
+        binary = io.BufferedReader(binary)
+    if compressed:
+        binary = gzip.GzipFile(fileobj=binary, mode="rb")
+    text = io.TextIOWrapper(binary, encoding="utf-8-sig", newline="" if file_format == CSV else None)
+    if file_format == CSV:
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for number, line in enumerate(text, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except ValueError as error:
+            yield number, ValueError(f"Malformed JSON: {error}")
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], file_format: str, columns: List[str],
+               rows_per_chunk: int = 1000) -> Iterator[bytes]:
+    """
+    Serializes rows lazily as CSV (with header line) or NDJSON, datetimes in ISO format.
+    :param rows: iterable of dictionaries of column values
+    :param file_format: "csv" or "ndjson"
+    :param columns: column names (CSV header)
+    :param rows_per_chunk: count of rows per yielded chunk
+    :return: iterator of UTF-8 encoded chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if file_format == CSV else None
+    if writer is not None:
+        writer.writerow(columns)
+    for number, row in enumerate(rows, 1):
+        if writer is not None:
+            writer.writerow([_text_value(row[column]) for column in columns])
+        else:
+            buffer.write(json.dumps(row, default=_text_value) + "\n")
+        if number % rows_per_chunk == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Compresses stream of chunks into gzip stream on the fly.
+    :param chunks: iterable of uncompressed chunks
+    :param level: compression level
+    :return: iterator of compressed chunks
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _text_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
@@ -0,0 +1,87 @@
+"""
+Fixtures of API tests: application on a temporary SQLite database, JWT headers and seeded parking.
+"""
+
+import os
+import sys
+import types
+from typing import Dict
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if "my" not in sys.modules:
+    # secrets module of deployments (ignored by git)
+    sys.modules["my"] = types.SimpleNamespace(jwt_secret_key="test-secret-key-of-at-least-32-bytes",
+                                              db_password="", db_host="localhost")
+
+import config  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.sqlite'}"
+    config.Config.TESTING = True
+    from my_project import create_app
+    return create_app()
+
+
+@pytest.fixture
+def db(app):
+    """
+    Database with tables and process caches emptied before the test.
+    Requests of the test client get their own application context (and session), as in production.
+    """
+    from my_project import db
+    from my_project.auth.dao.availability_index import availability_index
+    from my_project.auth.dao.general_dao import GeneralDAO
+
+    with app.app_context():
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
+    GeneralDAO.drop_caches()
+    availability_index.invalidate()
+    return db
+
+
+@pytest.fixture
+def client(app, db):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(app) -> Dict[str, str]:
+    from flask_jwt_extended import create_access_token
+
+    with app.app_context():
+        return {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+
+
+@pytest.fixture
+def parking(app, db) -> Dict[str, object]:
+    """
+    Seeds parking with 5 places, 3 users with cars and lookup rows.
+    :return: ids of seeded rows
+    """
+    with app.app_context():
+        _seed_parking(db)
+    return {"parking_id": 1, "place_ids": [1, 2, 3, 4, 5], "user_ids": [1, 2, 3], "car_ids": [1, 2, 3]}
+
+
+def _seed_parking(db) -> None:
+    from my_project.auth.domain import (Address, Cars, Owner, Parking, ParkingNetwork, ParkingPlace, StatusType,
+                                        User, UserType)
+
+    db.session.add_all([UserType(id=1, type="regular"), StatusType(id=1, type="free"),
+                        Owner(id=1, name="owner", surname="s", age=40, password="p"),
+                        Address(id=1, street="Main", number=1, index=79000)])
+    db.session.add(ParkingNetwork(id=1, owner_id=1, parking_amount=1))
+    db.session.add(Parking(id=1, location="center", parking_network_id=1, address_id=1))
+    for number in range(1, 6):
+        db.session.add(ParkingPlace(id=number, parking_id=1, status_id=1, row=(number - 1) // 3, row_place=number))
+    for number in range(1, 4):
+        db.session.add(User(id=number, user_type_id=1, name=f"user{number}", surname="s", email=f"u{number}@x"))
+        db.session.add(Cars(id=number, car_owner=f"user{number}", car_brand="brand", car_model="model",
+                            car_number=f"BC{number:04d}"))
+    db.session.commit()
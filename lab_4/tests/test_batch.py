@@ -0,0 +1,96 @@
+"""
+POST /batch: sub-requests in one request, optionally in one transaction.
+"""
+
+import pytest
+
+from my_project.auth.dao.entity_cache import MemoryEntityCache
+from my_project.auth.dao.general_dao import GeneralDAO
+
+
+@pytest.fixture
+def entity_cache():
+    previous = GeneralDAO.get_entity_cache()
+    cache = MemoryEntityCache()
+    GeneralDAO.set_entity_cache(cache)
+    yield cache
+    GeneralDAO.set_entity_cache(previous)
+
+
+def _row(client, headers, place_id=1):
+    return client.get(f"/parking_places/{place_id}", headers=headers).get_json()["row"]
+
+
+def test_responses_are_returned_in_order(client, auth_headers, parking):
+    response = client.post("/batch", headers=auth_headers, json=[
+        {"path": "/parking_places/1"},
+        {"method": "PATCH", "path": "/parking_places/2", "body": {"row": 9}},
+        {"path": "/parking_places/999"},
+        {"path": "/parking_places?ids=2&fields=row"},
+    ])
+    assert response.status_code == 200
+    results = response.get_json()
+    assert [result["status"] for result in results] == [200, 200, 404, 200]
+    assert results[3]["body"]["items"] == [{"row": 9}]
+
+
+def test_atomic_batch_is_committed_as_a_whole(client, auth_headers, parking, entity_cache):
+    assert _row(client, auth_headers) == 0
+    response = client.post("/batch", headers=auth_headers, json={"atomic": True, "requests": [
+        {"method": "PATCH", "path": "/parking_places/1", "body": {"row": 7}},
+        {"path": "/parking_places/1"},
+    ]})
+    assert response.status_code == 200
+    assert response.get_json()[1]["body"]["row"] == 7
+    assert _row(client, auth_headers) == 7
+
+
+def test_failed_atomic_batch_is_rolled_back_and_keeps_cache(client, auth_headers, parking, entity_cache):
+    assert _row(client, auth_headers) == 0
+    response = client.post("/batch", headers=auth_headers, json={"atomic": True, "requests": [
+        {"method": "PATCH", "path": "/parking_places/1", "body": {"row": 7}},
+        {"path": "/parking_places/1"},
+        {"path": "/parking_places/999"},
+    ]})
+    assert response.status_code == 404
+    assert [result["status"] for result in response.get_json()] == [424, 424, 404]
+    assert entity_cache.get("parking_place:1")["row"] == 0
+    assert _row(client, auth_headers) == 0
+
+
+def test_export_in_atomic_batch_keeps_earlier_writes(client, auth_headers, parking, entity_cache):
+    _row(client, auth_headers)
+    response = client.post("/batch", headers=auth_headers, json={"atomic": True, "requests": [
+        {"method": "PATCH", "path": "/parking_places/1", "body": {"row": 7}},
+        {"path": "/reservations/export?format=ndjson&gzip=false"},
+        {"method": "PATCH", "path": "/parking_places/2", "body": {"row": 8}},
+    ]})
+    assert [result["status"] for result in response.get_json()] == [200, 200, 200]
+    assert (_row(client, auth_headers), _row(client, auth_headers, 2)) == (7, 8)
+
+
+def test_malformed_batch_is_rejected(client, auth_headers, parking):
+    assert client.post("/batch", headers=auth_headers, json={"requests": []}).status_code == 422
+    assert client.post("/batch", headers=auth_headers, json=[{"path": "/batch"}]).status_code == 422
+    assert client.post("/batch", headers=auth_headers, json=[{"path": "/cars", "method": "TRACE"}]).status_code == 422
+
+
+def test_sub_requests_reuse_jwt_of_the_batch(client, auth_headers, parking, monkeypatch):
+    import flask_jwt_extended.view_decorators as view_decorators
+
+    decoded = []
+    decode = view_decorators._decode_jwt_from_request
+    monkeypatch.setattr(view_decorators, "_decode_jwt_from_request",
+                        lambda *args, **kwargs: decoded.append(1) or decode(*args, **kwargs))
+    response = client.post("/batch", headers=auth_headers, json=[{"path": f"/parking_places/{place_id}"}
+                                                                 for place_id in (1, 2, 3)])
+    assert [result["status"] for result in response.get_json()] == [200, 200, 200]
+    assert len(decoded) == 1
+
+
+def test_sub_request_authorization_is_rejected(client, auth_headers, parking):
+    for name in ("Authorization", "authorization"):
+        response = client.post("/batch", headers=auth_headers,
+                               json=[{"path": "/parking_places/1", "headers": {name: "Bearer other"}}])
+        assert response.status_code == 422
+    assert client.get("/parking_places/1").status_code == 401
@@ -0,0 +1,31 @@
+"""
+POST /<resource>/bulk: multi-row INSERTs of DTO rows.
+"""
+
+CAR = {"car_owner": "o", "car_brand": "b", "car_model": "m", "car_number": "N1"}
+
+
+def test_rows_are_created(client, auth_headers, db):
+    rows = [dict(CAR, car_number=f"N{number}") for number in range(5)]
+    response = client.post("/cars/bulk?chunk_size=2", json=rows, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.get_json()["created"] == 5
+    assert len(client.get("/cars", headers=auth_headers).get_json()) == 5
+
+
+def test_missing_required_column_is_rejected(client, auth_headers, db):
+    response = client.post("/cars/bulk", json=[{"car_owner": "a"}], headers=auth_headers)
+    assert response.status_code == 422
+    assert client.get("/cars", headers=auth_headers).get_json() == []
+
+
+def test_rows_with_different_columns_are_rejected(client, auth_headers, db):
+    rows = [CAR, dict(CAR, id=100)]
+    assert client.post("/cars/bulk", json=rows, headers=auth_headers).status_code == 422
+    assert client.get("/cars", headers=auth_headers).get_json() == []
+
+
+def test_constraint_violation_is_rejected(client, auth_headers, db):
+    rows = [dict(CAR, id=1), dict(CAR, id=1)]
+    assert client.post("/cars/bulk", json=rows, headers=auth_headers).status_code == 422
+    assert client.get("/cars", headers=auth_headers).get_json() == []
@@ -0,0 +1,51 @@
+"""
+ETags of reads and If-Match preconditions of writes (optimistic concurrency).
+"""
+
+
+def test_if_none_match_returns_not_modified(client, auth_headers, parking):
+    response = client.get("/parking_places/1", headers=auth_headers)
+    etag = response.headers["ETag"]
+    assert client.get("/parking_places/1", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+
+def test_write_with_current_etag_succeeds_and_changes_etag(client, auth_headers, parking):
+    etag = client.get("/parking_places/1", headers=auth_headers).headers["ETag"]
+    response = client.patch("/parking_places/1", json={"row": 7}, headers={**auth_headers, "If-Match": etag})
+    assert response.status_code == 200
+    assert client.get("/parking_places/1", headers=auth_headers).headers["ETag"] != etag
+
+
+def test_write_with_stale_etag_fails_with_412(client, auth_headers, parking):
+    etag = client.get("/parking_places/1", headers=auth_headers).headers["ETag"]
+    assert client.patch("/parking_places/1", json={"row": 7},
+                        headers={**auth_headers, "If-Match": etag}).status_code == 200
+    assert client.patch("/parking_places/1", json={"row": 8},
+                        headers={**auth_headers, "If-Match": etag}).status_code == 412
+    assert client.delete("/parking_places/1", headers={**auth_headers, "If-Match": etag}).status_code == 412
+    assert client.get("/parking_places/1", headers=auth_headers).get_json()["row"] == 7
+
+
+def test_unconditional_and_wildcard_writes_succeed(client, auth_headers, parking):
+    assert client.patch("/parking_places/1", json={"row": 7}, headers=auth_headers).status_code == 200
+    assert client.patch("/parking_places/1", json={"row": 8},
+                        headers={**auth_headers, "If-Match": "*"}).status_code == 200
+
+
+def test_list_etag_changes_with_every_write(client, auth_headers, parking):
+    etags = [client.get("/parking_places", headers=auth_headers).headers["ETag"]]
+    assert client.get("/parking_places", headers={**auth_headers, "If-None-Match": etags[0]}).status_code == 304
+    client.patch("/parking_places/3", json={"row": 7}, headers=auth_headers)
+    etags.append(client.get("/parking_places", headers=auth_headers).headers["ETag"])
+    client.delete("/parking_places/5", headers=auth_headers)
+    client.post("/parking_places", json={"parking_id": 1, "row": 1, "row_place": 9, "status_id": 1},
+                headers=auth_headers)
+    # new row reuses id of the deleted one (SQLite), so count and keys are the same as before
+    assert client.get("/parking_places/5", headers=auth_headers).get_json()["row_place"] == 9
+    etags.append(client.get("/parking_places", headers=auth_headers).headers["ETag"])
+    assert len(set(etags)) == 3
+
+
+def test_list_is_ordered_by_primary_key(client, auth_headers, parking):
+    client.patch("/parking_places/1", json={"row": 9}, headers=auth_headers)
+    assert [place["id"] for place in client.get("/parking_places", headers=auth_headers).get_json()] == [1, 2, 3, 4, 5]
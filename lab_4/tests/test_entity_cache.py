@@ -0,0 +1,116 @@
+"""
+Entity cache of find_dto_by_id: backends, counters and invalidation by writes.
+"""
+
+import os
+import threading
+
+import pytest
+
+from my_project.auth.dao import entity_cache as entity_cache_module
+from my_project.auth.dao.entity_cache import MemoryEntityCache, RedisEntityCache
+from my_project.auth.dao.general_dao import GeneralDAO
+from my_project.auth.dao.orders.parking_place_dao import ParkingPlaceDAO
+
+REDIS_URL = os.environ.get("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        yield MemoryEntityCache(max_size=2, ttl=60)
+        return
+    redis = pytest.importorskip("redis")
+    try:
+        redis.Redis.from_url(REDIS_URL).ping()
+    except redis.ConnectionError:
+        pytest.skip(f"no redis-server at {REDIS_URL}")
+    cache = RedisEntityCache(REDIS_URL, ttl=60, namespace="test-entity:")
+    cache.clear("")
+    yield cache
+    cache.clear("")
+
+
+@pytest.fixture
+def entity_cache():
+    previous = GeneralDAO.get_entity_cache()
+    cache = MemoryEntityCache()
+    GeneralDAO.set_entity_cache(cache)
+    yield cache
+    GeneralDAO.set_entity_cache(previous)
+
+
+def test_backend_counts_hits_and_misses(backend):
+    assert backend.get("cars:1") is None
+    backend.set("cars:1", {"id": 1, "car_brand": "b"})
+    assert backend.get("cars:1") == {"id": 1, "car_brand": "b"}
+    assert backend.stats()["hits"] == 1 and backend.stats()["misses"] == 1 and backend.stats()["hit_ratio"] == 0.5
+
+
+def test_backend_deletes_and_clears_by_prefix(backend):
+    backend.set("cars:1", {"id": 1})
+    backend.set("owner:1", {"id": 1})
+    backend.delete("owner:1")
+    assert backend.get("owner:1") is None
+    backend.clear("cars:")
+    assert backend.get("cars:1") is None
+
+
+def test_fill_after_eviction_is_not_stored(backend):
+    generation = backend.generation
+    backend.delete("cars:1")
+    assert not backend.set("cars:1", {"id": 1}, generation)
+    assert backend.get("cars:1") is None
+    assert backend.set("cars:1", {"id": 1}, backend.generation)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryEntityCache(max_size=2, ttl=60)
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+    cache.get("a")
+    cache.set("c", {"id": 3})
+    assert cache.get("b") is None and cache.get("a") == {"id": 1} and cache.get("c") == {"id": 3}
+
+
+def test_memory_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(entity_cache_module.time, "monotonic", lambda: now[0])
+    cache = MemoryEntityCache(ttl=60)
+    cache.set("a", {"id": 1})
+    now[0] += 59
+    assert cache.get("a") == {"id": 1}
+    now[0] += 2
+    assert cache.get("a") is None
+
+
+@pytest.mark.parametrize("write", [
+    lambda client, headers: client.put("/parking_places/1", headers=headers,
+                                       json={"parking_id": 1, "row": 7, "row_place": 1, "status_id": 1}),
+    lambda client, headers: client.patch("/parking_places/1", headers=headers, json={"row": 7}),
+    lambda client, headers: client.delete("/parking_places/1", headers=headers),
+])
+def test_writes_evict_cached_dto(client, auth_headers, parking, entity_cache, write):
+    assert client.get("/parking_places/1", headers=auth_headers).get_json()["row"] == 0
+    assert entity_cache.get("parking_place:1")["row"] == 0
+    assert write(client, auth_headers).status_code in (200, 204)
+    assert entity_cache.get("parking_place:1") is None
+    response = client.get("/parking_places/1", headers=auth_headers)
+    assert response.status_code == 404 or response.get_json()["row"] == 7
+
+
+def test_dto_read_during_concurrent_write_is_not_cached(app, parking, entity_cache, monkeypatch):
+    find_by_id = ParkingPlaceDAO.find_by_id
+
+    def find_during_write(self, key):
+        obj = find_by_id(self, key)
+        # another request commits an update of the row and evicts it after this one read the row
+        writer = threading.Thread(target=entity_cache.delete, args=("parking_place:1",))
+        writer.start()
+        writer.join()
+        return obj
+
+    monkeypatch.setattr(ParkingPlaceDAO, "find_by_id", find_during_write)
+    with app.app_context():
+        assert ParkingPlaceDAO().find_dto_by_id(1)["row"] == 0
+    assert entity_cache.get("parking_place:1") is None
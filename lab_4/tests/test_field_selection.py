@@ -0,0 +1,17 @@
+"""
+Sparse fieldsets (?fields=) return the same values as the full DTO.
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("path, fields", [
+    ("/parking_networks", ["owner_id"]),
+    ("/parking_networks", ["id", "owner_id", "parking_amount"]),
+    ("/parking_places", ["id", "row"]),
+])
+def test_fields_are_taken_from_full_dto(client, auth_headers, parking, path, fields):
+    full = client.get(path, headers=auth_headers).get_json()
+    response = client.get(f"{path}?fields={','.join(fields)}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.get_json() == [{field: dto[field] for field in fields} for dto in full]
@@ -0,0 +1,43 @@
+"""
+Import of parking place history files in chunks committed one by one, and their export.
+"""
+
+import json
+
+from datetime import datetime
+
+
+def _line(place_id, start_hour, stop_hour, car_id=1):
+    return json.dumps({"parking_place_id": place_id, "car_id": car_id,
+                       "occupied_from": datetime(2024, 1, 1, start_hour).isoformat(),
+                       "occupied_to": datetime(2024, 1, 1, stop_hour).isoformat()})
+
+
+def _import(client, headers, lines, chunk_size=2):
+    response = client.post(f"/parking_place_histories/import?format=ndjson&chunk_size={chunk_size}",
+                           data="\n".join(lines), headers=headers, content_type="application/x-ndjson")
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_invalid_rows_are_skipped(client, auth_headers, parking):
+    report = _import(client, auth_headers, [_line(1, 10, 11), '{"car_id": 1}', _line(2, 10, 11), "not json"])
+    assert (report["imported"], report["rejected"], report["chunks"]) == (2, 2, 2)
+    assert [error["line"] for chunk in report["failed_chunks"] for error in chunk["errors"]] == [2, 4]
+
+
+def test_chunk_with_unknown_place_is_reported_and_import_goes_on(client, auth_headers, parking):
+    report = _import(client, auth_headers, [_line(1, 10, 11), _line(999, 10, 11), _line(2, 10, 11)])
+    assert (report["imported"], report["rejected"], report["chunks"]) == (1, 2, 2)
+    failed, = report["failed_chunks"]
+    assert (failed["first_line"], failed["last_line"], failed["rejected"]) == (1, 2, 2)
+    assert "999" in failed["errors"][0]["error"]
+    assert len(client.get("/parking_place_histories", headers=auth_headers).get_json()) == 1
+
+
+def test_export_has_columns_of_dto_only(client, auth_headers, parking):
+    _import(client, auth_headers, [_line(1, 10, 11), _line(2, 10, 12, 2)])
+    response = client.get("/parking_place_histories/export?format=ndjson&gzip=false", headers=auth_headers)
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [sorted(row) for row in rows] == [["car_id", "id", "occupied_from", "occupied_to", "parking_place_id"]] * 2
@@ -0,0 +1,29 @@
+"""
+Related objects embedded with `?include=`.
+"""
+
+import json
+
+from my_project.auth.dao.orders.parking_place_dao import ParkingPlaceDAO
+
+
+def test_list_embeds_included_relationships(client, auth_headers, parking):
+    items = client.get("/parking_places?include=parking.address,status", headers=auth_headers).get_json()
+    assert [item["id"] for item in items] == parking["place_ids"]
+    assert all(item["parking"]["address"]["street"] == "Main" and item["status"]["type"] == "free" for item in items)
+
+
+def test_stream_with_include_reads_every_batch(client, auth_headers, parking, monkeypatch):
+    monkeypatch.setattr(ParkingPlaceDAO, "_stream_batch_size", 2)
+    response = client.get("/parking_places?stream=ndjson&include=parking&sort=-row_place", headers=auth_headers)
+    assert response.status_code == 200
+    items = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [item["id"] for item in items] == [5, 4, 3, 2, 1]
+    assert all(item["parking"]["id"] == parking["parking_id"] for item in items)
+
+
+def test_invalid_include_is_rejected(client, auth_headers, parking):
+    assert client.get("/parking_places?include=nope", headers=auth_headers).status_code == 422
+    assert client.get("/parking_places?stream=ndjson&include=nope", headers=auth_headers).status_code == 422
+    assert client.get("/parking_places?stream=ndjson&include=parking&sort=row,-id",
+                      headers=auth_headers).status_code == 422
@@ -0,0 +1,65 @@
+"""
+Process-memory cache of lookup tables and its invalidation by concurrent writes.
+"""
+
+import threading
+
+from sqlalchemy import event, inspect
+
+from my_project.auth.dao import cached_dao
+from my_project.auth.dao.orders.status_type_dao import StatusTypeDAO
+from my_project.auth.domain import ParkingPlace, StatusType
+
+
+def test_rows_read_during_invalidation_are_not_cached(app, parking, monkeypatch):
+    inspect = cached_dao.inspect
+
+    def inspect_during_commit(subject):
+        # another request commits a write while this one reads the table
+        writer = threading.Thread(target=StatusTypeDAO._drop_rows)
+        writer.start()
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        return inspect(subject)
+
+    with app.app_context():
+        dao = StatusTypeDAO()
+        monkeypatch.setattr(cached_dao, "inspect", inspect_during_commit)
+        assert list(dao._cached_rows()) == [1]
+        assert StatusTypeDAO._rows is None
+        monkeypatch.setattr(cached_dao, "inspect", inspect)
+        dao._cached_rows()
+        assert list(StatusTypeDAO._rows) == [1]
+
+
+
+def test_cached_objects_are_persistent_in_session(app, parking):
+    from my_project import db
+
+    with app.app_context():
+        status = StatusTypeDAO().find_by_id(1)
+        assert inspect(status).persistent and status in db.session
+        status.type = "busy"
+        db.session.add(status)
+        db.session.commit()
+    with app.app_context():
+        assert db.session.get(StatusType, 1).type == "busy"
+
+
+def test_relationships_to_cached_objects_are_not_loaded_from_database(app, parking):
+    from my_project import db
+
+    statements = []
+
+    def record(connection, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        statuses = StatusTypeDAO().find_all()
+        place = db.session.query(ParkingPlace).filter(ParkingPlace.id == 1).one()
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert place.status is statuses[0]
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+    assert statements == []
@@ -0,0 +1,23 @@
+"""
+Schema migrations run by `flask ensure-schema` instead of application startup.
+"""
+
+from sqlalchemy import inspect
+
+
+def test_ensure_schema_creates_missing_indexes(app, db):
+    table = next(table for table in db.metadata.sorted_tables if table.indexes)
+    index = next(iter(table.indexes))
+    with app.app_context():
+        index.drop(bind=db.engine)
+        assert index.name not in {found["name"] for found in inspect(db.engine).get_indexes(table.name)}
+    result = app.test_cli_runner().invoke(args=["ensure-schema"])
+    assert result.exit_code == 0
+    assert "All columns are present" in result.output
+    assert index.name in result.output
+    with app.app_context():
+        assert index.name in {found["name"] for found in inspect(db.engine).get_indexes(table.name)}
+
+
+def test_startup_does_not_migrate_by_default(app):
+    assert app.config["DB_ENSURE_SCHEMA"] is False
@@ -0,0 +1,83 @@
+"""
+Hourly occupancy rollup maintained by writes of parking place history.
+"""
+
+from datetime import datetime
+
+
+def _history(place_id, start, stop, car_id=1):
+    return {"parking_place_id": place_id, "car_id": car_id,
+            "occupied_from": start.isoformat(), "occupied_to": stop.isoformat()}
+
+
+def _hours(client, headers):
+    response = client.get("/parkings/1/occupancy/hourly?from=2024-01-01T00:00:00&to=2024-01-02T00:00:00",
+                          headers=headers)
+    assert response.status_code == 200
+    return {hour["hour"][11:16]: (hour["occupied_minutes"], hour["entries"], hour["exits"])
+            for hour in response.get_json()["hours"]}
+
+
+def test_create_splits_period_by_hours(client, auth_headers, parking):
+    history = _history(1, datetime(2024, 1, 1, 10, 30), datetime(2024, 1, 1, 12, 15))
+    assert client.post("/parking_place_histories", json=history).status_code == 201
+    assert _hours(client, auth_headers) == {"10:00": (30, 1, 0), "11:00": (60, 0, 0), "12:00": (15, 0, 1)}
+
+
+def test_upserts_add_to_existing_hours(client, auth_headers, parking):
+    client.post("/parking_place_histories", json=_history(1, datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 10, 20)))
+    client.post("/parking_place_histories",
+                json=_history(2, datetime(2024, 1, 1, 10, 30), datetime(2024, 1, 1, 10, 45), 2))
+    assert _hours(client, auth_headers) == {"10:00": (35, 2, 2)}
+
+
+def test_update_and_delete_subtract_old_period(client, auth_headers, parking):
+    created = client.post("/parking_place_histories",
+                          json=_history(1, datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 11))).get_json()
+    assert client.put(f"/parking_place_histories/{created['id']}", headers=auth_headers,
+                      json=_history(1, datetime(2024, 1, 1, 13), datetime(2024, 1, 1, 13, 30))).status_code == 200
+    hours = _hours(client, auth_headers)
+    assert hours["10:00"] == (0, 0, 0) and hours["13:00"] == (30, 1, 1)
+    assert client.delete(f"/parking_place_histories/{created['id']}", headers=auth_headers).status_code == 204
+    assert all(counters == (0, 0, 0) for counters in _hours(client, auth_headers).values())
+
+
+def test_rebuild_matches_incremental_rollup(app, client, auth_headers, parking):
+    from my_project.auth.dao import parking_place_history_dao
+
+    client.post("/parking_place_histories", json=_history(1, datetime(2024, 1, 1, 9, 50), datetime(2024, 1, 1, 11)))
+    client.post("/parking_place_histories",
+                json=_history(3, datetime(2024, 1, 1, 10, 10), datetime(2024, 1, 1, 10, 40), 2))
+    incremental = _hours(client, auth_headers)
+    with app.app_context():
+        parking_place_history_dao.rebuild_rollup(1)
+    assert _hours(client, auth_headers) == incremental
+
+
+def test_history_of_unknown_place_is_rejected(client, auth_headers, parking):
+    history = _history(999, datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 11))
+    assert client.post("/parking_place_histories", json=history).status_code == 422
+    assert client.post("/parking_place_histories/bulk", json=[history], headers=auth_headers).status_code == 422
+    assert _hours(client, auth_headers) == {}
+
+
+def test_pending_rollup_keeps_hourly_deltas_instead_of_rows():
+    from my_project.auth.dao.orders.parking_place_history_dao import PendingRollup
+
+    pending = PendingRollup()
+    for minute in range(0, 60, 10):
+        pending.track_row(_history(1, datetime(2024, 1, 1, 10, minute), datetime(2024, 1, 1, 10, minute + 5)))
+    pending.track_row({"parking_place_id": 1})
+    assert pending.deltas == {(1, datetime(2024, 1, 1, 10)): [30.0, 6, 6]}
+
+
+def test_occupancy_stats_are_built_from_query_rows(client, auth_headers, parking):
+    client.post("/parking_place_histories", json=_history(1, datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 11)))
+    client.post("/parking_place_histories",
+                json=_history(2, datetime(2024, 1, 1, 10, 30), datetime(2024, 1, 1, 12), 2))
+    response = client.get("/parkings/1/occupancy?from=2024-01-01T10:00:00&to=2024-01-01T12:00:00",
+                          headers=auth_headers)
+    assert response.status_code == 200
+    stats = response.get_json()
+    assert (stats["sessions"], stats["peak_occupancy"], stats["peak_at"]) == (2, 2, "2024-01-01T10:30:00")
+    assert [bucket["average"] for bucket in stats["occupancy"]] == [1.5, 1.0]
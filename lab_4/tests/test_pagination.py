@@ -0,0 +1,38 @@
+"""
+Keyset pagination of list endpoints (`?limit=&after=`).
+"""
+
+
+def _all_pages(client, headers, url):
+    items, cursor, pages = [], None, 0
+    while True:
+        response = client.get(url + (f"&after={cursor}" if cursor else ""), headers=headers)
+        assert response.status_code == 200
+        page = response.get_json()
+        items.extend(page["items"])
+        pages += 1
+        cursor = page["next"]
+        if cursor is None:
+            return items, pages
+
+
+def test_pages_cover_all_rows_once_in_key_order(client, auth_headers, parking):
+    items, pages = _all_pages(client, auth_headers, "/parking_places?limit=2")
+    assert [item["id"] for item in items] == parking["place_ids"]
+    assert pages == 3
+
+
+def test_pages_follow_descending_sort_with_ties(client, auth_headers, parking):
+    items, _ = _all_pages(client, auth_headers, "/parking_places?limit=2&sort=-row")
+    assert [(item["row"], item["id"]) for item in items] == [(1, 5), (1, 4), (0, 3), (0, 2), (0, 1)]
+
+
+def test_last_page_has_no_cursor(client, auth_headers, parking):
+    page = client.get("/parking_places?limit=5", headers=auth_headers).get_json()
+    assert len(page["items"]) == 5
+    assert page["next"] is None
+
+
+def test_malformed_cursor_is_rejected(client, auth_headers, parking):
+    assert client.get("/parking_places?limit=2&after=garbage", headers=auth_headers).status_code == 422
+    assert client.get("/parking_places?limit=0", headers=auth_headers).status_code == 422
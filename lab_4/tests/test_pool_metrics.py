@@ -0,0 +1,38 @@
+"""
+Connection pool metrics collected per engine.
+"""
+
+from sqlalchemy import create_engine
+
+from my_project.auth.dao.pool_metrics import MeteredQueuePool, PoolMetricsRegistry
+
+
+def _engine(path, pool_size=1, max_overflow=2):
+    return create_engine(f"sqlite:///{path}", poolclass=MeteredQueuePool, pool_size=pool_size,
+                         max_overflow=max_overflow)
+
+
+def test_metrics_are_labeled_by_bind(tmp_path):
+    registry = PoolMetricsRegistry()
+    primary, replica = _engine(tmp_path / "primary.sqlite"), _engine(tmp_path / "replica.sqlite")
+    registry.install(primary, "primary")
+    registry.install(replica, "replica_0")
+    primary.connect().close()
+    primary.connect().close()
+    replica.connect().close()
+    snapshot = registry.snapshot()
+    assert (snapshot["primary"]["checkouts"], snapshot["replica_0"]["checkouts"]) == (2, 1)
+    assert snapshot["replica_0"]["checkout_wait_max_ms"] > 0
+
+
+def test_overflow_checkouts_count_connections_beyond_pool_size(tmp_path):
+    registry = PoolMetricsRegistry()
+    engine = _engine(tmp_path / "primary.sqlite", pool_size=2)
+    registry.install(engine, "primary")
+    first, second, third = engine.connect(), engine.connect(), engine.connect()
+    first.close()
+    second.close()
+    # overflow connection is still open, but this checkout does not exceed pool size
+    engine.connect().close()
+    third.close()
+    assert registry.snapshot()["primary"]["overflow_checkouts"] == 1
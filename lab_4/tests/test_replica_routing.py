@@ -0,0 +1,91 @@
+"""
+Routing of DAO calls between primary and replica, with two SQLite files standing in for them.
+"""
+
+import pytest
+
+import config
+from my_project.auth.dao.general_dao import GeneralDAO
+from my_project.auth.dao.orders.cars_dao import CarsDAO
+from my_project.auth.domain import Cars
+from my_project.routing_session import replica_router
+
+REPLICAS = ("replica_0", "replica_1")
+
+
+def _car(brand):
+    return Cars(id=1, car_owner="o", car_brand=brand, car_model="m", car_number="N1")
+
+
+@pytest.fixture
+def routed_app(tmp_path, monkeypatch):
+    """
+    Application with primary and two replicas; all hold car 1, with brand naming the database.
+    """
+    monkeypatch.setattr(config.Config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'primary.sqlite'}")
+    monkeypatch.setattr(config.Config, "SQLALCHEMY_REPLICA_URIS",
+                        [f"sqlite:///{tmp_path / f'replica_{number}.sqlite'}" for number in range(2)])
+    from my_project import create_app, db
+
+    app = create_app()
+    with app.app_context():
+        engines = {"primary": db.engine, **{key: db.engines[key] for key in REPLICAS}}
+        for brand, engine in engines.items():
+            if brand != "primary":
+                db.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(Cars.__table__.insert(), {**_car(brand).put_into_dto(), "version": 1})
+    yield app
+    replica_router.configure([])
+    GeneralDAO.drop_caches()
+
+
+def _brand(app):
+    with app.app_context():
+        return CarsDAO().find_by_id(1).car_brand
+
+
+def test_reads_go_to_replicas(routed_app):
+    assert {_brand(routed_app) for _ in range(4)} == set(REPLICAS)
+
+
+def test_reads_of_one_session_stay_on_one_replica(routed_app):
+    with routed_app.app_context():
+        dao = CarsDAO()
+        brands = set()
+        for _ in range(4):
+            brands.add(dao.find_by_id(1).car_brand)
+            dao._session.expunge_all()
+    assert len(brands) == 1 and brands <= set(REPLICAS)
+
+
+def test_writes_and_later_reads_of_writer_go_to_primary(routed_app):
+    from my_project import db
+
+    with routed_app.app_context():
+        dao = CarsDAO()
+        dao.create(Cars(car_owner="o", car_brand="new", car_model="m", car_number="N2"))
+        assert dao.find_by_id(1).car_brand == "primary"
+        for key in REPLICAS:
+            assert [row.car_brand for row in db.session.execute(Cars.__table__.select(), bind_arguments={
+                "bind": db.engines[key]})] == [key]
+    assert _brand(routed_app) in REPLICAS
+
+
+def test_ejected_replica_is_skipped(routed_app):
+    replica_router.eject("replica_0")
+    assert {_brand(routed_app) for _ in range(4)} == {"replica_1"}
+    replica_router.eject("replica_1")
+    assert replica_router.choose() is None
+    assert _brand(routed_app) == "primary"
+
+
+def test_failed_replica_is_ejected_and_read_is_repeated_on_primary(routed_app):
+    from my_project import db
+
+    replica_router.eject("replica_1")
+    with routed_app.app_context():
+        with db.engines["replica_0"].begin() as connection:
+            Cars.__table__.drop(connection)
+    assert _brand(routed_app) == "primary"
+    assert replica_router.choose() is None
@@ -0,0 +1,54 @@
+"""
+Overlap check of reservations of one parking place.
+"""
+
+from datetime import datetime
+
+
+def _reservation(place_id, start_hour, stop_hour, user_id=1, car_id=1):
+    return {
+        "user_id": user_id,
+        "car_id": car_id,
+        "parking_place_id": place_id,
+        "reservation_start": datetime(2024, 1, 1, start_hour).isoformat(),
+        "reservation_stop": datetime(2024, 1, 1, stop_hour).isoformat(),
+    }
+
+
+def test_overlapping_reservation_is_rejected(client, parking):
+    assert client.post("/reservations", json=_reservation(1, 10, 12)).status_code == 201
+    assert client.post("/reservations", json=_reservation(1, 11, 13, 2, 2)).status_code == 409
+    assert client.post("/reservations", json=_reservation(1, 9, 14, 2, 2)).status_code == 409
+
+
+def test_adjacent_and_other_place_reservations_are_accepted(client, parking):
+    assert client.post("/reservations", json=_reservation(1, 10, 12)).status_code == 201
+    assert client.post("/reservations", json=_reservation(1, 12, 13, 2, 2)).status_code == 201
+    assert client.post("/reservations", json=_reservation(1, 8, 10, 3, 3)).status_code == 201
+    assert client.post("/reservations", json=_reservation(2, 10, 12, 2, 2)).status_code == 201
+
+
+def test_empty_period_and_unknown_place_are_rejected(client, parking):
+    assert client.post("/reservations", json=_reservation(1, 12, 12)).status_code == 422
+    assert client.post("/reservations", json=_reservation(999, 10, 12)).status_code == 422
+
+
+def test_update_onto_booked_period_is_rejected(client, auth_headers, parking):
+    client.post("/reservations", json=_reservation(1, 10, 12))
+    moved = client.post("/reservations", json=_reservation(2, 10, 12, 2, 2)).get_json()
+    path = f"/reservations/{moved['id']}"
+    assert client.patch(path, json={"parking_place_id": 1}, headers=auth_headers).status_code == 409
+    assert client.put(path, json=_reservation(1, 11, 13, 2, 2), headers=auth_headers).status_code == 409
+    assert client.patch(path, json={"reservation_stop": datetime(2024, 1, 1, 9).isoformat()},
+                        headers=auth_headers).status_code == 422
+    assert client.get(path, headers=auth_headers).get_json()["parking_place_id"] == 2
+
+
+def test_update_within_own_or_free_period_succeeds(client, auth_headers, parking):
+    created = client.post("/reservations", json=_reservation(1, 10, 12)).get_json()
+    client.post("/reservations", json=_reservation(1, 14, 16, 2, 2))
+    path = f"/reservations/{created['id']}"
+    assert client.patch(path, json={"reservation_stop": datetime(2024, 1, 1, 13).isoformat()},
+                        headers=auth_headers).status_code == 200
+    assert client.put(path, json=_reservation(3, 10, 16), headers=auth_headers).status_code == 200
+    assert client.get(path, headers=auth_headers).get_json()["parking_place_id"] == 3